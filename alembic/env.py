@@ -15,7 +15,7 @@ env_path = os.path.join(os.path.dirname(__file__), "..", ".env")
 load_dotenv(env_path)
 
 from celine.dataset.core.config import get_settings
-from celine.dataset.api.catalogue.models import Base
+from celine.dataset.db.models.dataset_entry import Base
 
 
 config = context.config
@@ -3,7 +3,9 @@ from __future__ import annotations
 
 import datetime as dt
 import logging
-from typing import Any, Iterable, Optional
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Optional
+
+import orjson
 
 from celine.dataset.db.models.dataset_entry import DatasetEntry
 from celine.dataset.core.config import get_settings
@@ -12,6 +14,9 @@ from celine.dataset.core.owners import OwnersRegistry
 
 logger = logging.getLogger(__name__)
 
+# Flush threshold for stream_catalog output chunks
+_STREAM_CHUNK_SIZE = 64 * 1024
+
 DCAT_CONTEXT = {
     "@vocab": "http://www.w3.org/ns/dcat#",
     "dcat": "http://www.w3.org/ns/dcat#",
@@ -39,12 +44,31 @@ _ACCESS_RIGHTS_URI = {
 _DS_ACCESS_SCOPE = "ds:accessScope"
 _DS_CONSENT_STATUS = "ds:consentStatus"
 
+# Shared read-only fallback for nullable JSON columns
+_EMPTY: dict[str, Any] = {}
+
+# Constant node fragments with scalar values only, merged into a fresh dict
+# per node. Nested nodes are built per call so documents never share them.
+_DIST_TEMPLATE: dict[str, Any] = {
+    "@type": "dcat:Distribution",
+    "dcat:mediaType": "application/json",
+}
+_DATASET_TEMPLATE: dict[str, Any] = {"@type": "dcat:Dataset"}
+
 
 # --------------------------------------------------------
 # Helpers
 # --------------------------------------------------------
 
 
+def _eq_constraint(left_operand: str, right_operand: str) -> dict[str, Any]:
+    return {
+        "odrl:leftOperand": {"@id": left_operand},
+        "odrl:operator": {"@id": "odrl:eq"},
+        "odrl:rightOperand": right_operand,
+    }
+
+
 def _iso_date(value: Optional[str | dt.datetime]) -> Optional[str]:
     if value is None:
         return None
@@ -62,7 +86,7 @@ def _iso_date(value: Optional[str | dt.datetime]) -> Optional[str]:
 
 def _gov_facet(entry: DatasetEntry) -> dict[str, Any]:
     """Extract the governance facet from lineage JSON."""
-    return ((entry.lineage or {}).get("facets") or {}).get("governance") or {}
+    return ((entry.lineage or _EMPTY).get("facets") or _EMPTY).get("governance") or _EMPTY
 
 
 def _build_agent_node(
@@ -91,7 +115,11 @@ def _build_agent_node(
     return {"@id": uri}
 
 
-def _build_odrl_offer(entry_uri: str, entry: DatasetEntry) -> dict[str, Any]:
+def _build_odrl_offer(
+    entry_uri: str,
+    entry: DatasetEntry,
+    gov: Optional[dict[str, Any]] = None,
+) -> dict[str, Any]:
     """Build a minimal ODRL Offer derived from access_level + governance facet.
 
     - open:       no constraints
@@ -100,24 +128,17 @@ def _build_odrl_offer(entry_uri: str, entry: DatasetEntry) -> dict[str, Any]:
     consent_required also adds ds:consentStatus when set via governance facet.
     """
     level = entry.access_level or "internal"
-    gov = _gov_facet(entry)
+    if gov is None:
+        gov = _gov_facet(entry)
     consent_required = bool(
         gov.get("rowFilters") or gov.get("consentRequired")
     )
 
     constraints: list[dict[str, Any]] = []
     if level in ("internal", "restricted"):
-        constraints.append({
-            "odrl:leftOperand": {"@id": _DS_ACCESS_SCOPE},
-            "odrl:operator": {"@id": "odrl:eq"},
-            "odrl:rightOperand": "dataspaces.query",
-        })
+        constraints.append(_eq_constraint(_DS_ACCESS_SCOPE, "dataspaces.query"))
     if level == "restricted" or consent_required:
-        constraints.append({
-            "odrl:leftOperand": {"@id": _DS_CONSENT_STATUS},
-            "odrl:operator": {"@id": "odrl:eq"},
-            "odrl:rightOperand": "active",
-        })
+        constraints.append(_eq_constraint(_DS_CONSENT_STATUS, "active"))
 
     permission: dict[str, Any] = {
         "@type": "odrl:Permission",
@@ -138,25 +159,35 @@ def _build_dataset_node(
     query_service_id: str,
     api_base: str,
     owners: Optional[OwnersRegistry] = None,
+    *,
+    access_url: Optional[str] = None,
+    default_publisher: Optional[str] = None,
 ) -> dict[str, Any]:
-    """Convert a single DatasetEntry to a dcat:Dataset JSON-LD node."""
+    """Convert a single DatasetEntry to a dcat:Dataset JSON-LD node.
+
+    ``access_url`` and ``default_publisher`` may be precomputed by callers
+    that build many nodes in a row.
+    """
     entry_uri = get_dataset_uri(entry.dataset_id)
-    backend = entry.backend_config or {}
-    tags = entry.tags or {}
-    ns = (entry.lineage or {}).get("namespace")
-    gov = _gov_facet(entry)
+    backend = entry.backend_config or _EMPTY
+    tags = entry.tags or _EMPTY
+    lineage = entry.lineage or _EMPTY
+    ns = lineage.get("namespace")
+    gov = (lineage.get("facets") or _EMPTY).get("governance") or _EMPTY
     level = entry.access_level or "internal"
+    title = entry.title or entry.dataset_id
+    if access_url is None:
+        access_url = f"{api_base}/query"
 
     # ── Distribution node ──────────────────────────────────────────────────
     dist: dict[str, Any] = {
         "@id": f"{entry_uri}#distribution",
-        "@type": "dcat:Distribution",
-        "dct:title": entry.title or entry.dataset_id,
+        **_DIST_TEMPLATE,
+        "dct:title": title,
         "dct:identifier": entry.dataset_id,
-        "dcat:mediaType": "application/json",
-        "dcat:accessURL": {"@id": f"{api_base}/query"},
+        "dcat:accessURL": {"@id": access_url},
         "dcat:accessService": {"@id": query_service_id},
-        "odrl:hasPolicy": _build_odrl_offer(entry_uri, entry),
+        "odrl:hasPolicy": _build_odrl_offer(entry_uri, entry, gov),
     }
 
     ar_uri = _ACCESS_RIGHTS_URI.get(level)
@@ -179,8 +210,8 @@ def _build_dataset_node(
     # ── Dataset node ───────────────────────────────────────────────────────
     dataset: dict[str, Any] = {
         "@id": entry_uri,
-        "@type": "dcat:Dataset",
-        "dct:title": entry.title or entry.dataset_id,
+        **_DATASET_TEMPLATE,
+        "dct:title": title,
         "dct:identifier": entry.dataset_id,
         "dcat:distribution": [dist],
     }
@@ -189,7 +220,9 @@ def _build_dataset_node(
         dataset["dct:description"] = entry.description
     if ns:
         dataset["dct:isPartOf"] = {"@id": get_dataset_uri(ns)}
-    publisher = entry.publisher_uri or str(get_settings().catalog_uri)
+    publisher = (
+        entry.publisher_uri or default_publisher or get_settings().catalog_uri
+    )
     dataset["dct:publisher"] = _build_agent_node(publisher, owners)
     if entry.landing_page:
         dataset["dcat:landingPage"] = {"@id": entry.landing_page}
@@ -223,7 +256,7 @@ def _build_dataset_node(
 
     # Medallion from governance facet or dataset name inference
     medallion = gov.get("medallion") or _infer_medallion(
-        (entry.lineage or {}).get("name") or entry.dataset_id
+        lineage.get("name") or entry.dataset_id
     )
     if medallion:
         dataset["ds:medallion"] = medallion
@@ -238,6 +271,28 @@ def _infer_medallion(name: str) -> Optional[str]:
     return None
 
 
+def _catalog_header(catalog_uri: str, title: str) -> dict[str, Any]:
+    return {
+        "@context": DCAT_CONTEXT,
+        "@id": catalog_uri,
+        "@type": "dcat:Catalog",
+        "dct:title": title,
+        "dct:issued": dt.date.today().isoformat(),
+    }
+
+
+def _data_service(
+    query_service_id: str, access_url: str, title: str, served: list[dict[str, Any]]
+) -> dict[str, Any]:
+    return {
+        "@id": query_service_id,
+        "@type": "dcat:DataService",
+        "dct:title": f"{title} Query Service",
+        "dcat:endpointURL": {"@id": access_url},
+        "dcat:servesDataset": served,
+    }
+
+
 def build_catalog(
     entries: Iterable[DatasetEntry],
     owners: Optional[OwnersRegistry] = None,
@@ -249,35 +304,88 @@ def build_catalog(
     BC-3: dct:accessRights uses EU authority URIs, not raw strings.
     BC-4: dcat:downloadURL only appears on open-access datasets.
     """
-    catalog_uri = str(get_settings().catalog_uri)
-    api_base = str(get_settings().api_base_url).rstrip("/")
+    settings = get_settings()
+    catalog_uri = settings.catalog_uri
+    api_base = settings.api_base_url.rstrip("/")
     query_service_id = f"{catalog_uri}/service"
+    access_url = f"{api_base}/query"
 
-    data_service: dict[str, Any] = {
-        "@id": query_service_id,
-        "@type": "dcat:DataService",
-        "dct:title": f"{get_settings().app_name} Query Service",
-        "dcat:endpointURL": {"@id": f"{api_base}/query"},
-        "dcat:servesDataset": [],
-    }
+    served: list[dict[str, Any]] = []
+    data_service = _data_service(
+        query_service_id, access_url, settings.app_name, served
+    )
 
+    # Single pass over entries: build each node and its service reference
     dataset_nodes = []
-    for e in list(entries):
+    for e in entries:
         if e.access_level == "secret":
             continue
-        node = _build_dataset_node(e, query_service_id, api_base, owners=owners)
-        data_service["dcat:servesDataset"].append({"@id": node["@id"]})
+        node = _build_dataset_node(
+            e,
+            query_service_id,
+            api_base,
+            owners=owners,
+            access_url=access_url,
+            default_publisher=catalog_uri,
+        )
+        served.append({"@id": node["@id"]})
         dataset_nodes.append(node)
 
-    return {
-        "@context": DCAT_CONTEXT,
-        "@id": catalog_uri,
-        "@type": "dcat:Catalog",
-        "dct:title": get_settings().app_name,
-        "dct:issued": dt.date.today().isoformat(),
-        "dcat:service": [data_service],
-        "dcat:dataset": dataset_nodes,
-    }
+    catalog = _catalog_header(catalog_uri, settings.app_name)
+    catalog["dcat:service"] = [data_service]
+    catalog["dcat:dataset"] = dataset_nodes
+    return catalog
+
+
+async def stream_catalog(
+    entries: AsyncIterable[DatasetEntry],
+    owners: Optional[OwnersRegistry] = None,
+    *,
+    chunk_size: int = _STREAM_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """Serialize the build_catalog document incrementally as JSON bytes.
+
+    Dataset nodes are encoded as entries arrive, so only the service's
+    dataset references are held until the end. dcat:service is emitted
+    after dcat:dataset; the document is otherwise identical.
+    """
+    settings = get_settings()
+    catalog_uri = settings.catalog_uri
+    api_base = settings.api_base_url.rstrip("/")
+    query_service_id = f"{catalog_uri}/service"
+    access_url = f"{api_base}/query"
+
+    header = orjson.dumps(_catalog_header(catalog_uri, settings.app_name))
+    buf = bytearray(header[:-1])
+    buf += b',"dcat:dataset":['
+
+    served: list[dict[str, Any]] = []
+    async for e in entries:
+        if e.access_level == "secret":
+            continue
+        node = _build_dataset_node(
+            e,
+            query_service_id,
+            api_base,
+            owners=owners,
+            access_url=access_url,
+            default_publisher=catalog_uri,
+        )
+        if served:
+            buf += b","
+        buf += orjson.dumps(node)
+        served.append({"@id": node["@id"]})
+        if len(buf) >= chunk_size:
+            yield bytes(buf)
+            buf.clear()
+
+    data_service = _data_service(
+        query_service_id, access_url, settings.app_name, served
+    )
+    buf += b'],"dcat:service":'
+    buf += orjson.dumps([data_service])
+    buf += b"}"
+    yield bytes(buf)
 
 
 def build_dataset(
@@ -285,8 +393,9 @@ def build_dataset(
     owners: Optional[OwnersRegistry] = None,
 ) -> dict[str, Any]:
     """Build a single dcat:Dataset JSON-LD document for GET /catalogue/{id}."""
-    api_base = str(get_settings().api_base_url).rstrip("/")
-    catalog_uri = str(get_settings().catalog_uri)
+    settings = get_settings()
+    api_base = settings.api_base_url.rstrip("/")
+    catalog_uri = settings.catalog_uri
     query_service_id = f"{catalog_uri}/service"
 
     node = _build_dataset_node(entry, query_service_id, api_base, owners=owners)
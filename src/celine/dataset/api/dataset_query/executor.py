@@ -1,36 +1,35 @@
 # src/celine/dataset/api/dataset_query/executor.py
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 
 import httpx
-import sqlglot
-from typing import Optional, Dict, Sequence, List
-from fastapi import HTTPException, Request
-from sqlalchemy import RowMapping, Table, text, select, func
+from typing import Any, Optional, Mapping, Sequence
+from fastapi import HTTPException
+from sqlalchemy import RowMapping, text, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import DBAPIError
 
 from sqlglot import exp as sqlglot_exp
 
-from celine.dataset.schemas.dataset_query import DatasetQueryResult
 from celine.dataset.db.models.dataset_entry import DatasetEntry
-from celine.dataset.db.reflection import reflect_table_async
-from celine.dataset.core.datasets import load_dataset_entry
+from celine.dataset.schemas.dataset_query import DatasetQueryResult
 from celine.dataset.security.governance import (
-    enforce_dataset_access,
+    enforce_many,
     resolve_datasets_for_tables,
 )
 from celine.dataset.security.edr import EDRRequestContext, edr_pep_check
 from celine.dataset.security.models import AuthenticatedUser
-from celine.dataset.api.dataset_query.parser import parse_sql_query
+from celine.dataset.api.dataset_query.parser import ParsedSQL, parse_sql_query
 from celine.dataset.api.dataset_query.row_filters import (
     apply_row_filter_plans,
     get_row_filter_registry,
     get_row_filter_specs,
 )
 from celine.dataset.api.dataset_query.row_filters.models import RowFilterPlan
+from celine.dataset.api.dataset_query.row_filters.registry import RowFilterRegistry
 from celine.dataset.api.dataset_query.row_filters.utils import is_admin_user
 from celine.dataset.core.config import get_settings
 
@@ -42,7 +41,7 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_LIMIT = 100
 MAX_LIMIT = 10_000
-STATEMENT_TIMEOUT_MS = get_settings().query_statement_timeout_ms
+ROW_FILTER_CONCURRENCY = 8
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -64,15 +63,17 @@ async def _execute_sql_with_timeout(
     db,
     sql: str,
     params: dict | None = None,
-    timeout: int = STATEMENT_TIMEOUT_MS,
+    timeout: int | None = None,
 ):
+    if timeout is None:
+        timeout = get_settings().query_statement_timeout_ms
     try:
         await db.execute(text(f"SET LOCAL statement_timeout = {timeout}"))
 
         return await db.execute(text(sql), params or {})
 
     except DBAPIError as exc:
-        logger.debug(f"Query failed sql={sql} exception={exc}")
+        logger.debug("Query failed sql=%s exception=%s", sql, exc)
         if "statement timeout" in str(exc).lower():
             raise HTTPException(400, "Query exceeded time limit") from None
         raise HTTPException(400, "Database query failed") from None
@@ -96,9 +97,87 @@ async def execute_scalar_with_timeout(
     return int(result.scalar_one())
 
 
-async def execute_query(
+async def _resolve_row_filter(
+    registry: RowFilterRegistry,
+    *,
+    ref_table: str,
+    table: str,
+    user: AuthenticatedUser,
+    spec: Mapping[str, Any],
+) -> RowFilterPlan:
+    """Resolve one validated spec, mapping handler failures to HTTP errors."""
+    handler_name = spec["handler"]
+    try:
+        return await registry.resolve_with_cache(
+            handler_name=handler_name,
+            table=table,
+            user=user,
+            args=spec.get("args") or {},
+            request_context={},
+            args_hash=spec.get("_args_hash"),
+        )
+    except KeyError:
+        logger.error(
+            f"Unknown row filter handler '{handler_name}' for dataset {ref_table}"
+        )
+        raise HTTPException(
+            500,
+            f"Unknown row filter handler '{handler_name}' for dataset {ref_table}",
+        )
+    except httpx.HTTPError:
+        logger.error(f"Row filter resolution failed for dataset {ref_table}")
+        raise HTTPException(
+            403,
+            f"Row filter resolution failed for dataset {ref_table}",
+        )
+    except Exception as e:
+        logger.error(f"Row filter handler failed: {e}")
+        raise HTTPException(
+            500,
+            f"Row filter handler '{handler_name}' failed for dataset {ref_table}",
+        )
+
+
+def _parse_query(raw_sql: Optional[str]) -> ParsedSQL:
+    if raw_sql is None or raw_sql.strip() == "":
+        raise HTTPException(400, "sql query not provided")
+
+    logger.debug("Parsing raw SQL: %s", raw_sql)
+    try:
+        parsed = parse_sql_query(raw_sql)
+    except HTTPException:
+        raise
+    except Exception as exc:
+        logger.exception("SQL validation failed")
+        raise HTTPException(400, str(exc)) from exc
+
+    if not parsed.tables:
+        raise HTTPException(400, "Query references no datasets")
+
+    return parsed
+
+
+async def resolve_query_datasets(
     *,
     catalogue_db: AsyncSession,
+    raw_sql: Optional[str],
+) -> dict[str, DatasetEntry]:
+    """
+    Validate a query and resolve the datasets it references.
+
+    Callers should release ``catalogue_db`` once this returns: the entries
+    have no lazy relationships and stay usable detached, so execute_query
+    never needs the catalogue connection.
+    """
+    parsed = _parse_query(raw_sql)
+    return await resolve_datasets_for_tables(
+        db=catalogue_db, table_names=parsed.tables
+    )
+
+
+async def execute_query(
+    *,
+    datasets: Mapping[str, DatasetEntry],
     datasets_db: AsyncSession,
     raw_sql: Optional[str],
     limit: int,
@@ -110,6 +189,9 @@ async def execute_query(
     """
     Execute a validated SQL query against a dataset.
 
+    ``datasets`` maps the query's table references to their catalogue
+    entries, as returned by resolve_query_datasets.
+
     Guarantees:
     - dataset access enforced (OPA / disclosure)
     - SQL validated (SELECT-only, table allowlist)
@@ -117,27 +199,23 @@ async def execute_query(
     - hard row cap applied
     - row-level filters applied (pluggable governance handlers)
     """
-    if raw_sql is None or raw_sql.strip() == "":
-        raise HTTPException(400, "sql query not provided")
-
-    logger.debug(f"Parsing raw SQL: {raw_sql}")
-    try:
-        parsed = parse_sql_query(raw_sql)
-    except HTTPException:
-        raise
-    except Exception as exc:
-        logger.exception("SQL validation failed")
-        raise HTTPException(400, str(exc)) from exc
-
-    if not parsed.tables:
-        raise HTTPException(400, "Query references no datasets")
-
-    datasets = await resolve_datasets_for_tables(
-        db=catalogue_db, table_names=parsed.tables
-    )
+    parsed = _parse_query(raw_sql)
+
+    # Policy checks for the normal path are independent per dataset: run
+    # them together up front instead of one at a time inside the loop
+    if edr_context is None:
+        await enforce_many(
+            (
+                ds
+                for ds in datasets.values()
+                if ds.expose and (ds.backend_config or {}).get("table") is not None
+            ),
+            user,
+        )
 
     tables_map: dict[str, str] = {}
-    row_filter_plans = []
+    row_filter_plans: list[RowFilterPlan] = []
+    pending_specs: list[tuple[str, str, Mapping[str, Any]]] = []
 
     registry = get_row_filter_registry()
 
@@ -157,7 +235,7 @@ async def execute_query(
             )
             continue
 
-        logger.debug(f"Mapped SQL table {ref_table} -> {phy_table_name}")
+        logger.debug("Mapped SQL table %s -> %s", ref_table, phy_table_name)
         tables_map[ref_table] = phy_table_name
 
         # ------------------------------------------------------------------
@@ -207,9 +285,8 @@ async def execute_query(
 
         # ------------------------------------------------------------------
         # Normal path — Keycloak / OPA authenticated request
+        # (access already enforced above via enforce_many)
         # ------------------------------------------------------------------
-        await enforce_dataset_access(entry=ds, user=user)
-
         specs = get_row_filter_specs(ds)
         if not specs:
             continue
@@ -236,52 +313,38 @@ async def execute_query(
                     500,
                     f"Invalid row filter spec for dataset {ref_table}: args must be object",
                 )
+            pending_specs.append((ref_table, phy_table_name, spec))
 
-            try:
-                plan = await registry.resolve_with_cache(
-                    handler_name=handler_name,
-                    table=phy_table_name,
-                    user=user,
-                    args=args,
-                    request_context={},
-                )
-            except KeyError:
-                logger.error(
-                    f"Unknown row filter handler '{handler_name}' for dataset {ref_table}"
-                )
-                raise HTTPException(
-                    500,
-                    f"Unknown row filter handler '{handler_name}' for dataset {ref_table}",
-                )
-            except httpx.HTTPError:
-                logger.error(f"Row filter resolution failed for dataset {ref_table}")
-                raise HTTPException(
-                    403,
-                    f"Row filter resolution failed for dataset {ref_table}",
-                )
-            except Exception as e:
-                logger.error(f"Row filter handler failed: {e}")
-                raise HTTPException(
-                    500,
-                    f"Row filter handler '{handler_name}' failed for dataset {ref_table}",
+    # Handlers are independent (mostly upstream HTTP calls): resolve them
+    # concurrently, bounded so one query cannot flood upstream services
+    if pending_specs:
+        semaphore = asyncio.Semaphore(ROW_FILTER_CONCURRENCY)
+
+        async def _bounded(ref_table: str, table: str, spec) -> RowFilterPlan:
+            async with semaphore:
+                return await _resolve_row_filter(
+                    registry, ref_table=ref_table, table=table, user=user, spec=spec
                 )
 
-            row_filter_plans.append(plan)
+        row_filter_plans.extend(
+            await asyncio.gather(*(_bounded(*p) for p in pending_specs))
+        )
 
     # Logical -> physical substitution
-    complete_sql = parsed.to_sql(tables_map=tables_map)
-    logger.debug(f"Complete SQL (after table mapping): {complete_sql}")
-
-    # Apply row-level filters
-    if row_filter_plans:
+    if not row_filter_plans:
+        complete_sql = parsed.to_sql(tables_map=tables_map)
+        logger.debug("Complete SQL (after table mapping): %s", complete_sql)
+    else:
+        # Rewrite the mapped AST copy directly instead of rendering and
+        # re-parsing it
         try:
-            ast = sqlglot.parse_one(complete_sql)
-            ast = apply_row_filter_plans(ast, row_filter_plans)
-            complete_sql = ast.sql()
+            ast = parsed.to_ast(tables_map)
+            ast = apply_row_filter_plans(ast, row_filter_plans, copy=False)
+            complete_sql = ast.sql(dialect="postgres")
         except Exception:
             logger.exception("Failed to apply row filters")
             raise HTTPException(500, "Failed to apply row filters") from None
-        logger.debug(f"Complete SQL (after row filters): {complete_sql}")
+        logger.debug("Complete SQL (after row filters): %s", complete_sql)
 
     # Pagination & caps
     limit = _clamp_limit(limit)
@@ -340,7 +403,9 @@ async def execute_query(
                     row[col] = json.loads(geojson)
         items.append(row)
 
-    logger.debug(f"SQL items={len(items)} total={total} offset={offset} limit={limit}")
+    logger.debug(
+        "SQL items=%d total=%s offset=%s limit=%s", len(items), total, offset, limit
+    )
 
     return DatasetQueryResult(
         items=items,
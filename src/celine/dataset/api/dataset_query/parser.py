@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import logging
 import re
 from typing import Dict, Optional, Set
@@ -197,9 +198,17 @@ class ParsedSQL:
         """
         if not tables_map:
             return self.ast.sql(dialect="postgres")
+        return self.to_ast(tables_map).sql(dialect="postgres")
 
+    def to_ast(self, tables_map: Optional[Dict[str, str]] = None) -> exp.Expression:
+        """
+        Return a private copy of the AST with logical table names mapped to
+        physical ones, ready for further in-place rewriting.
+        """
         # Work on a copy to keep ParsedSQL immutable
         ast = self.ast.copy()
+        if not tables_map:
+            return ast
 
         for table in ast.find_all(exp.Table):
             logical = _table_identifier(table)
@@ -212,7 +221,7 @@ class ParsedSQL:
 
             physical = tables_map[logical]
 
-            logger.debug(f"Mapping table {logical} -> {physical}")
+            logger.debug("Mapping table %s -> %s", logical, physical)
 
             table.set(
                 "this",
@@ -221,7 +230,7 @@ class ParsedSQL:
             table.set("db", None)
             table.set("catalog", None)
 
-        return ast.sql(dialect="postgres")
+        return ast
 
 
 # -----------------------------------------------------------------------------
@@ -261,7 +270,7 @@ def _parse_sql_query_impl(sql: str) -> ParsedSQL:
         logger.error(f"SQL parse error: {exc}")
         raise _bad_request(f"Invalid SQL syntax: {exc}") from exc
 
-    select = ast.find(exp.Select)
+    select = ast if isinstance(ast, exp.Select) else ast.find(exp.Select)
     if not select or not select.expressions:
         raise _bad_request("Query must have at least a SELECT")
 
@@ -322,10 +331,20 @@ def _parse_sql_query_impl(sql: str) -> ParsedSQL:
 # -----------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_sql_query_cached(sql: str) -> ParsedSQL:
+    """Validated parse per distinct SQL text; failures are not cached.
+
+    The returned ParsedSQL is shared: its AST must not be modified in place
+    (use ParsedSQL.to_ast for a private copy).
+    """
+    return _parse_sql_query_impl(sql)
+
+
 def parse_sql_query(sql: str) -> ParsedSQL:
     try:
         # all validation + parsing happens inside
-        return _parse_sql_query_impl(sql)
+        return _parse_sql_query_cached(sql)
 
     except HTTPException:
         # already normalized → rethrow
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 import logging
+from collections import deque
+from dataclasses import replace
 from typing import Iterable
 
-import sqlglot
 from sqlglot import exp
 
 from celine.dataset.api.dataset_query.row_filters.models import RowFilterPlan
 
 logger = logging.getLogger(__name__)
 
+# Deny predicate; copied on use since AST nodes carry parent links
+_FALSE = exp.Boolean(this=False)
+
 
 def _table_name(table: exp.Table) -> str:
     # table.this is Identifier; may contain dots if set that way
@@ -38,31 +42,133 @@ def _add_where(select: exp.Select, condition: exp.Expression) -> None:
 
 
 def _tables_in_select(select: exp.Select) -> list[exp.Table]:
+    """Tables owned directly by `select` (nested SELECTs are not entered)."""
     tables: list[exp.Table] = []
-    for t in select.find_all(exp.Table):
-        anc = t.find_ancestor(exp.Select)
-        if anc is select:
-            tables.append(t)
+    queue: deque[exp.Expression] = deque(select.iter_expressions())
+    while queue:
+        node = queue.popleft()
+        if isinstance(node, exp.Select):
+            continue
+        if isinstance(node, exp.Table):
+            tables.append(node)
+        queue.extend(node.iter_expressions())
     return tables
 
 
-def apply_row_filter_plans(ast: exp.Expression, plans: Iterable[RowFilterPlan]) -> exp.Expression:
-    """Apply row filter plans to an AST (returns a modified copy)."""
+def _literal_in(plan: RowFilterPlan) -> exp.In | None:
+    """The plan's predicate if it is `column IN (literal, ...)`, else None."""
+    pred = plan.predicate_template
+    if plan.kind != "predicate" or not isinstance(pred, exp.In):
+        return None
+    if pred.args.get("query") is not None or pred.args.get("unnest") is not None:
+        return None
+    col = pred.this
+    if not isinstance(col, exp.Column) or col.args.get("table") is not None:
+        return None
+    if not pred.expressions or not all(
+        isinstance(v, exp.Literal) for v in pred.expressions
+    ):
+        return None
+    return pred
+
+
+def _in_list_key(plan: RowFilterPlan) -> tuple[str, bool] | None:
+    """(column, is_string) for a literal IN list of a single kind, else None."""
+    pred = _literal_in(plan)
+    if pred is None:
+        return None
+    kinds = {v.is_string for v in pred.expressions}
+    if len(kinds) != 1:
+        return None
+    return pred.this.name, kinds.pop()
+
+
+def _merge_in_lists(plans: list[RowFilterPlan]) -> list[RowFilterPlan]:
+    """Intersect literal IN lists that target the same column.
+
+    Plans on a table are ANDed, so `c IN (a, b) AND c IN (b, c)` is
+    `c IN (b)`; an empty intersection becomes FALSE. Lists are only merged
+    with lists of the same literal kind: `c IN ('42')` and `c IN (42)` can
+    match the same rows once the database casts them, so they stay ANDed.
+    Subquery INs and any other predicates are kept as they are.
+    """
+    groups: dict[tuple[str, bool], list[exp.In]] = {}
+    for p in plans:
+        key = _in_list_key(p)
+        if key is not None:
+            groups.setdefault(key, []).append(p.predicate_template)
+    if all(len(g) < 2 for g in groups.values()):
+        return plans
+
+    out: list[RowFilterPlan] = []
+    for p in plans:
+        key = _in_list_key(p)
+        group = groups.get(key) if key is not None else None
+        pred = p.predicate_template
+        if group is None or len(group) < 2:
+            out.append(p)
+            continue
+        if pred is not group[0]:
+            # folded into the first plan of its group
+            continue
+        keep = {v.sql() for v in pred.expressions}
+        for other in group[1:]:
+            keep &= {v.sql() for v in other.expressions}
+        values = [v.copy() for v in pred.expressions if v.sql() in keep]
+        merged: exp.Expression = (
+            exp.In(this=pred.this.copy(), expressions=values)
+            if values
+            else _FALSE.copy()
+        )
+        out.append(
+            replace(
+                p,
+                predicate_template=merged,
+                meta={"merged": len(group), "items": len(values)},
+            )
+        )
+    return out
+
+
+def _apply_deny(ast: exp.Expression, *, copy: bool) -> exp.Expression:
+    """Inject a FALSE predicate at the top-level SELECT."""
+    out = ast.copy() if copy else ast
+    # The root is normally the SELECT itself: skip the tree search then
+    top = out if isinstance(out, exp.Select) else out.find(exp.Select)
+    if top is not None:
+        _add_where(top, _FALSE.copy())
+    return out
+
+
+def apply_row_filter_plans(
+    ast: exp.Expression,
+    plans: Iterable[RowFilterPlan],
+    *,
+    copy: bool = True,
+) -> exp.Expression:
+    """Apply row filter plans to an AST.
+
+    Returns a modified copy, or modifies `ast` in place when copy=False
+    (for callers that own a freshly parsed tree).
+    """
     plans_by_table: dict[str, list[RowFilterPlan]] = {}
     for p in plans:
+        # Any deny plan wins: stop before bucketing or walking the tree
+        if p.kind == "deny":
+            return _apply_deny(ast, copy=copy)
         plans_by_table.setdefault(p.table, []).append(p)
 
-    out = ast.copy()
+    for table_name, table_plans in plans_by_table.items():
+        if len(table_plans) > 1:
+            plans_by_table[table_name] = _merge_in_lists(table_plans)
+
+    out = ast.copy() if copy else ast
 
-    # If any plan is deny -> inject FALSE predicate at top-level
-    for ps in plans_by_table.values():
-        for p in ps:
-            if p.kind == "deny":
-                top = out.find(exp.Select)
-                if top is None:
-                    return out
-                _add_where(top, exp.Boolean(this=False))
-                return out
+    # Qualified predicates per (template, alias) for this call: a template
+    # that applies to several occurrences of the same alias is copied and
+    # walked once, later occurrences copy the qualified result. Keyed on
+    # id(): the templates stay referenced by plans_by_table for the call.
+    qualified: dict[tuple[int, str], exp.Expression] = {}
 
     for select in out.find_all(exp.Select):
         tables = _tables_in_select(select)
@@ -75,7 +181,13 @@ def apply_row_filter_plans(ast: exp.Expression, plans: Iterable[RowFilterPlan])
             for plan in plans_by_table[name]:
                 if plan.kind != "predicate" or plan.predicate_template is None:
                     continue
-                cond = _qualify_columns(plan.predicate_template, alias)
+                key = (id(plan.predicate_template), alias)
+                cond = qualified.get(key)
+                if cond is None:
+                    cond = _qualify_columns(plan.predicate_template, alias)
+                    qualified[key] = cond
+                else:
+                    cond = cond.copy()
                 _add_where(select, cond)
 
     return out
@@ -32,13 +32,21 @@ class TTLCache(Generic[T]):
     def set(self, key: str, value: T, ttl_seconds: int) -> None:
         if ttl_seconds <= 0:
             return
+        # Keep insertion order equal to (re)write order so the front of the
+        # dict holds the entries that expire first
+        self._store.pop(key, None)
         if len(self._store) >= self._maxsize:
-            # naive eviction: drop expired, otherwise drop arbitrary oldest-like key
+            # drop expired entries from the front, then the oldest if still full
             now = time.time()
-            for k in list(self._store.keys()):
-                if self._store[k].expires_at <= now:
-                    self._store.pop(k, None)
+            while self._store:
+                k = next(iter(self._store))
+                if self._store[k].expires_at > now:
+                    break
+                del self._store[k]
             if len(self._store) >= self._maxsize:
-                self._store.pop(next(iter(self._store.keys())), None)
+                self._store.pop(next(iter(self._store)), None)
 
         self._store[key] = _CacheEntry(value=value, expires_at=time.time() + ttl_seconds)
+
+    def clear(self) -> None:
+        self._store.clear()
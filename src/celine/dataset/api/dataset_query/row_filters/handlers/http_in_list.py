@@ -1,44 +1,274 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
-from typing import Any, Iterable, List, Optional
+import string
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, AsyncIterator, Callable, Iterable, List, Optional
 
 import httpx
+import ijson
+import orjson
 from sqlglot import exp
 
+from celine.dataset.api.dataset_query.row_filters.cache import TTLCache
 from celine.dataset.api.dataset_query.row_filters.models import RowFilterPlan
+from celine.dataset.api.dataset_query.row_filters.utils import column_node, literal_nodes
 from celine.dataset.security.models import AuthenticatedUser
 
 logger = logging.getLogger(__name__)
 
+# Shared connection pool for upstream calls; timeouts are set per request
+_CLIENT: Optional[httpx.AsyncClient] = None
+_CLIENT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
 
-def _format_obj(obj: Any, user: AuthenticatedUser) -> Any:
+
+def get_client() -> httpx.AsyncClient:
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(limits=_CLIENT_LIMITS)
+    return _CLIENT
+
+
+async def close_client() -> None:
+    """Close the shared client (called on application shutdown)."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
+
+@dataclass(frozen=True)
+class _Validated:
+    """HTTP validators of the last 200 response and the plan built from it."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    plan: RowFilterPlan
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["if-none-match"] = self.etag
+        if self.last_modified:
+            headers["if-modified-since"] = self.last_modified
+        return headers
+
+
+# Validators outlive the registry's plan cache: a 304 lets an expired plan be
+# reused without transferring or parsing the list again
+_VALIDATOR_TTL_SECONDS = 3600
+_validators: TTLCache[_Validated] = TTLCache(maxsize=10_000)
+
+
+def _validator_key(
+    table: str,
+    sub: str,
+    args: dict[str, Any],
+    *,
+    headers: Any,
+    params: Any,
+    json_body: Any,
+) -> str:
+    doc = json.dumps(
+        [table, sub, args, headers, params, json_body],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.blake2b(doc.encode("utf-8"), digest_size=16).hexdigest()
+
+
+# Alias of the VALUES list used for long IN lists; its column is qualified
+# so apply_row_filter_plans never rebinds it to the filtered table
+_VALUES_ALIAS = "_in_values"
+_VALUES_COLUMN = "v"
+
+
+_FORMAT_FIELDS = frozenset({"sub", "username", "email", "token"})
+
+# template string -> compiled formatter; flushed wholesale when too large
+_FMT_CACHE: dict[str, Callable[[dict[str, str]], str]] = {}
+_FMT_CACHE_MAX = 2048
+
+
+def _compile_template(template: str) -> Callable[[dict[str, str]], str]:
+    """Compile `template` once into a formatter over the user values.
+
+    Plain `{field}` references are resolved by direct lookup; anything else
+    (format specs, conversions, unknown fields, malformed braces) falls back
+    to str.format so behaviour and errors stay identical.
+    """
+    if "{" not in template and "}" not in template:
+        return lambda values: template
+
+    def fallback(values: dict[str, str]) -> str:
+        return template.format(**values)
+
+    try:
+        parsed = list(string.Formatter().parse(template))
+    except ValueError:
+        return fallback
+
+    parts: list[tuple[str, bool]] = []
+    for literal, field, spec, conversion in parsed:
+        if literal:
+            parts.append((literal, False))
+        if field is None:
+            continue
+        if spec or conversion or field not in _FORMAT_FIELDS:
+            return fallback
+        parts.append((field, True))
+
+    def render(values: dict[str, str]) -> str:
+        return "".join(values[p] if is_field else p for p, is_field in parts)
+
+    return render
+
+
+def _template(template: str) -> Callable[[dict[str, str]], str]:
+    fmt = _FMT_CACHE.get(template)
+    if fmt is None:
+        if len(_FMT_CACHE) >= _FMT_CACHE_MAX:
+            _FMT_CACHE.clear()
+        fmt = _FMT_CACHE[template] = _compile_template(template)
+    return fmt
+
+
+def _format_values(obj: Any, values: dict[str, str]) -> Any:
     if isinstance(obj, str):
-        return obj.format(
-            sub=user.sub,
-            username=(user.username or ""),
-            email=(user.email or ""),
-            token=(user.token or ""),
-        )
+        return _template(obj)(values)
     if isinstance(obj, dict):
-        return {k: _format_obj(v, user) for k, v in obj.items()}
+        return {k: _format_values(v, values) for k, v in obj.items()}
     if isinstance(obj, list):
-        return [_format_obj(v, user) for v in obj]
+        return [_format_values(v, values) for v in obj]
     return obj
 
 
-def _extract_path(payload: Any, path: str | None) -> Any:
+def _format_obj(obj: Any, user: AuthenticatedUser) -> Any:
+    return _format_values(
+        obj,
+        {
+            "sub": user.sub,
+            "username": user.username or "",
+            "email": user.email or "",
+            "token": user.token or "",
+        },
+    )
+
+
+# response_path -> split keys; flushed wholesale when it grows too large
+_PATH_CACHE: dict[str, tuple[str, ...]] = {}
+_PATH_CACHE_MAX = 2048
+
+
+def _path_parts(path: str) -> tuple[str, ...]:
+    parts = _PATH_CACHE.get(path)
+    if parts is None:
+        if len(_PATH_CACHE) >= _PATH_CACHE_MAX:
+            _PATH_CACHE.clear()
+        parts = _PATH_CACHE[path] = tuple(path.split("."))
+    return parts
+
+
+def _extract_path(
+    payload: Any, path: str | None, _isinstance=isinstance, _dict=dict
+) -> Any:
     if path is None or path == "" or path == "$":
         return payload
     cur = payload
-    for part in path.split("."):
-        if isinstance(cur, dict) and part in cur:
-            cur = cur[part]
-        else:
+    for part in _path_parts(path):
+        if not _isinstance(cur, _dict):
+            return None
+        cur = cur.get(part)
+        if cur is None:
             return None
     return cur
 
 
+# Bodies at least this large (or of unknown length) are parsed incrementally
+_STREAM_MIN_BYTES = 16 * 1024
+
+
+def _ijson_prefix(path: str | None) -> str:
+    """ijson prefix of the elements of the list at dot `path` ("$" = root)."""
+    if path is None or path == "" or path == "$":
+        return "item"
+    return f"{path}.item"
+
+
+class _ByteStreamReader:
+    """Async file-like view over an httpx byte stream, as ijson expects."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        self._chunks = chunks
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) and accepts chunks of any size after
+        # that; b"" signals end of stream
+        if size == 0:
+            return b""
+        return await anext(self._chunks, b"")
+
+
+async def _stream_items(
+    resp: httpx.Response, path: str | None, max_items: int
+) -> list[Any]:
+    """Collect up to `max_items` non-null elements of the list at `path`.
+
+    Only the addressed list is materialised, and reading stops once the cap
+    is reached.
+    """
+    items: list[Any] = []
+    reader = _ByteStreamReader(resp.aiter_bytes())
+    async for item in ijson.items(reader, _ijson_prefix(path), use_float=True):
+        if item is None:
+            continue
+        items.append(item)
+        if len(items) >= max_items:
+            break
+    return items
+
+
+def _decode_json(resp: httpx.Response) -> Any:
+    """Decode a read JSON body, using orjson when it is declared as JSON."""
+    content_type = resp.headers.get("content-type", "")
+    if content_type.startswith("application/json"):
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
+def _items_at_path(payload: Any, path: str | None, max_items: int) -> list[Any]:
+    """Up to `max_items` non-null items at `path` of a parsed payload.
+
+    A scalar at `path` counts as a single item.
+    """
+    items = _extract_path(payload, path)
+    if items is None:
+        logger.warning("http_in_list response_path not found: %s", path)
+        return []
+    if not isinstance(items, list):
+        items = [items]
+    return list(islice((it for it in items if it is not None), max_items))
+
+
+def _in_values_query(literals: list[exp.Expression]) -> exp.Subquery:
+    """`(SELECT v FROM (VALUES (..), (..)) AS _in_values(v))` over literals."""
+    values = exp.Values(
+        expressions=[exp.Tuple(expressions=[lit]) for lit in literals],
+        alias=exp.TableAlias(
+            this=exp.to_identifier(_VALUES_ALIAS),
+            columns=[exp.to_identifier(_VALUES_COLUMN)],
+        ),
+    )
+    select = exp.select(exp.column(_VALUES_COLUMN, table=_VALUES_ALIAS)).from_(
+        values, copy=False
+    )
+    return exp.Subquery(this=select)
+
+
 class HttpInListHandler:
     """Row filter: call an HTTP endpoint and filter with `column IN (items)`.
 
@@ -49,9 +279,16 @@ class HttpInListHandler:
       - headers: object (optional) values support python format with {sub}
       - params: object (optional, GET) values support {sub}
       - json: object (optional, POST) values support {sub}
-      - response_path: str (optional) dot path to list in JSON response, default "$"
+      - response_path: str (optional) dot path to list in JSON response, default "$";
+        bodies of 16 KiB or more are parsed incrementally, so there it must
+        point to a list
       - timeout_seconds: int (optional, default 5)
       - max_items: int (optional, default 2000) hard cap for IN list
+      - values_threshold: int (optional, default 0 = disabled) lists longer
+        than this are matched against a VALUES subquery instead of inline IN
+        literals; the VALUES column is typed from the literals (text for
+        strings), so only enable it for columns of that type (not e.g. uuid,
+        integer or date columns filtered with string items)
       - empty_means_deny: bool (optional, default true)
     """
 
@@ -76,9 +313,11 @@ class HttpInListHandler:
         timeout_seconds = int(args.get("timeout_seconds") or 5)
         response_path = args.get("response_path") or "$"
         max_items = int(args.get("max_items") or 2000)
+        values_threshold = int(args.get("values_threshold") or 0)
         empty_means_deny = bool(args.get("empty_means_deny", True))
 
-        headers = args.get("headers") or {}
+        # Copy: args come from the shared dataset spec
+        headers = dict(args.get("headers") or {})
 
         if args.get("forward_token", False):
             headers["authorization"] = user.token
@@ -90,35 +329,75 @@ class HttpInListHandler:
         params = _format_obj(params, user)
         json_body = _format_obj(json_body, user) if json_body is not None else None
 
-        async with httpx.AsyncClient(timeout=timeout_seconds) as client:
-            if method == "GET":
-                resp = await client.get(url, headers=headers, params=params)
-            elif method == "POST":
-                resp = await client.post(
-                    url, headers=headers, params=params, json=json_body
-                )
+        cache_key = _validator_key(
+            table, user.sub, args, headers=headers, params=params, json_body=json_body
+        )
+        validated = _validators.get(cache_key)
+        request_headers = headers
+        if validated is not None:
+            request_headers = {**headers, **validated.conditional_headers()}
+
+        if method not in ("GET", "POST"):
+            raise ValueError(f"http_in_list unsupported method: {method}")
+
+        client = get_client()
+        request = client.build_request(
+            method,
+            url,
+            headers=request_headers,
+            params=params,
+            json=json_body if method == "POST" else None,
+            timeout=timeout_seconds,
+        )
+        resp = await client.send(request, stream=True)
+        try:
+            # Upstream list unchanged: reuse the plan built from the last body
+            if resp.status_code == 304 and validated is not None:
+                return validated.plan
+
+            resp.raise_for_status()
+            length = resp.headers.get("content-length")
+            if length and length.isdigit() and int(length) < _STREAM_MIN_BYTES:
+                await resp.aread()
+                items = _items_at_path(_decode_json(resp), response_path, max_items)
             else:
-                raise ValueError(f"http_in_list unsupported method: {method}")
+                items = await _stream_items(resp, response_path, max_items)
+        finally:
+            await resp.aclose()
 
-        resp.raise_for_status()
-        payload = resp.json()
-        items = _extract_path(payload, response_path)
+        plan = self._plan_from_items(
+            items,
+            table=table,
+            url=url,
+            column=column,
+            values_threshold=values_threshold,
+            empty_means_deny=empty_means_deny,
+        )
 
-        if items is None:
-            logger.warning("http_in_list response_path not found: %s", response_path)
-            items_list: list[Any] = []
-        elif isinstance(items, list):
-            items_list = items
-        else:
-            items_list = [items]
+        etag = resp.headers.get("etag")
+        last_modified = resp.headers.get("last-modified")
+        if etag or last_modified:
+            _validators.set(
+                cache_key,
+                _Validated(etag=etag, last_modified=last_modified, plan=plan),
+                ttl_seconds=_VALIDATOR_TTL_SECONDS,
+            )
+        return plan
 
-        # normalize & cap
-        flat: list[Any] = []
-        for it in items_list:
-            if it is None:
-                continue
-            flat.append(it)
+    @staticmethod
+    def _plan_from_items(
+        flat: list[Any],
+        *,
+        table: str,
+        url: str,
+        column: str,
+        values_threshold: int,
+        empty_means_deny: bool,
+    ) -> RowFilterPlan:
+        """Build the plan from the non-null items found at `response_path`.
 
+        Callers stop collecting at `max_items`, so `flat` is already capped.
+        """
         if not flat:
             if empty_means_deny:
                 return RowFilterPlan(
@@ -129,23 +408,13 @@ class HttpInListHandler:
                 table=table, kind="predicate", predicate_template=predicate
             )
 
-        if len(flat) > max_items:
-            flat = flat[:max_items]
-
-        literals: list[exp.Expression] = []
-        for v in flat:
-            # keep simple: represent as string unless numeric/bool
-            if isinstance(v, bool):
-                literals.append(exp.Boolean(this=v))
-            elif isinstance(v, (int, float)):
-                literals.append(exp.Literal.number(str(v)))
-            else:
-                literals.append(exp.Literal.string(str(v)))
-
-        predicate = exp.In(
-            this=exp.Column(this=exp.Identifier(this=column, quoted=False)),
-            expressions=literals,
-        )
+        literals = literal_nodes(flat)
+        if values_threshold and len(literals) > values_threshold:
+            predicate = exp.In(
+                this=column_node(column), query=_in_values_query(literals)
+            )
+        else:
+            predicate = exp.In(this=column_node(column), expressions=literals)
         return RowFilterPlan(
             table=table,
             kind="predicate",
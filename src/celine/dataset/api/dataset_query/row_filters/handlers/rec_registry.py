@@ -7,6 +7,7 @@ from fastapi import HTTPException
 from sqlglot import exp
 
 from celine.dataset.api.dataset_query.row_filters.models import RowFilterPlan
+from celine.dataset.api.dataset_query.row_filters.utils import column_node
 from celine.dataset.core.config import get_settings
 from celine.dataset.security.models import AuthenticatedUser
 
@@ -16,6 +17,11 @@ from celine.sdk.rec_registry import RecRegistryUserClient
 logger = logging.getLogger(__name__)
 
 
+def _string_literal(value: Any) -> exp.Expression:
+    # sensor ids are strings already; only coerce anything unexpected
+    return exp.Literal.string(value if type(value) is str else str(value))
+
+
 class RecRegistryHandler:
     name = "rec_registry"
 
@@ -60,20 +66,13 @@ class RecRegistryHandler:
         if not assets:
             raise HTTPException(500, "Failed to enumerate user assets")
 
-        user_device_ids: list[str] = []
-        for asset in assets.items:
-            if asset.sensor_id:
-                user_device_ids.append(asset.sensor_id)
-
-        logger.debug(f"User {user.sub} assets {user_device_ids}")
+        user_device_ids = [a.sensor_id for a in assets.items if a.sensor_id]
 
-        literals: list[exp.Expression] = []
-        for v in user_device_ids:
-            literals.append(exp.Literal.string(str(v)))
+        logger.debug("User %s assets %s", user.sub, user_device_ids)
 
         predicate = exp.In(
-            this=exp.Column(this=exp.Identifier(this=column, quoted=False)),
-            expressions=literals,
+            this=column_node(column),
+            expressions=[_string_literal(v) for v in user_device_ids],
         )
 
         return RowFilterPlan(
@@ -5,6 +5,7 @@ from typing import Any
 from sqlglot import exp
 
 from celine.dataset.api.dataset_query.row_filters.models import RowFilterPlan
+from celine.dataset.api.dataset_query.row_filters.utils import column_node
 from celine.dataset.security.models import AuthenticatedUser
 
 
@@ -44,19 +45,30 @@ class TablePointerHandler:
         if not isinstance(pointer_subject_column, str) or not pointer_subject_column:
             raise ValueError("table_pointer requires args.pointer_subject_column")
 
+        # Inner columns are qualified with the pointer table so the applier
+        # leaves them alone; only the outer column gets the dataset alias
+        pointer = exp.Identifier(this=pointer_table, quoted=False)
         subq_select = (
-            exp.select(exp.Column(this=exp.Identifier(this=pointer_key_column, quoted=False)))
-            .from_(exp.Table(this=exp.Identifier(this=pointer_table, quoted=False)))
+            exp.select(
+                exp.Column(
+                    this=exp.Identifier(this=pointer_key_column, quoted=False),
+                    table=pointer,
+                )
+            )
+            .from_(exp.Table(this=pointer.copy()))
             .where(
                 exp.EQ(
-                    this=exp.Column(this=exp.Identifier(this=pointer_subject_column, quoted=False)),
+                    this=exp.Column(
+                        this=exp.Identifier(this=pointer_subject_column, quoted=False),
+                        table=pointer.copy(),
+                    ),
                     expression=exp.Literal.string(user.sub),
                 )
             )
         )
 
         predicate = exp.In(
-            this=exp.Column(this=exp.Identifier(this=column, quoted=False)),
+            this=column_node(column),
             query=exp.Subquery(this=subq_select),
         )
         return RowFilterPlan(table=table, kind="predicate", predicate_template=predicate)
@@ -9,7 +9,7 @@ from sqlglot import exp
 RowFilterPlanKind = Literal["predicate", "deny"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RowFilterPlan:
     """A resolved row-filter plan ready to be applied to a SQL AST.
 
@@ -19,7 +19,9 @@ class RowFilterPlan:
         - deny: deny access (no rows)
     - predicate_template:
         A sqlglot expression that may contain unqualified Column nodes.
-        The applier will qualify those Columns with the actual alias.
+        The applier will qualify those Columns with the actual alias and
+        never touches Columns that already carry a table, so handlers
+        qualify columns of their own subqueries (e.g. the pointer table).
     """
 
     table: str
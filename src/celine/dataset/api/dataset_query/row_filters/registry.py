@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 import importlib
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from importlib.metadata import entry_points
-from typing import Any, Awaitable, Callable, Dict, Optional, Protocol
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Protocol
 
 from celine.dataset.core.config import get_settings
 from celine.dataset.security.models import AuthenticatedUser
 from celine.dataset.api.dataset_query.row_filters.cache import TTLCache
 from celine.dataset.api.dataset_query.row_filters.models import RowFilterPlan
+from celine.dataset.api.dataset_query.row_filters.specs import (
+    args_hash as compute_args_hash,
+)
 from celine.dataset.api.dataset_query.row_filters.utils import token_ttl_seconds
 
 logger = logging.getLogger(__name__)
@@ -39,9 +43,25 @@ class RowFilterRegistry:
 
     handlers: Dict[str, RowFilterHandler]
     cache: TTLCache[RowFilterPlan]
+    # cache key -> resolution currently running for it (request coalescing)
+    _inflight: Dict[str, asyncio.Future[RowFilterPlan]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # configured handler modules not imported yet (see _load_modules)
+    _pending_modules: List[str] = field(default_factory=list, init=False, repr=False)
 
     def get(self, name: str) -> Optional[RowFilterHandler]:
-        return self.handlers.get(name)
+        handler = self.handlers.get(name)
+        # Unknown name: import deferred modules until one registers it
+        while handler is None and self._pending_modules:
+            _import_module(self._pending_modules.pop(0))
+            handler = self.handlers.get(name)
+        return handler
+
+    def load_pending(self) -> None:
+        """Import every deferred handler module now."""
+        while self._pending_modules:
+            _import_module(self._pending_modules.pop(0))
 
     def register(self, handler: RowFilterHandler) -> None:
         if handler.name in self.handlers:
@@ -56,26 +76,60 @@ class RowFilterRegistry:
         user: AuthenticatedUser,
         args: dict[str, Any],
         request_context: dict[str, Any] | None = None,
+        args_hash: Optional[str] = None,
     ) -> RowFilterPlan:
+        """Resolve a plan, reusing a cached one for the same handler/table/user/args.
+
+        `args_hash` may carry the precomputed digest from get_row_filter_specs.
+        Concurrent calls missing the cache for the same key await a single
+        handler invocation.
+        """
         handler = self.get(handler_name)
         if handler is None:
             raise KeyError(handler_name)
 
         # cache key must include relevant identity + args
-        args_key = str(sorted(args.items()))
-        sub = user.sub
-        key = f"{handler_name}|{table}|{sub}|{args_key}"
+        if args_hash is None:
+            args_hash = compute_args_hash(args)
+        key = f"{handler_name}|{table}|{user.sub}|{args_hash}"
 
         cached = self.cache.get(key)
         if cached is not None:
             return cached
 
-        plan = await handler.resolve(
-            table=table,
-            user=user,
-            args=args,
-            request_context=request_context,
+        # Concurrent misses for the same key share one upstream resolution
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # Only the leader was cancelled: resolve on our own below
+                if not inflight.cancelled():
+                    raise
+
+        fut: asyncio.Future[RowFilterPlan] = (
+            asyncio.get_running_loop().create_future()
         )
+        self._inflight[key] = fut
+        try:
+            plan = await handler.resolve(
+                table=table,
+                user=user,
+                args=args,
+                request_context=request_context,
+            )
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except Exception as e:
+            fut.set_exception(e)
+            # Followers re-raise it; don't warn when there are none
+            fut.exception()
+            raise
+        else:
+            fut.set_result(plan)
+        finally:
+            self._inflight.pop(key, None)
 
         # TTL: token lifetime if available, else default
         ttl = token_ttl_seconds(user)
@@ -92,24 +146,41 @@ class RowFilterRegistry:
 _registry: RowFilterRegistry | None = None
 
 
+def _import_module(module: str) -> None:
+    try:
+        importlib.import_module(module)
+        logger.info("Loaded row filter module: %s", module)
+    except Exception:
+        logger.exception("Failed to load row filter module: %s", module)
+        raise
+
+
 def _load_modules() -> None:
+    """Queue configured handler modules on the registry.
+
+    Modules are imported on the first lookup of a handler name that is not
+    registered yet (or by RowFilterRegistry.load_pending).
+    """
     modules = get_settings().row_filters_modules
     if not modules:
         return
     if isinstance(modules, str):
         modules = [m.strip() for m in modules.split(",") if m.strip()]
-    for m in modules:
-        try:
-            importlib.import_module(m)
-            logger.info("Loaded row filter module: %s", m)
-        except Exception:
-            logger.exception("Failed to load row filter module: %s", m)
-            raise
+    if _registry is None:
+        raise RuntimeError("Row filter registry is not initialised")
+    _registry._pending_modules.extend(modules)
+
 
+def get_row_filter_registry(*, preload: bool = False) -> RowFilterRegistry:
+    """Return the process-wide registry, creating it on first use.
 
-def get_row_filter_registry() -> RowFilterRegistry:
+    Configured `row_filters_modules` are imported lazily by
+    RowFilterRegistry.get; pass `preload=True` to import them right away.
+    """
     global _registry
     if _registry is not None:
+        if preload:
+            _registry.load_pending()
         return _registry
 
     from celine.dataset.api.dataset_query.row_filters.handlers import (
@@ -134,6 +205,8 @@ def get_row_filter_registry() -> RowFilterRegistry:
     _registry = reg
 
     _load_modules()
+    if preload:
+        reg.load_pending()
 
     # Entry-point discovered handlers (external packages)
     for ep in entry_points(group="celine.dataset.row_filters"):
@@ -1,12 +1,25 @@
 from __future__ import annotations
 
+import hashlib
 import logging
-from typing import Any, List
+from types import MappingProxyType
+from typing import Any, List, Mapping
+
+import orjson
 
 from celine.dataset.db.models.dataset_entry import DatasetEntry
 
 logger = logging.getLogger(__name__)
 
+# (dataset_id, serialized governance facet) -> frozen specs
+_SPECS_CACHE: dict[tuple[str, bytes], tuple[Mapping[str, Any], ...]] = {}
+_SPECS_CACHE_MAX = 4096
+
+# spec digest -> shared frozen spec, so datasets declaring the same spec
+# (e.g. one http_in_list endpoint) hold a single object; flushed with
+# _SPECS_CACHE
+_INTERN: dict[bytes, Mapping[str, Any]] = {}
+
 
 def _governance(entry: DatasetEntry) -> dict[str, Any]:
     if not entry.lineage:
@@ -15,31 +28,81 @@ def _governance(entry: DatasetEntry) -> dict[str, Any]:
     return (facets.get("governance", {}) or {})  # type: ignore[return-value]
 
 
-def get_row_filter_specs(entry: DatasetEntry) -> List[dict[str, Any]]:
-    """Return row filter specs for a dataset.
+def args_hash(args: dict[str, Any]) -> str:
+    """Stable digest of handler args (key order independent, nested included)."""
+    doc = orjson.dumps(
+        args, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str
+    )
+    return hashlib.blake2b(doc, digest_size=16).hexdigest()
 
-    Supported governance keys:
-    - rowFilters (camelCase)
-    - row_filters (snake_case)
-    - legacy: userFilterColumn / user_filter_column
 
-    Legacy userFilterColumn is migrated into handler 'direct_user_match'.
-    """
-    gov = _governance(entry)
+def _with_args_hash(spec: dict[str, Any]) -> dict[str, Any]:
+    args = spec.get("args") or {}
+    if not isinstance(args, dict):
+        return spec
+    return {**spec, "_args_hash": args_hash(args)}
 
+
+def _build_specs(dataset_id: str, gov: dict[str, Any]) -> tuple[Mapping[str, Any], ...]:
     specs: List[dict[str, Any]] = []
     rf = gov.get("rowFilters") or gov.get("row_filters")
     if isinstance(rf, list):
         for item in rf:
             if isinstance(item, dict):
-                specs.append(item)
+                specs.append(_with_args_hash(item))
 
     # Legacy support: migrate userFilterColumn -> direct handler
     legacy_col = gov.get("userFilterColumn") or gov.get("user_filter_column")
     if legacy_col and isinstance(legacy_col, str):
-        specs.append({"handler": "direct_user_match", "args": {"column": legacy_col}})
+        specs.append(
+            _with_args_hash(
+                {"handler": "direct_user_match", "args": {"column": legacy_col}}
+            )
+        )
 
     if specs:
-        logger.debug("Dataset %s row filter specs: %s", entry.dataset_id, specs)
+        logger.debug("Dataset %s row filter specs: %s", dataset_id, specs)
+
+    return tuple(_intern(spec) for spec in specs)
+
+
+def _intern(spec: dict[str, Any]) -> Mapping[str, Any]:
+    doc = orjson.dumps(
+        spec, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str
+    )
+    digest = hashlib.blake2b(doc, digest_size=16).digest()
+    shared = _INTERN.get(digest)
+    if shared is None:
+        shared = _INTERN[digest] = MappingProxyType(spec)
+    return shared
+
+
+def get_row_filter_specs(entry: DatasetEntry) -> List[Mapping[str, Any]]:
+    """Return row filter specs for a dataset.
+
+    Supported governance keys:
+    - rowFilters (camelCase)
+    - row_filters (snake_case)
+    - legacy: userFilterColumn / user_filter_column
+
+    Legacy userFilterColumn is migrated into handler 'direct_user_match'.
+    Each returned spec carries `_args_hash`, the cache digest of its args.
+
+    Specs are read-only and memoized on the serialized governance facet, so
+    catalogue updates are picked up without explicit invalidation.
+    """
+    gov = _governance(entry)
+    if not gov:
+        return []
 
-    return specs
+    key = (
+        entry.dataset_id,
+        orjson.dumps(gov, option=orjson.OPT_NON_STR_KEYS, default=str),
+    )
+    specs = _SPECS_CACHE.get(key)
+    if specs is None:
+        if len(_SPECS_CACHE) >= _SPECS_CACHE_MAX:
+            _SPECS_CACHE.clear()
+            _INTERN.clear()
+        specs = _SPECS_CACHE[key] = _build_specs(entry.dataset_id, gov)
+    return list(specs)
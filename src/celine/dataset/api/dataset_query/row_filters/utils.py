@@ -1,19 +1,66 @@
 from __future__ import annotations
 
+import functools
 import time
-from typing import Any, Optional
+from typing import Any, Callable, Iterable, Optional
+
+from sqlglot import exp
 
 from celine.dataset.security.models import AuthenticatedUser
 from celine.sdk.auth.jwt import extract_groups
 
-ADMIN_GROUPS = {"admins"}
+__all__ = [
+    "ADMIN_GROUPS",
+    "column_node",
+    "is_admin_user",
+    "literal_nodes",
+    "token_ttl_seconds",
+]
+
+ADMIN_GROUPS = frozenset({"admins"})
+
+
+@functools.lru_cache(maxsize=512)
+def _column_template(column: str) -> exp.Column:
+    return exp.Column(this=exp.Identifier(this=column, quoted=False))
+
+
+def column_node(column: str) -> exp.Column:
+    """Unquoted, unqualified column reference (copied from a cached node)."""
+    return _column_template(column).copy()
+
+
+def _number_literal(value: Any) -> exp.Expression:
+    return exp.Literal.number(str(value))
+
+
+def _boolean_literal(value: Any) -> exp.Expression:
+    return exp.Boolean(this=value)
+
+
+def _string_literal(value: Any) -> exp.Expression:
+    return exp.Literal.string(str(value))
+
+
+# Exact-type dispatch for JSON scalar values; anything else becomes a string
+_LITERAL_FACTORIES: dict[type, Callable[[Any], exp.Expression]] = {
+    str: exp.Literal.string,
+    bool: _boolean_literal,
+    int: _number_literal,
+    float: _number_literal,
+}
+
+
+def literal_nodes(values: Iterable[Any]) -> list[exp.Expression]:
+    """SQL literals for values: booleans and numbers as such, others as strings."""
+    factories = _LITERAL_FACTORIES
+    return [factories.get(type(v), _string_literal)(v) for v in values]
 
 
 def is_admin_user(user: Optional[AuthenticatedUser]) -> bool:
     if user is None:
         return False
-    groups = extract_groups(user.claims)
-    return bool(ADMIN_GROUPS & set(groups))
+    return any(g in ADMIN_GROUPS for g in extract_groups(user.claims))
 
 
 def token_ttl_seconds(user: Optional[AuthenticatedUser]) -> Optional[int]:
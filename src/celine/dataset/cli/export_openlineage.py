@@ -10,7 +10,6 @@ import typer
 import yaml
 
 from celine.dataset.cli.utils import resolve_namespaces, setup_cli_logging
-from celine.dataset.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -178,6 +177,8 @@ def export_openlineage_cmd(
         False, "--expose", help="Mark exported datasets as exposed."
     ),
 ):
+    from celine.dataset.core.config import get_settings
+
     setup_cli_logging(verbose)
 
     base_url = str(marquez_url or get_settings().marquez_url).rstrip("/")
@@ -9,18 +9,34 @@ available in the database schema, safe defaults are provided for manual curation
 from __future__ import annotations
 
 import fnmatch
+import functools
 import logging
+import operator
+import re
 import warnings
+from enum import Enum
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, List, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Iterator, List, Mapping, Optional
 
 import typer
-import yaml
-from sqlalchemy import MetaData, create_engine, inspect, text
-from sqlalchemy.engine import Engine
 
-from celine.dataset.cli.utils import setup_cli_logging, write_yaml_file
-from celine.dataset.core.config import get_settings
+from celine.dataset.cli.utils import (
+    setup_cli_logging,
+    write_json_file,
+    write_json_mapping_stream,
+    write_yaml_file,
+    write_yaml_mapping_stream,
+)
+
+# SQLAlchemy and the settings stack are imported when the command runs, so
+# `dataset-cli --help` and shell completion do not pay for them
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection, Engine
+    from sqlalchemy.engine.reflection import Inspector
+    from sqlalchemy.sql.elements import TextClause
 
 # Suppress SQLAlchemy warnings for unrecognized types (e.g., PostGIS geography/geometry)
 warnings.filterwarnings(
@@ -47,25 +63,171 @@ GEOSPATIAL_TYPES = frozenset(
     }
 )
 
-# Default values for governance fields that must be curated by hand
-GOVERNANCE_DEFAULTS = {
-    "access_level": "internal",  # Safe default: not open, requires auth
-    "classification": "yellow",  # Safe default: requires review
-    "license": None,  # Must be filled in
-    "attribution": None,  # Must be filled in if required by license
-    "access_requirements": "partner",  # Safe default
-    "retention_days": 365,  # Common default
+# Substring match of any geospatial type name, in a single regex scan
+_GEOSPATIAL_RE = re.compile(
+    "|".join(re.escape(t) for t in sorted(GEOSPATIAL_TYPES)), re.IGNORECASE
+)
+
+
+# Few distinct type names recur across every column of every table
+@functools.lru_cache(maxsize=1024)
+def _is_geospatial(type_str: str) -> bool:
+    return _GEOSPATIAL_RE.search(type_str) is not None
+
+
+# Concurrent per-table reflections when batch reflection is unavailable
+_REFLECT_WORKERS = 8
+
+# Default values for governance fields that must be curated by hand (read-only)
+GOVERNANCE_DEFAULTS: Mapping[str, Any] = MappingProxyType(
+    {
+        "access_level": "internal",  # Safe default: not open, requires auth
+        "classification": "yellow",  # Safe default: requires review
+        "license": None,  # Must be filled in
+        "attribution": None,  # Must be filled in if required by license
+        "access_requirements": "partner",  # Safe default
+        "retention_days": 365,  # Common default
+    }
+)
+
+
+_PRODUCER = "dataset-cli/export-postgres"
+_SCHEMA_FACET_URL = "https://openlineage.io/spec/facets/1-0-0/SchemaDatasetFacet.json"
+_CLASSIFICATION_KEYWORD = f"classification:{GOVERNANCE_DEFAULTS['classification']}"
+_name_and_type = operator.itemgetter("name", "type")
+
+# Governance facet written for every exported table (copied per entry)
+_GOVERNANCE_FACET: dict[str, Any] = {
+    "_producer": _PRODUCER,
+    "_schemaURL": "file:///GovernanceDatasetFacet.schema.json",
+    "title": None,  # TODO: to be filled
+    "description": None,  # TODO: to be filled
+    "accessLevel": GOVERNANCE_DEFAULTS["access_level"],
+    "classification": GOVERNANCE_DEFAULTS["classification"],
+    "license": GOVERNANCE_DEFAULTS["license"],
+    "attribution": GOVERNANCE_DEFAULTS["attribution"],
+    "access_requirements": GOVERNANCE_DEFAULTS["access_requirements"],
+    "retentionDays": GOVERNANCE_DEFAULTS["retention_days"],
+    "sourceSystem": "postgres",
 }
 
 
+# Catalog queries; wrapped once by _sql so their compiled forms are cached
+_TABLE_RAW_COLUMNS_SQL = """
+    SELECT
+        a.attname AS column_name,
+        pg_catalog.format_type(a.atttypid, a.atttypmod) AS data_type,
+        NOT a.attnotnull AS is_nullable,
+        pg_get_expr(d.adbin, d.adrelid) AS column_default
+    FROM pg_catalog.pg_attribute a
+    LEFT JOIN pg_catalog.pg_attrdef d ON (a.attrelid = d.adrelid AND a.attnum = d.adnum)
+    WHERE a.attrelid = (
+        SELECT c.oid
+        FROM pg_catalog.pg_class c
+        JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = :schema AND c.relname = :table
+    )
+    AND a.attnum > 0
+    AND NOT a.attisdropped
+    ORDER BY a.attnum
+"""
+
+_SCHEMA_RAW_COLUMNS_SQL = """
+    SELECT
+        c.relname AS table_name,
+        a.attname AS column_name,
+        pg_catalog.format_type(a.atttypid, a.atttypmod) AS data_type,
+        NOT a.attnotnull AS is_nullable,
+        pg_get_expr(d.adbin, d.adrelid) AS column_default
+    FROM pg_catalog.pg_attribute a
+    JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+    JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+    LEFT JOIN pg_catalog.pg_attrdef d ON (a.attrelid = d.adrelid AND a.attnum = d.adnum)
+    WHERE n.nspname = :schema
+    AND a.attnum > 0
+    AND NOT a.attisdropped
+    ORDER BY c.relname, a.attnum
+"""
+
+# Same relkinds and persistence filter as Inspector.get_table_names/get_view_names
+_SCHEMAS_TABLES_SQL = """
+    SELECT n.nspname AS schema_name, c.relname AS table_name, c.relkind
+    FROM pg_catalog.pg_class c
+    JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = ANY(:schemas)
+    AND c.relkind IN ('r', 'p', 'v')
+    AND c.relpersistence != 't'
+"""
+
+_TABLE_COMMENT_SQL = """
+    SELECT obj_description(
+        (quote_ident(:schema) || '.' || quote_ident(:table))::regclass,
+        'pg_class'
+    )
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _sql(statement: str) -> TextClause:
+    from sqlalchemy import text
+
+    return text(statement)
+
+
+@contextmanager
+def _connection(engine: Engine, conn: Optional[Connection]) -> Iterator[Connection]:
+    """Use `conn` when given (rolled back on error), else a new connection."""
+    if conn is None:
+        with engine.connect() as new_conn:
+            yield new_conn
+        return
+    try:
+        yield conn
+    except Exception:
+        conn.rollback()
+        raise
+
+
+class OutputFormat(str, Enum):
+    yaml = "yaml"
+    json = "json"
+
+
 def _get_engine(database_url: str) -> Engine:
     """Create SQLAlchemy engine from connection URL."""
-    return create_engine(database_url)
+    from sqlalchemy import create_engine, make_url
+
+    connect_args: dict[str, Any] = {}
+    if make_url(database_url).get_driver_name() == "psycopg":
+        # Per-table catalog queries repeat on the same pooled connections:
+        # have psycopg prepare them server-side from their second run
+        connect_args["prepare_threshold"] = 1
+    return create_engine(database_url, connect_args=connect_args)
+
+
+def _masked_url(database_url: str) -> str:
+    """Database URL for display, with the password replaced by ***."""
+    from sqlalchemy import make_url
+    from sqlalchemy.exc import ArgumentError
+
+    try:
+        return make_url(database_url).render_as_string(hide_password=True)
+    except ArgumentError:
+        # Unparseable: _get_engine reports it, just never echo credentials
+        return "<invalid database URL>"
+
+
+@functools.lru_cache(maxsize=8)
+def _inspector(engine: Engine) -> Inspector:
+    """Shared inspector per engine (dialect state and reflection cache)."""
+    from sqlalchemy import inspect
+
+    return inspect(engine)
 
 
 def _list_schemas(engine: Engine, include_system: bool = False) -> List[str]:
     """List available schemas in the database."""
-    inspector = inspect(engine)
+    inspector = _inspector(engine)
     schemas = inspector.get_schema_names()
 
     if not include_system:
@@ -89,7 +251,7 @@ def _list_tables(
     - type: 'table' or 'view'
     - schema: schema name
     """
-    inspector = inspect(engine)
+    inspector = _inspector(engine)
 
     tables = []
 
@@ -117,10 +279,45 @@ def _list_tables(
     return sorted(tables, key=lambda x: x["name"])
 
 
+def _list_all_tables(
+    engine: Engine,
+    schemas: List[str],
+    include_views: bool = True,
+) -> dict[str, List[dict]]:
+    """
+    List tables (and optionally views) for all schemas at once.
+
+    On PostgreSQL this is a single pg_class query instead of one or two
+    inspector round-trips per schema. Results match _list_tables.
+    """
+    if engine.dialect.name != "postgresql":
+        return {
+            schema: _list_tables(engine, schema, include_views=include_views)
+            for schema in schemas
+        }
+
+    listed: dict[str, List[dict]] = {schema: [] for schema in schemas}
+    with engine.connect() as conn:
+        rows = conn.execute(_sql(_SCHEMAS_TABLES_SQL), {"schemas": list(schemas)})
+        for schema, name, relkind in rows:
+            if relkind == "v":
+                if not include_views:
+                    continue
+                kind = "view"
+            else:
+                kind = "table"
+            listed[schema].append({"name": name, "type": kind, "schema": schema})
+
+    for tables in listed.values():
+        tables.sort(key=lambda x: x["name"])
+    return listed
+
+
 def _get_table_columns(
     engine: Engine,
     schema: str,
     table_name: str,
+    conn: Optional[Connection] = None,
 ) -> List[dict]:
     """
     Get column information for a table.
@@ -128,34 +325,15 @@ def _get_table_columns(
     Handles unknown types (e.g., PostGIS geography/geometry) by falling back
     to direct PostgreSQL catalog queries for accurate type names.
     """
-    inspector = inspect(engine)
+    inspector = _inspector(engine)
 
     # First, get raw column info from pg_catalog for accurate types
     # This handles PostGIS and other extension types that SQLAlchemy doesn't recognize
     raw_types = {}
     try:
-        with engine.connect() as conn:
-            result = conn.execute(
-                text(
-                    """
-                    SELECT 
-                        a.attname AS column_name,
-                        pg_catalog.format_type(a.atttypid, a.atttypmod) AS data_type,
-                        NOT a.attnotnull AS is_nullable,
-                        pg_get_expr(d.adbin, d.adrelid) AS column_default
-                    FROM pg_catalog.pg_attribute a
-                    LEFT JOIN pg_catalog.pg_attrdef d ON (a.attrelid = d.adrelid AND a.attnum = d.adnum)
-                    WHERE a.attrelid = (
-                        SELECT c.oid 
-                        FROM pg_catalog.pg_class c
-                        JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
-                        WHERE n.nspname = :schema AND c.relname = :table
-                    )
-                    AND a.attnum > 0 
-                    AND NOT a.attisdropped
-                    ORDER BY a.attnum
-                """
-                ),
+        with _connection(engine, conn) as c:
+            result = c.execute(
+                _sql(_TABLE_RAW_COLUMNS_SQL),
                 {"schema": schema, "table": table_name},
             )
             for row in result:
@@ -182,56 +360,47 @@ def _get_table_columns(
                     "type": info["type"],
                     "nullable": info["nullable"],
                     "default": info["default"],
-                    "is_geospatial": any(
-                        geo in info["type"].lower() for geo in GEOSPATIAL_TYPES
-                    ),
+                    "is_geospatial": _is_geospatial(info["type"]),
                 }
                 for name, info in raw_types.items()
             ]
         return []
 
-    result = []
-    for col in columns:
-        col_name = col["name"]
+    return [_column_info(col, raw_types) for col in columns]
 
-        # Get type - prefer raw PostgreSQL type if SQLAlchemy returned NullType
-        col_type = col.get("type")
-        type_str = str(col_type) if col_type is not None else "UNKNOWN"
 
-        # If SQLAlchemy returned NullType, use the raw type from pg_catalog
-        if "NullType" in type_str or type_str == "NULL":
-            type_str = raw_types.get(col_name, {}).get("type", type_str)
+def _column_info(col: dict, raw_types: dict) -> dict:
+    """Normalize one inspector column, using pg_catalog types for NullType."""
+    col_name = col["name"]
 
-        # Check if this is a geospatial type
-        type_lower = type_str.lower()
-        is_geospatial = any(geo in type_lower for geo in GEOSPATIAL_TYPES)
+    # Get type - prefer raw PostgreSQL type if SQLAlchemy returned NullType
+    col_type = col.get("type")
+    type_str = str(col_type) if col_type is not None else "UNKNOWN"
 
-        result.append(
-            {
-                "name": col_name,
-                "type": type_str,
-                "nullable": col.get("nullable", True),
-                "default": str(col["default"]) if col.get("default") else None,
-                "is_geospatial": is_geospatial,
-            }
-        )
+    # If SQLAlchemy returned NullType, use the raw type from pg_catalog
+    if "NullType" in type_str or type_str == "NULL":
+        type_str = raw_types.get(col_name, {}).get("type", type_str)
 
-    return result
+    return {
+        "name": col_name,
+        "type": type_str,
+        "nullable": col.get("nullable", True),
+        "default": str(col["default"]) if col.get("default") else None,
+        "is_geospatial": _is_geospatial(type_str),
+    }
 
 
-def _get_table_comment(engine: Engine, schema: str, table_name: str) -> Optional[str]:
+def _get_table_comment(
+    engine: Engine,
+    schema: str,
+    table_name: str,
+    conn: Optional[Connection] = None,
+) -> Optional[str]:
     """Get table comment/description if available."""
     try:
-        with engine.connect() as conn:
-            result = conn.execute(
-                text(
-                    """
-                    SELECT obj_description(
-                        (quote_ident(:schema) || '.' || quote_ident(:table))::regclass,
-                        'pg_class'
-                    )
-                """
-                ),
+        with _connection(engine, conn) as c:
+            result = c.execute(
+                _sql(_TABLE_COMMENT_SQL),
                 {"schema": schema, "table": table_name},
             )
             row = result.fetchone()
@@ -243,7 +412,7 @@ def _get_table_comment(engine: Engine, schema: str, table_name: str) -> Optional
 
 def _get_primary_keys(engine: Engine, schema: str, table_name: str) -> List[str]:
     """Get primary key columns for a table."""
-    inspector = inspect(engine)
+    inspector = _inspector(engine)
     try:
         pk = inspector.get_pk_constraint(table_name, schema=schema)
         return pk.get("constrained_columns", []) if pk else []
@@ -251,6 +420,90 @@ def _get_primary_keys(engine: Engine, schema: str, table_name: str) -> List[str]
         return []
 
 
+def _schema_raw_types(engine: Engine, schema: str) -> dict[str, dict[str, dict]]:
+    """pg_catalog column types of every relation in `schema`, in one query."""
+    raw: dict[str, dict[str, dict]] = {}
+    try:
+        with engine.connect() as conn:
+            result = conn.execute(
+                _sql(_SCHEMA_RAW_COLUMNS_SQL),
+                {"schema": schema},
+            )
+            for row in result:
+                raw.setdefault(row[0], {})[row[1]] = {
+                    "type": row[2],
+                    "nullable": row[3],
+                    "default": row[4],
+                }
+    except Exception as exc:
+        logger.debug("Could not query pg_catalog for schema %s: %s", schema, exc)
+    return raw
+
+
+def _reflect_schema(
+    engine: Engine, schema: str, table_names: List[str]
+) -> dict[str, dict[str, Any]]:
+    """
+    Reflect columns, primary keys and comments of `table_names` at once.
+
+    Uses the inspector's multi-table reflection, which issues one catalog
+    query per kind of metadata for the whole schema instead of several per
+    table. Returns {table_name: {"columns", "primary_keys", "comment"}};
+    tables missing from the result fall back to per-table reflection.
+    """
+    from sqlalchemy.engine.reflection import ObjectKind
+
+    inspector = _inspector(engine)
+    kind = ObjectKind.ANY
+
+    try:
+        multi_columns = inspector.get_multi_columns(
+            schema=schema, filter_names=table_names, kind=kind
+        )
+    except Exception as exc:
+        logger.warning("Failed to reflect columns for schema %s: %s", schema, exc)
+        return {}
+
+    try:
+        multi_pks = inspector.get_multi_pk_constraint(
+            schema=schema, filter_names=table_names, kind=kind
+        )
+    except Exception as exc:
+        logger.debug("Failed to reflect primary keys for schema %s: %s", schema, exc)
+        multi_pks = {}
+
+    try:
+        multi_comments = inspector.get_multi_table_comment(
+            schema=schema, filter_names=table_names, kind=kind
+        )
+    except Exception as exc:
+        logger.debug("Failed to reflect comments for schema %s: %s", schema, exc)
+        multi_comments = {}
+
+    raw_types = _schema_raw_types(engine, schema)
+
+    reflected: dict[str, dict[str, Any]] = {}
+    for (_, table_name), columns in multi_columns.items():
+        table_raw = raw_types.get(table_name, {})
+        pk = multi_pks.get((schema, table_name)) or {}
+        comment = (multi_comments.get((schema, table_name)) or {}).get("text")
+        reflected[table_name] = {
+            "columns": [_column_info(col, table_raw) for col in columns],
+            "primary_keys": pk.get("constrained_columns", []),
+            "comment": comment or None,
+        }
+    return reflected
+
+
+@functools.lru_cache(maxsize=1024)
+def _clean_identifier(name: str) -> str:
+    """Lowercase `name` with dashes and spaces replaced by underscores.
+
+    Cached: namespace and schema repeat for every table of an export.
+    """
+    return name.lower().replace("-", "_").replace(" ", "_")
+
+
 def _normalize_dataset_id(schema: str, table_name: str, namespace: str) -> str:
     """
     Generate a dataset_id from schema and table name.
@@ -261,9 +514,9 @@ def _normalize_dataset_id(schema: str, table_name: str, namespace: str) -> str:
     ds_dev_gold.ds_dev_gold.table -> ds_dev_gold.table
     """
     # Normalize to lowercase and replace special chars
-    clean_schema = schema.lower().replace("-", "_").replace(" ", "_")
-    clean_table = table_name.lower().replace("-", "_").replace(" ", "_")
-    clean_namespace = namespace.lower().replace("-", "_").replace(" ", "_")
+    clean_schema = _clean_identifier(schema)
+    clean_table = _clean_identifier(table_name)
+    clean_namespace = _clean_identifier(namespace)
 
     # Avoid duplication when namespace == schema
     if clean_namespace == clean_schema:
@@ -279,22 +532,45 @@ def _build_dataset_entry(
     namespace: str,
     expose: bool,
     backend_type: str = "postgres",
+    table_meta: Optional[dict[str, Any]] = None,
 ) -> dict[str, Any]:
     """
     Build a dataset entry for a single table/view.
 
     Includes safe governance defaults that should be curated before import.
+    `table_meta` is the table's entry from `_reflect_schema`; without it the
+    metadata is queried for this table alone.
     """
     table_name = table_info["name"]
     table_type = table_info["type"]
+    # Physical table reference (schema-qualified); reused for title, backend
+    # table and lineage name
+    physical_table = f"{schema}.{table_name}"
+    access_level = GOVERNANCE_DEFAULTS["access_level"]
+    license_uri = GOVERNANCE_DEFAULTS["license"]
 
     # Get metadata from database
-    comment = _get_table_comment(engine, schema, table_name)
-    columns = _get_table_columns(engine, schema, table_name)
-    primary_keys = _get_primary_keys(engine, schema, table_name)
-
-    # Physical table reference (schema-qualified)
-    physical_table = f"{schema}.{table_name}"
+    if table_meta is not None:
+        comment = table_meta["comment"]
+        columns = table_meta["columns"]
+        primary_keys = table_meta["primary_keys"]
+    else:
+        # One checkout for both catalog queries of this table
+        with engine.connect() as conn:
+            columns = _get_table_columns(engine, schema, table_name, conn)
+            if columns:
+                comment = _get_table_comment(engine, schema, table_name, conn)
+        if columns:
+            primary_keys = _get_primary_keys(engine, schema, table_name)
+        else:
+            # Reflection failed: the remaining lookups would fail the same way
+            logger.warning(
+                "No columns reflected for %s.%s, exporting it without metadata",
+                schema,
+                table_name,
+            )
+            comment = None
+            primary_keys = []
 
     # Build description
     if comment:
@@ -309,31 +585,17 @@ def _build_dataset_entry(
         "sourceName": "postgres",
         "facets": {
             "schema": {
-                "_producer": "dataset-cli/export-postgres",
-                "_schemaURL": "https://openlineage.io/spec/facets/1-0-0/SchemaDatasetFacet.json",
+                "_producer": _PRODUCER,
+                "_schemaURL": _SCHEMA_FACET_URL,
                 "fields": [
-                    {
-                        "name": col["name"],
-                        "type": col["type"],
-                        "description": None,  # Would need column comments
-                    }
-                    for col in columns
+                    # description would need column comments
+                    {"name": name, "type": col_type, "description": None}
+                    for name, col_type in map(_name_and_type, columns)
                 ],
             },
-            # Governance facet with safe defaults (to be edited)
-            "governance": {
-                "_producer": "dataset-cli/export-postgres",
-                "_schemaURL": "file:///GovernanceDatasetFacet.schema.json",
-                "title": None,  # TODO: to be filled
-                "description": None,  # TODO: to be filled
-                "accessLevel": GOVERNANCE_DEFAULTS["access_level"],
-                "classification": GOVERNANCE_DEFAULTS["classification"],
-                "license": GOVERNANCE_DEFAULTS["license"],
-                "attribution": GOVERNANCE_DEFAULTS["attribution"],
-                "access_requirements": GOVERNANCE_DEFAULTS["access_requirements"],
-                "retentionDays": GOVERNANCE_DEFAULTS["retention_days"],
-                "sourceSystem": "postgres",
-            },
+            # Governance facet with safe defaults (to be edited); copied so
+            # the YAML dumper does not emit anchors for a shared dict
+            "governance": dict(_GOVERNANCE_FACET),
         },
     }
 
@@ -353,11 +615,11 @@ def _build_dataset_entry(
         tags["keywords"].append("has_geospatial")
 
     # Add governance-related tags for filtering
-    tags["keywords"].append(f"classification:{GOVERNANCE_DEFAULTS['classification']}")
-    tags["accessRights"] = GOVERNANCE_DEFAULTS["access_level"]
+    tags["keywords"].append(_CLASSIFICATION_KEYWORD)
+    tags["accessRights"] = access_level
 
     entry: dict[str, Any] = {
-        "title": f"{physical_table}",
+        "title": physical_table,
         "description": description,
         "backend_type": backend_type,
         "backend_config": {
@@ -368,11 +630,11 @@ def _build_dataset_entry(
         "schema_override_path": None,
         "tags": tags,
         "lineage": lineage,
-        "access_level": GOVERNANCE_DEFAULTS["access_level"],
+        "access_level": access_level,
         # DCAT fields - safe defaults
         "publisher_uri": None,  # TODO: to be filled
         "rights_holder_uri": None,  # TODO: to be filled
-        "license_uri": GOVERNANCE_DEFAULTS["license"],
+        "license_uri": license_uri,
         "landing_page": None,
         "language_uris": None,
         "spatial_uris": None,
@@ -381,6 +643,47 @@ def _build_dataset_entry(
     return entry
 
 
+def _build_schema_entries(
+    engine: Engine,
+    schema: str,
+    tables: List[dict],
+    *,
+    namespace: str,
+    expose: bool,
+) -> dict[str, dict[str, Any]]:
+    """
+    Build the dataset entries of one schema, keyed by dataset_id.
+
+    Tables that batch reflection could not cover are reflected one by one;
+    those round-trips are independent, so they run on a small thread pool
+    (the engine's default pool allows more connections than workers).
+    Entries keep the order of `tables`.
+    """
+    reflected = _reflect_schema(engine, schema, [t["name"] for t in tables])
+
+    def build(table: dict) -> dict[str, Any]:
+        return _build_dataset_entry(
+            engine=engine,
+            schema=schema,
+            table_info=table,
+            namespace=namespace,
+            expose=expose,
+            table_meta=reflected.get(table["name"]),
+        )
+
+    missing = sum(1 for t in tables if t["name"] not in reflected)
+    if missing > 1:
+        with ThreadPoolExecutor(max_workers=min(_REFLECT_WORKERS, missing)) as pool:
+            entries = list(pool.map(build, tables))
+    else:
+        entries = [build(t) for t in tables]
+
+    return {
+        _normalize_dataset_id(schema, table["name"], namespace): entry
+        for table, entry in zip(tables, entries)
+    }
+
+
 def _filter_tables(
     tables: List[dict],
     include_patterns: List[str],
@@ -394,28 +697,35 @@ def _filter_tables(
     if not include_patterns and not exclude_patterns:
         return tables
 
+    # One compiled alternation per side instead of a fnmatch call per pattern
+    include_re = _compile_globs(include_patterns)
+    exclude_re = _compile_globs(exclude_patterns)
+
     result = []
 
     for table in tables:
         full_name = f"{table['schema']}.{table['name']}"
 
         # Check includes
-        if include_patterns:
-            included = any(fnmatch.fnmatchcase(full_name, p) for p in include_patterns)
-            if not included:
-                continue
+        if include_re is not None and not include_re.match(full_name):
+            continue
 
         # Check excludes
-        if exclude_patterns:
-            excluded = any(fnmatch.fnmatchcase(full_name, p) for p in exclude_patterns)
-            if excluded:
-                continue
+        if exclude_re is not None and exclude_re.match(full_name):
+            continue
 
         result.append(table)
 
     return result
 
 
+def _compile_globs(patterns: List[str]) -> Optional[re.Pattern[str]]:
+    """Case-sensitive regex matching any of the glob `patterns` (None if empty)."""
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns))
+
+
 def _resolve_table_filters(filters: List[str]) -> tuple[List[str], List[str]]:
     """
     Parse filter patterns into include and exclude lists.
@@ -490,6 +800,14 @@ def export_postgres_cmd(
         "--one-file-per-schema/--single-file",
         help="Create one YAML file per schema (default) or a single combined file.",
     ),
+    output_format: OutputFormat = typer.Option(
+        OutputFormat.yaml,
+        "--format",
+        help=(
+            "Output format. JSON is much faster to write for large exports and "
+            "is read by `import catalogue` from .json files."
+        ),
+    ),
     verbose: bool = typer.Option(False, "--verbose", "-v"),
     dry_run: bool = typer.Option(
         False, "--dry-run", help="Print what would be exported without writing files."
@@ -532,7 +850,13 @@ def export_postgres_cmd(
     \b
     # Export as 'gold' namespace
     dataset-cli export postgres -o ./catalogue --namespace gold --expose
+
+    \b
+    # Large database: write JSON instead of YAML
+    dataset-cli export postgres -o ./catalogue --single-file --format json
     """
+    from celine.dataset.core.config import get_settings
+
     setup_cli_logging(verbose)
 
     # Resolve database URL
@@ -541,13 +865,7 @@ def export_postgres_cmd(
         typer.echo("Error: No database URL configured.", err=True)
         raise typer.Exit(code=1)
 
-    # Mask password in output
-    safe_url = db_url
-    if "@" in db_url:
-        parts = db_url.split("@")
-        safe_url = parts[0].rsplit(":", 1)[0] + ":***@" + parts[1]
-
-    typer.echo(f"Connecting to database: {safe_url}")
+    typer.echo(f"Connecting to database: {_masked_url(db_url)}")
 
     try:
         engine = _get_engine(db_url)
@@ -575,9 +893,8 @@ def export_postgres_cmd(
     # Collect all tables
     all_tables: dict[str, List[dict]] = {}
 
-    for schema in selected_schemas:
-        tables = _list_tables(engine, schema, include_views=include_views)
-
+    listed = _list_all_tables(engine, selected_schemas, include_views=include_views)
+    for schema, tables in listed.items():
         # Apply filters
         tables = _filter_tables(tables, include_patterns, exclude_patterns)
 
@@ -603,46 +920,39 @@ def export_postgres_cmd(
     # Build dataset entries
     out_dir.mkdir(parents=True, exist_ok=True)
 
+    if output_format is OutputFormat.json:
+        write_file, write_stream = write_json_file, write_json_mapping_stream
+    else:
+        write_file, write_stream = write_yaml_file, write_yaml_mapping_stream
+    suffix = output_format.value
+
     if one_file_per_schema:
         # One file per schema
         for schema, tables in all_tables.items():
-            datasets = {}
-
-            for table in tables:
-                dataset_id = _normalize_dataset_id(schema, table["name"], namespace)
-                entry = _build_dataset_entry(
-                    engine=engine,
-                    schema=schema,
-                    table_info=table,
-                    namespace=namespace,
-                    expose=expose,
-                )
-                datasets[dataset_id] = entry
+            datasets = _build_schema_entries(
+                engine, schema, tables, namespace=namespace, expose=expose
+            )
 
             output = {"datasets": datasets}
-            outfile = out_dir / f"{namespace}.{schema}.yaml"
-            write_yaml_file(outfile, output)
+            outfile = out_dir / f"{namespace}.{schema}.{suffix}"
+            write_file(outfile, output)
             typer.echo(f"Wrote {len(datasets)} datasets → {outfile}")
     else:
-        # Single combined file
-        datasets = {}
-
-        for schema, tables in all_tables.items():
-            for table in tables:
-                dataset_id = _normalize_dataset_id(schema, table["name"], namespace)
-                entry = _build_dataset_entry(
-                    engine=engine,
-                    schema=schema,
-                    table_info=table,
-                    namespace=namespace,
-                    expose=expose,
-                )
-                datasets[dataset_id] = entry
-
-        output = {"datasets": datasets}
-        outfile = out_dir / f"{namespace}.yaml"
-        write_yaml_file(outfile, output)
-        typer.echo(f"Wrote {len(datasets)} datasets → {outfile}")
+        # Single combined file, written schema by schema so that only one
+        # schema's entries are held in memory
+        outfile = out_dir / f"{namespace}.{suffix}"
+        count = write_stream(
+            outfile,
+            "datasets",
+            (
+                item
+                for schema, tables in all_tables.items()
+                for item in _build_schema_entries(
+                    engine, schema, tables, namespace=namespace, expose=expose
+                ).items()
+            ),
+        )
+        typer.echo(f"Wrote {count} datasets → {outfile}")
 
     typer.echo("\n⚠️  IMPORTANT: The exported YAML contains governance defaults.")
     typer.echo("   Please review and edit the following fields before import:")
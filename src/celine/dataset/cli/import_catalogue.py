@@ -112,7 +112,7 @@ def import_catalogue(
         ...,
         "--input",
         "-i",
-        help="YAML file or glob (can be passed multiple times).",
+        help="YAML (or .json) file or glob (can be passed multiple times).",
         exists=False,
     ),
     ns: List[str] = typer.Option(
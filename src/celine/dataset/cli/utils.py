@@ -2,10 +2,17 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, Iterable
+import orjson
 import yaml
 from pathlib import Path
 
+# libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeDumper as _SafeDumper, SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 
 def setup_cli_logging(verbose: bool) -> None:
     level = logging.DEBUG if verbose else logging.INFO
@@ -16,16 +23,73 @@ def setup_cli_logging(verbose: bool) -> None:
 
 
 def load_yaml_file(path: Path) -> dict[str, Any]:
+    """Load a YAML file; `.json` files (e.g. JSON exports) are read with orjson."""
     if not path.exists():
         raise FileNotFoundError(f"YAML file does not exist: {path}")
+    if path.suffix.lower() == ".json":
+        return orjson.loads(path.read_bytes()) or {}
     with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+        return yaml.load(f, Loader=_SafeLoader) or {}
 
 
 def write_yaml_file(path: Path, data: dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8") as f:
-        yaml.safe_dump(data, f, sort_keys=False, allow_unicode=True)
+        yaml.dump(data, f, Dumper=_SafeDumper, sort_keys=False, allow_unicode=True)
+
+
+def write_yaml_mapping_stream(
+    path: Path, key: str, items: Iterable[tuple[str, Any]]
+) -> int:
+    """
+    Write `{key: {k: v, ...}}` one item at a time, returning the item count.
+
+    Each item is dumped on its own and indented under `key`, so only the
+    current item has to be held in memory.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    with path.open("w", encoding="utf-8") as f:
+        for item_key, value in items:
+            if count == 0:
+                f.write(f"{key}:\n")
+            chunk = yaml.dump(
+                {item_key: value},
+                Dumper=_SafeDumper,
+                sort_keys=False,
+                allow_unicode=True,
+            )
+            f.writelines(
+                line if line == "\n" else "  " + line
+                for line in chunk.splitlines(keepends=True)
+            )
+            count += 1
+        if count == 0:
+            yaml.dump({key: {}}, f, Dumper=_SafeDumper, sort_keys=False)
+    return count
+
+
+def write_json_file(path: Path, data: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2) + b"\n")
+
+
+def write_json_mapping_stream(
+    path: Path, key: str, items: Iterable[tuple[str, Any]]
+) -> int:
+    """JSON counterpart of `write_yaml_mapping_stream`."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    with path.open("wb") as f:
+        f.write(b"{\n  " + orjson.dumps(key) + b": {")
+        for item_key, value in items:
+            body = orjson.dumps(value, option=orjson.OPT_INDENT_2)
+            f.write(b"," if count else b"")
+            f.write(b"\n    " + orjson.dumps(item_key) + b": ")
+            f.write(body.replace(b"\n", b"\n    "))
+            count += 1
+        f.write(b"\n  }\n}\n" if count else b"}\n}\n")
+    return count
 
 
 # ---------------------------------------------------------------------------
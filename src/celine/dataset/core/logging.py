@@ -1,8 +1,94 @@
+import atexit
 import logging
+import logging.config
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
 
 from celine.dataset.core.config import get_settings
 
+# Writes log records to stdout from a background thread
+_listener: Optional[QueueListener] = None
+
+# Buffered output is written once it reaches this size
+_BUFFER_SIZE = 64 * 1024
+
+
+class _BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that batches records into one write per burst.
+
+    Runs on the listener thread: output is written when `log_queue` has been
+    drained or the buffer is full, so a burst of records costs a single
+    write() and flush() instead of one per record.
+    """
+
+    def __init__(self, stream, log_queue: queue.SimpleQueue) -> None:
+        super().__init__(stream)
+        self._queue = log_queue
+        self._buffer: list[str] = []
+        self._size = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+        except Exception:
+            self.handleError(record)
+            return
+        self._buffer.append(msg)
+        self._size += len(msg)
+        if self._size >= _BUFFER_SIZE or self._queue.empty():
+            self.flush()
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            if self._buffer:
+                data = "".join(self._buffer)
+                self._buffer.clear()
+                self._size = 0
+                self.stream.write(data)
+            super().flush()
+        finally:
+            self.release()
+
+
+def _start_listener(
+    log_queue: queue.SimpleQueue, handler: logging.Handler
+) -> QueueHandler:
+    """Run `handler` on a listener thread; return the handler feeding it."""
+    global _listener
+    _stop_listener()
+
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+    return QueueHandler(log_queue)
+
+
+def _stop_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        # Records buffered behind the stop sentinel
+        for handler in _listener.handlers:
+            try:
+                handler.flush()
+            except (OSError, ValueError):
+                # Stream already closed at interpreter exit, as logging.shutdown
+                pass
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
+_UVICORN_LEVELS = (
+    ("uvicorn", logging.INFO),
+    ("uvicorn.error", logging.INFO),
+    ("uvicorn.access", logging.WARNING),
+)
+
 
 def setup_logging() -> None:
     """
@@ -10,40 +96,48 @@ def setup_logging() -> None:
     - root logger = INFO
     - application logs (celine.*) = LOG_LEVEL
     - noisy libraries reduced
+
+    Records are formatted and written on a listener thread, so logging
+    never blocks the event loop on stdout; bursts are written in one go.
     """
 
     app_level = getattr(logging, get_settings().log_level.upper(), logging.INFO)
 
-    handler = logging.StreamHandler(sys.stdout)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    handler = _BufferedStreamHandler(sys.stdout, log_queue)
     formatter = logging.Formatter(
         fmt="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
         datefmt="%Y-%m-%dT%H:%M:%S%z",
     )
     handler.setFormatter(formatter)
 
-    # ------------------------------------------------------------------
-    # Root logger: safe default
-    # ------------------------------------------------------------------
-    root = logging.getLogger()
-    root.handlers.clear()
-    root.setLevel(logging.INFO)
-    root.addHandler(handler)
-
-    # ------------------------------------------------------------------
-    # Application logs
-    # ------------------------------------------------------------------
-    logging.getLogger("celine").setLevel(app_level)
-
-    # ------------------------------------------------------------------
-    # Framework / server logs
-    # ------------------------------------------------------------------
-    logging.getLogger("uvicorn").setLevel(logging.INFO)
-    logging.getLogger("uvicorn.error").setLevel(logging.INFO)
-    logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
+    logging.config.dictConfig(
+        {
+            "version": 1,
+            "disable_existing_loggers": False,
+            "handlers": {
+                "queue": {
+                    "()": _start_listener,
+                    "log_queue": log_queue,
+                    "handler": handler,
+                },
+            },
+            # Root logger: safe default
+            "root": {"level": "INFO", "handlers": ["queue"]},
+            "loggers": {
+                # Application logs
+                "celine": {"level": app_level},
+                # Common noisy libraries (tune as needed)
+                "sqlalchemy": {"level": "WARNING"},
+                "httpx": {"level": "WARNING"},
+                "asyncio": {"level": "WARNING"},
+            },
+        }
+    )
 
     # ------------------------------------------------------------------
-    # Common noisy libraries (tune as needed)
+    # Framework / server logs: levels only, dictConfig would drop the
+    # handlers uvicorn installs on these loggers
     # ------------------------------------------------------------------
-    logging.getLogger("sqlalchemy").setLevel(logging.WARNING)
-    logging.getLogger("httpx").setLevel(logging.WARNING)
-    logging.getLogger("asyncio").setLevel(logging.WARNING)
+    for name, level in _UVICORN_LEVELS:
+        logging.getLogger(name).setLevel(level)
@@ -9,5 +9,5 @@ def url_str(url) -> str:
 
 
 def get_dataset_uri(dataset_id: str) -> str:
-    base = str(get_settings().dataset_base_uri).rstrip("/")
+    base = get_settings().dataset_base_uri.rstrip("/")
     return f"{base}/{dataset_id}"
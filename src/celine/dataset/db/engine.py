@@ -17,6 +17,19 @@ def _to_asyncpg_url(url: str) -> str:
     return url.replace("postgresql+psycopg", "postgresql+asyncpg")
 
 
+def _create_engine(url: str) -> AsyncEngine:
+    s = get_settings()
+    return create_async_engine(
+        url,
+        future=True,
+        pool_size=s.db_pool_size,
+        max_overflow=s.db_max_overflow,
+        pool_pre_ping=True,
+        pool_recycle=s.db_pool_recycle,
+        pool_use_lifo=True,
+    )
+
+
 _engine: Optional[AsyncEngine] = None
 _sessionmaker: Optional[async_sessionmaker[AsyncSession]] = None
 
@@ -29,7 +42,7 @@ def get_engine() -> AsyncEngine:
     if _engine is None:
         s = get_settings()
         url = _to_asyncpg_url(s.database_url)
-        _engine = create_async_engine(url, future=True)
+        _engine = _create_engine(url)
         _sessionmaker = async_sessionmaker(
             bind=_engine,
             expire_on_commit=False,
@@ -60,7 +73,7 @@ def get_datasets_engine() -> AsyncEngine:
     if _datasets_engine is None:
         s = get_settings()
         url = _to_asyncpg_url(s.datasets_database_url or s.database_url)
-        _datasets_engine = create_async_engine(url, future=True)
+        _datasets_engine = _create_engine(url)
         _datasets_sessionmaker = async_sessionmaker(
             bind=_datasets_engine,
             expire_on_commit=False,
@@ -14,7 +14,7 @@ logger = logging.getLogger(__name__)
 async def reflect_table_async(db: AsyncSession, table_name: str) -> Table:
     metadata = MetaData()
 
-    logger.debug(f"Reflect table {table_name}")
+    logger.debug("Reflect table %s", table_name)
 
     dbname = None
     parts = table_name.split(".")
@@ -25,7 +25,7 @@ async def reflect_table_async(db: AsyncSession, table_name: str) -> Table:
     else:
         schema, tbl = None, parts[0]
 
-    logger.debug(f"Table database={dbname} schema={schema} table={tbl}")
+    logger.debug("Table database=%s schema=%s table=%s", dbname, schema, tbl)
 
     def _reflect(sync_conn):
         metadata.reflect(bind=sync_conn, only=[tbl], schema=schema, views=True)
@@ -10,6 +10,7 @@ from celine.dataset.api.catalogue.schema import BackendConfig, DatasetEntryModel
 
 from celine.dataset.security.governance import (
     enforce_dataset_access,
+    enforce_many,
     resolve_datasets_for_tables,
 )
 from celine.dataset.security.models import AuthenticatedUser
@@ -36,6 +37,7 @@ __all__ = [
     "DatasetEntryModel",
     "BackendConfig",
     "enforce_dataset_access",
+    "enforce_many",
     "resolve_datasets_for_tables",
     "AuthenticatedUser",
     "get_current_user",
@@ -1,18 +1,22 @@
 # dataset/main.py
 from __future__ import annotations
 
+import asyncio
 import logging
-from contextlib import asynccontextmanager
-import os
-from pathlib import Path
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
 
 from celine.dataset.core.config import Settings, configure, get_settings
 from celine.dataset.api.healthcheck import is_healthly
 from celine.dataset.core.logging import setup_logging
 from celine.dataset.routes import register_routes
-from celine.dataset.core.owners import OwnersRegistry, load_owners_yaml
+from celine.dataset.core.owners import load_owners_yaml
+from celine.dataset.security.auth import jwks_refresher
+from celine.dataset.api.dataset_query.row_filters.handlers.http_in_list import (
+    close_client as close_http_in_list_client,
+)
+from celine.dataset.security.governance import init_policy_engine
+from celine.dataset.security.opa import close_client as close_opa_client
 
 setup_logging()
 logger = logging.getLogger(__name__)
@@ -31,6 +35,8 @@ async def lifespan(app: FastAPI):
     if failed:
         raise RuntimeError("System failed health check at startup")
 
+    await init_policy_engine()
+
     try:
         app.state.owners = load_owners_yaml(s.owners_yaml_path)
         logger.info(
@@ -46,8 +52,20 @@ async def lifespan(app: FastAPI):
         logger.warning("Could not load owners registry: %s — continuing without it", exc)
         app.state.owners = None
 
+    refresher = None
+    if s.jwks_refresh_interval > 0:
+        refresher = asyncio.create_task(jwks_refresher())
+
     yield
 
+    if refresher is not None:
+        refresher.cancel()
+        with suppress(asyncio.CancelledError):
+            await refresher
+
+    await close_http_in_list_client()
+    await close_opa_client()
+
     logger.info("Shutting down %s", s.app_name)
 
 
@@ -1,44 +1,78 @@
+import os
+from functools import lru_cache
 from importlib import import_module
 from importlib.metadata import entry_points
 from pathlib import Path
+from pkgutil import iter_modules
 
 from fastapi.staticfiles import StaticFiles
 from celine.dataset.core.logging import logging
 from celine.dataset.routes.views import router as views_router
 from fastapi import FastAPI
+from starlette.responses import Response
+from starlette.types import Scope
 
 
 logger = logging.getLogger(__name__)
 
 
+class _ImmutableStaticFiles(StaticFiles):
+    """
+    StaticFiles for assets that only change on deploy.
+
+    Files are listed and stat'ed once at startup, so known paths are served
+    without a per-request os.stat in a worker thread. Anything else goes
+    through the regular lookup (and 404 handling).
+    """
+
+    def __init__(self, *, directory: Path) -> None:
+        super().__init__(directory=directory)
+        self._files: dict[str, tuple[str, os.stat_result]] = {}
+        for root, _, files in os.walk(directory):
+            for name in files:
+                full_path = os.path.join(root, name)
+                rel_path = os.path.normpath(os.path.relpath(full_path, directory))
+                self._files[rel_path] = (full_path, os.stat(full_path))
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        found = self._files.get(path)
+        if found is not None and scope["method"] in ("GET", "HEAD"):
+            return self.file_response(found[0], found[1], scope)
+        return await super().get_response(path, scope)
+
+
+@lru_cache(maxsize=1)
+def _route_module_names() -> tuple[str, ...]:
+    """Route modules in this package, sorted so registration order is stable."""
+    return tuple(
+        sorted(
+            info.name
+            for info in iter_modules(__path__)
+            if not info.ispkg
+            and not info.name.startswith("_")
+            and info.name != "views"
+        )
+    )
+
+
 def register_routes(app: FastAPI, *, extra_routers: list | None = None):
 
     # register views router before APIs
     static_path = (Path(__file__).resolve().parent.parent / "static").absolute()
     assert static_path.exists()
 
-    logger.debug(f"Static path {static_path}")
+    logger.debug("Static path %s", static_path)
     app.mount(
         "/static",
-        StaticFiles(directory=static_path),
+        _ImmutableStaticFiles(directory=static_path),
         name="static",
     )
     app.include_router(views_router)
 
     routes = []
 
-    # Discover all modules in this directory
-    pkg_path = Path(__file__).parent
-
-    for file in pkg_path.glob("*.py"):
-        if (
-            file.name.startswith("_")
-            or file.name == "__init__.py"
-            or file.name == "views.py"
-        ):
-            continue
-
-        module_name = f"{__name__}.{file.stem}"
+    for name in _route_module_names():
+        module_name = f"{__name__}.{name}"
         module = import_module(module_name)
 
         route = {}
@@ -1,16 +1,22 @@
 # dataset/routes/catalogue.py
 from __future__ import annotations
 
+from types import SimpleNamespace
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy import select, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from celine.dataset.db.models.dataset_entry import DatasetEntry
-from celine.dataset.api.catalogue.dcat_formatter import build_catalog, build_dataset
+from celine.dataset.api.catalogue.dcat_formatter import (
+    build_catalog,
+    build_dataset,
+    stream_catalog,
+)
 from celine.dataset.db.engine import get_session
 
 router = APIRouter()
@@ -19,6 +25,28 @@ tags = ["catalogue"]
 
 _LD_MEDIA_TYPE = "application/ld+json"
 
+# Columns read by build_catalog; large unused columns are not loaded
+_CATALOG_COLUMNS = (
+    DatasetEntry.dataset_id,
+    DatasetEntry.title,
+    DatasetEntry.description,
+    DatasetEntry.backend_config,
+    DatasetEntry.tags,
+    DatasetEntry.lineage,
+    DatasetEntry.access_level,
+    DatasetEntry.publisher_uri,
+    DatasetEntry.rights_holder_uri,
+    DatasetEntry.license_uri,
+    DatasetEntry.landing_page,
+    DatasetEntry.language_uris,
+    DatasetEntry.spatial_uris,
+)
+
+
+def _ld_response(document: dict) -> Response:
+    """Serialize a JSON-LD document straight to bytes with orjson."""
+    return Response(content=orjson.dumps(document), media_type=_LD_MEDIA_TYPE)
+
 
 class CatalogueSearchRequest(BaseModel):
     q: Optional[str] = None
@@ -34,10 +62,16 @@ async def list_catalogue(request: Request, db: AsyncSession = Depends(get_sessio
     are silently omitted even when expose=True.
     """
     owners = getattr(request.app.state, "owners", None)
-    stmt = select(DatasetEntry).where(DatasetEntry.expose.is_(True))
-    res = await db.execute(stmt)
-    entries = res.scalars().all()
-    return JSONResponse(content=build_catalog(entries, owners=owners), media_type=_LD_MEDIA_TYPE)
+    stmt = (
+        select(*_CATALOG_COLUMNS)
+        .where(DatasetEntry.expose.is_(True))
+        .execution_options(yield_per=500)
+    )
+    res = await db.stream(stmt)
+    entries = (SimpleNamespace(**row) async for row in res.mappings())
+    return StreamingResponse(
+        stream_catalog(entries, owners=owners), media_type=_LD_MEDIA_TYPE
+    )
 
 
 @router.get("/catalogue/{dataset_id}")
@@ -61,7 +95,7 @@ async def get_catalogue_entry(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Dataset not found")
     if entry.access_level == "secret":
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Dataset not found")
-    return JSONResponse(content=build_dataset(entry, owners=owners), media_type=_LD_MEDIA_TYPE)
+    return _ld_response(build_dataset(entry, owners=owners))
 
 
 @router.post("/catalogue/search")
@@ -98,4 +132,4 @@ async def search_catalogue(
             if wanted & {kw.lower() for kw in ((e.tags or {}).get("keywords") or [])}
         ]
 
-    return JSONResponse(content=build_catalog(entries, owners=owners), media_type=_LD_MEDIA_TYPE)
+    return _ld_response(build_catalog(entries, owners=owners))
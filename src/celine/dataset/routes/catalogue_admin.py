@@ -1,17 +1,22 @@
 # dataset/routes/admin.py
 from __future__ import annotations
 
+import json
 import logging
+from typing import Any, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import JSON, delete, literal_column, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from celine.dataset.db.models.dataset_entry import DatasetEntry
 from celine.dataset.db.engine import get_session, get_datasets_session
-from celine.dataset.db.reflection import reflect_table_async
-from celine.dataset.schemas.catalogue_import import CatalogueImportModel
+from celine.dataset.schemas.catalogue_import import (
+    CatalogueImportModel,
+    DatasetEntryModel,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -19,22 +24,179 @@ router = APIRouter()
 tags = ["catalogue"]
 
 
+# Dumps a whole payload in one pydantic-core pass
+_ENTRIES_ADAPTER: TypeAdapter[list[DatasetEntryModel]] = TypeAdapter(
+    list[DatasetEntryModel]
+)
+
+
+def _entries_rows(datasets: list[DatasetEntryModel]) -> list[dict[str, Any]]:
+    """Column values (including dataset_id) for DatasetEntry rows."""
+    return _ENTRIES_ADAPTER.dump_python(datasets)
+
+
+# Imports larger than this are written with COPY + a single upsert
+_BULK_IMPORT_THRESHOLD = 500
+# Every DatasetEntryModel field is a DatasetEntry column; dataset_id first
+_IMPORT_COLUMNS = (
+    "dataset_id",
+    *(f for f in DatasetEntryModel.model_fields if f != "dataset_id"),
+)
+_JSON_COLUMNS = frozenset(
+    c.name for c in DatasetEntry.__table__.columns if isinstance(c.type, JSON)
+)
+
+
+async def _bulk_upsert_entries(
+    db: AsyncSession,
+    datasets: list[DatasetEntryModel],
+) -> Optional[tuple[int, int]]:
+    """
+    Upsert entries via COPY into a temp table and one INSERT ... ON CONFLICT.
+
+    Returns (created, updated), or None when the session is not backed by
+    asyncpg and the caller should fall back to per-row upserts.
+    """
+    conn = await db.connection()
+    if conn.dialect.driver != "asyncpg":
+        return None
+
+    # Last definition wins for repeated dataset_ids, as with per-row upserts;
+    # each repetition counts as an update there, so it does here
+    records: dict[str, tuple[Any, ...]] = {}
+    for values in _entries_rows(datasets):
+        records[values["dataset_id"]] = tuple(
+            json.dumps(values[c]) if c in _JSON_COLUMNS and values[c] is not None
+            else values[c]
+            for c in _IMPORT_COLUMNS
+        )
+
+    target = conn.dialect.identifier_preparer.format_table(DatasetEntry.__table__)
+    columns = ", ".join(_IMPORT_COLUMNS)
+    assignments = ", ".join(f"{c} = EXCLUDED.{c}" for c in _IMPORT_COLUMNS[1:])
+
+    # Executed through the session so the temp table lives in its transaction
+    await db.execute(
+        text(
+            f"CREATE TEMP TABLE _catalogue_import ON COMMIT DROP AS "
+            f"SELECT {columns} FROM {target} WITH NO DATA"
+        )
+    )
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        "_catalogue_import",
+        records=list(records.values()),
+        columns=list(_IMPORT_COLUMNS),
+    )
+    res = await db.execute(
+        text(
+            f"INSERT INTO {target} ({columns}) "
+            f"SELECT {columns} FROM _catalogue_import "
+            f"ON CONFLICT (dataset_id) DO UPDATE SET {assignments} "
+            f"RETURNING (xmax = 0) AS inserted"
+        )
+    )
+    inserted = res.scalars().all()
+    created = sum(1 for flag in inserted if flag)
+    return created, len(inserted) - created + len(datasets) - len(records)
+
+
+# Rows per INSERT ... ON CONFLICT statement, within bind parameter limits
+_UPSERT_CHUNK_SIZE = 1000
+
+
+async def _upsert_entries(
+    db: AsyncSession,
+    datasets: list[DatasetEntryModel],
+) -> Optional[tuple[int, int]]:
+    """
+    Upsert entries with multi-row INSERT ... ON CONFLICT statements.
+
+    Returns (created, updated), or None when the catalogue is not on
+    PostgreSQL and the caller should fall back to per-row upserts.
+    """
+    conn = await db.connection()
+    if conn.dialect.name != "postgresql":
+        return None
+
+    # Last definition wins for repeated dataset_ids, as with per-row upserts;
+    # each repetition counts as an update there, so it does here
+    rows = {values["dataset_id"]: values for values in _entries_rows(datasets)}
+    created = 0
+    updated = len(datasets) - len(rows)
+
+    pending = list(rows.values())
+    for start in range(0, len(pending), _UPSERT_CHUNK_SIZE):
+        stmt = pg_insert(DatasetEntry).values(
+            pending[start : start + _UPSERT_CHUNK_SIZE]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[DatasetEntry.dataset_id],
+            set_={c: stmt.excluded[c] for c in _IMPORT_COLUMNS[1:]},
+        ).returning(literal_column("xmax = 0").label("inserted"))
+        inserted = (await db.execute(stmt)).scalars().all()
+        chunk_created = sum(1 for flag in inserted if flag)
+        created += chunk_created
+        updated += len(inserted) - chunk_created
+
+    return created, updated
+
+
 class CatalogueImportResponse(BaseModel):
     created: int
     updated: int
 
 
-async def postgres_table_exists_via_reflection(
+# Catalogue rows fetched per round-trip while scanning for stale entries
+_CLEANUP_BATCH_SIZE = 500
+
+# Relations visible to reflect_table_async (tables, partitioned, foreign, views)
+_EXISTING_TABLES_SQL = text(
+    """
+    SELECT n.nspname, c.relname, current_schema()
+    FROM pg_catalog.pg_class c
+    JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+    WHERE c.relname = ANY(:names)
+    AND c.relkind IN ('r', 'p', 'f', 'v', 'm')
+    """
+)
+
+
+def _split_table_name(table_name: str) -> tuple[Optional[str], str]:
+    """(schema, table) as reflect_table_async reads it; a database part is ignored."""
+    parts = table_name.split(".")
+    if len(parts) >= 2:
+        return parts[-2], parts[-1]
+    return None, parts[0]
+
+
+async def postgres_existing_tables(
     db: AsyncSession,
-    table_name: str,
-) -> bool:
-    try:
-        await reflect_table_async(db, table_name)
-        return True
-    except HTTPException:
-        return False
-    except Exception:
-        return False
+    table_names: set[str],
+) -> set[str]:
+    """
+    Return the subset of `table_names` that exist, using one catalog query.
+
+    Unqualified names resolve against the current schema, as reflection does.
+    Lookup errors propagate: an empty result always means "none exist", and
+    callers skip or delete entries based on it.
+    """
+    if not table_names:
+        return set()
+
+    split = {name: _split_table_name(name) for name in table_names}
+    res = await db.execute(
+        _EXISTING_TABLES_SQL, {"names": sorted({t for _, t in split.values()})}
+    )
+    rows = res.all()
+
+    present = {(schema, table) for schema, table, _ in rows}
+    default_schema = rows[0][2] if rows else None
+    return {
+        name
+        for name, (schema, table) in split.items()
+        if (schema or default_schema, table) in present
+    }
 
 
 async def _cleanup_entries(
@@ -48,48 +210,54 @@ async def _cleanup_entries(
 
     Returns the number of removed entries.
     """
-    removed = 0
     skip_tables = skip_tables or set()
 
-    stmt = select(DatasetEntry)
-    res = await db.execute(stmt)
-    entries = res.scalars().all()
-
-    for entry in entries:
-        # Only physical backends are checked for now
-        if entry.backend_type != "postgres":
-            continue
-
-        backend_config = entry.backend_config or {}
-        table = backend_config.get("table")
+    # Only physical backends are checked for now. Rows are streamed and only
+    # the columns needed here are loaded.
+    stmt = (
+        select(DatasetEntry.id, DatasetEntry.dataset_id, DatasetEntry.backend_config)
+        .where(DatasetEntry.backend_type == "postgres")
+        .execution_options(yield_per=_CLEANUP_BATCH_SIZE)
+    )
+    doomed: list[int] = []
+    candidates: list[tuple[int, str, str]] = []
+    async for entry_id, dataset_id, backend_config in await db.stream(stmt):
+        table = (backend_config or {}).get("table")
         if not table:
             logger.info(
                 "Removing dataset %s: missing backend table reference",
-                entry.dataset_id,
+                dataset_id,
             )
-            await db.delete(entry)
-            removed += 1
+            doomed.append(entry_id)
             continue
 
         if table in skip_tables:
             logger.debug(
                 "Skipping cleanup for dataset %s (table %s validated this run)",
-                entry.dataset_id,
+                dataset_id,
                 table,
             )
             continue
 
-        exists = await postgres_table_exists_via_reflection(datasets_db, table)
-        if not exists:
+        candidates.append((entry_id, dataset_id, table))
+
+    # Check every referenced table in one query
+    present = await postgres_existing_tables(
+        datasets_db, {table for _, _, table in candidates}
+    )
+    for entry_id, dataset_id, table in candidates:
+        if table not in present:
             logger.info(
                 "Removing dataset %s: postgres table %s no longer exists",
-                entry.dataset_id,
+                dataset_id,
                 table,
             )
-            await db.delete(entry)
-            removed += 1
+            doomed.append(entry_id)
 
-    return removed
+    if doomed:
+        await db.execute(delete(DatasetEntry).where(DatasetEntry.id.in_(doomed)))
+
+    return len(doomed)
 
 
 @router.post(
@@ -110,11 +278,19 @@ async def import_catalogue(
     updated = 0
     validated_tables: set[str] = set()
 
+    wanted = {
+        ds.backend_config.table
+        for ds in body.datasets
+        if ds.backend_type == "postgres" and ds.backend_config and ds.backend_config.table
+    }
+    present = await postgres_existing_tables(datasets_db, wanted)
+
+    accepted: list[DatasetEntryModel] = []
     for ds in body.datasets:
 
         if ds.backend_type == "postgres":
             table = ds.backend_config.table if ds.backend_config else None
-            if table and not await postgres_table_exists_via_reflection(datasets_db, table):
+            if table and table not in present:
                 logger.info(
                     "Skipping dataset %s: postgres table %s does not exist",
                     ds.dataset_id,
@@ -124,55 +300,40 @@ async def import_catalogue(
             if table:
                 validated_tables.add(table)
 
-        # Check if dataset already exists
-        stmt = select(DatasetEntry).where(DatasetEntry.dataset_id == ds.dataset_id)
-        res = await db.execute(stmt)
-        existing = res.scalars().first()
-
-        backend_config = ds.backend_config.model_dump() if ds.backend_config else None
-        lineage = ds.lineage.model_dump() if ds.lineage else None
-        tags = ds.tags.model_dump() if ds.tags else None
-
-        if existing:
-            existing.title = ds.title
-            existing.description = ds.description
-            existing.backend_type = ds.backend_type
-            existing.backend_config = backend_config
-            existing.lineage = lineage
-            existing.tags = tags
-            existing.ontology_path = ds.ontology_path
-            existing.schema_override_path = ds.schema_override_path
-            existing.expose = ds.expose
-            existing.publisher_uri = ds.publisher_uri
-            existing.rights_holder_uri = ds.rights_holder_uri
-            existing.license_uri = ds.license_uri
-            existing.landing_page = ds.landing_page
-            existing.language_uris = ds.language_uris
-            existing.spatial_uris = ds.spatial_uris
-            existing.access_level = ds.access_level
-            updated += 1
-        else:
-            entry = DatasetEntry(
-                dataset_id=ds.dataset_id,
-                title=ds.title,
-                description=ds.description,
-                backend_type=ds.backend_type,
-                backend_config=backend_config,
-                tags=tags,
-                lineage=lineage,
-                ontology_path=ds.ontology_path,
-                schema_override_path=ds.schema_override_path,
-                expose=ds.expose,
-                publisher_uri=ds.publisher_uri,
-                rights_holder_uri=ds.rights_holder_uri,
-                license_uri=ds.license_uri,
-                landing_page=ds.landing_page,
-                language_uris=ds.language_uris,
-                spatial_uris=ds.spatial_uris,
-                access_level=ds.access_level,
+        accepted.append(ds)
+
+    counts = None
+    if len(accepted) > _BULK_IMPORT_THRESHOLD:
+        counts = await _bulk_upsert_entries(db, accepted)
+    if counts is None and accepted:
+        counts = await _upsert_entries(db, accepted)
+
+    if counts is not None:
+        created, updated = counts
+    else:
+        # Fetch all existing entries in one query instead of one per dataset
+        existing_map: dict[str, DatasetEntry] = {}
+        if accepted:
+            stmt = select(DatasetEntry).where(
+                DatasetEntry.dataset_id.in_({ds.dataset_id for ds in accepted})
             )
-            db.add(entry)
-            created += 1
+            res = await db.execute(stmt)
+            existing_map = {e.dataset_id: e for e in res.scalars()}
+
+        for values in _entries_rows(accepted):
+            dataset_id = values.pop("dataset_id")
+            existing = existing_map.get(dataset_id)
+
+            if existing:
+                for f, v in values.items():
+                    setattr(existing, f, v)
+                updated += 1
+            else:
+                entry = DatasetEntry(dataset_id=dataset_id, **values)
+                db.add(entry)
+                # Repeated dataset_ids later in the payload update this entry
+                existing_map[dataset_id] = entry
+                created += 1
 
     removed = await _cleanup_entries(db, datasets_db=datasets_db, skip_tables=validated_tables)
     if removed:
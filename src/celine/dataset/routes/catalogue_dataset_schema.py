@@ -1,13 +1,17 @@
 # dataset/routes/metadata.py
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Optional
+from typing import Any, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
+from celine.dataset.api.dataset_query.row_filters.cache import TTLCache
+from celine.dataset.core.config import get_settings
 from celine.dataset.db.engine import get_session
 from celine.dataset.db.models.dataset_entry import DatasetEntry
 from celine.dataset.db.reflection import reflect_table_async
@@ -18,12 +22,25 @@ tags = ["catalogue"]
 
 logger = logging.getLogger(__name__)
 
+# JSON schemas of reflected backend tables, keyed by physical table name
+_schema_cache: TTLCache[dict[str, Any]] = TTLCache(maxsize=1024)
+# Reflections in progress, shared by concurrent requests for the same table
+_schema_inflight: dict[str, asyncio.Future[dict[str, Any]]] = {}
+
 
 async def _get_entry(dataset_id: str, db: AsyncSession) -> DatasetEntry:
     stmt = (
         select(DatasetEntry)
         .where(DatasetEntry.dataset_id == dataset_id)
         .where(DatasetEntry.expose.is_(True))
+        # Only the backend is needed; skip lineage/tags and the DCAT columns
+        .options(
+            load_only(
+                DatasetEntry.dataset_id,
+                DatasetEntry.backend_type,
+                DatasetEntry.backend_config,
+            )
+        )
     )
     res = await db.execute(stmt)
     entry = res.scalars().first()
@@ -34,6 +51,49 @@ async def _get_entry(dataset_id: str, db: AsyncSession) -> DatasetEntry:
     return entry
 
 
+async def _table_schema(db: AsyncSession, backend_table: str) -> dict[str, Any]:
+    """JSON schema of a postgres table, reflected at most once per TTL."""
+    cached = _schema_cache.get(backend_table)
+    if cached is not None:
+        return cached
+
+    inflight = _schema_inflight.get(backend_table)
+    if inflight is not None:
+        try:
+            return await asyncio.shield(inflight)
+        except asyncio.CancelledError:
+            # Only the leader was cancelled: reflect on our own below
+            if not inflight.cancelled():
+                raise
+
+    fut: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+    _schema_inflight[backend_table] = fut
+    try:
+        try:
+            table = await reflect_table_async(db, backend_table)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.exception("Failed to reflect table %s: %s", backend_table, exc)
+            raise HTTPException(status_code=500, detail="Failed to reflect table")
+        schema = build_json_schema(table)
+    except asyncio.CancelledError:
+        fut.cancel()
+        raise
+    except Exception as e:
+        fut.set_exception(e)
+        # Followers re-raise it; don't warn when there are none
+        fut.exception()
+        raise
+    else:
+        fut.set_result(schema)
+    finally:
+        _schema_inflight.pop(backend_table, None)
+
+    _schema_cache.set(backend_table, schema, get_settings().policies_cache_ttl)
+    return schema
+
+
 @router.get("/catalogue/{dataset_id}/schema")
 async def dataset_metadata(
     dataset_id: str,
@@ -51,11 +111,7 @@ async def dataset_metadata(
         backend_table = entry.backend_config.get("table")
 
     if entry.backend_type == "postgres" and backend_table:
-        try:
-            table = await reflect_table_async(db, backend_table)
-        except Exception as exc:
-            logger.exception("Failed to reflect table %s: %s", backend_table, exc)
-            raise HTTPException(status_code=500, detail="Failed to reflect table")
+        return await _table_schema(db, backend_table)
 
     schema = build_json_schema(table)
     return schema
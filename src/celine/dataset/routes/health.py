@@ -1,7 +1,7 @@
 # dataset/routes/health.py
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 
 from celine.dataset.core.logging import logging
 from celine.dataset.api.healthcheck import is_healthly
@@ -10,10 +10,13 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Serialized once; probes skip the JSON encoder entirely
+_READY = Response(content=b'{"status":"ready"}', media_type="application/json")
+
 
 @router.get("/health")
 async def healthcheck():
     failed = await is_healthly()
     if failed:
         raise HTTPException(status_code=404, detail="Unhealthly")
-    return {"status": "ready"}
+    return _READY
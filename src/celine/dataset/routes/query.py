@@ -7,10 +7,13 @@ from fastapi import APIRouter, Depends, Header
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from celine.dataset.core.config import get_settings
-from celine.dataset.db.engine import get_session, get_datasets_session
+from celine.dataset.db.engine import get_datasets_session, get_sessionmaker
 from celine.dataset.schemas.dataset_query import DatasetQueryModel, DatasetQueryResult
 from celine.dataset.security.auth import get_optional_user
-from celine.dataset.api.dataset_query.executor import execute_query
+from celine.dataset.api.dataset_query.executor import (
+    execute_query,
+    resolve_query_datasets,
+)
 from celine.dataset.security.edr import EDRRequestContext
 from celine.dataset.security.models import AuthenticatedUser
 
@@ -27,7 +30,6 @@ tags = ["catalogue"]
 )
 async def query_post(
     body: DatasetQueryModel,
-    catalogue_db: AsyncSession = Depends(get_session),
     datasets_db: AsyncSession = Depends(get_datasets_session),
     user: Optional[AuthenticatedUser] = Depends(get_optional_user),
     edc_contract_agreement_id: Optional[str] = Header(default=None),
@@ -40,8 +42,15 @@ async def query_post(
             consumer_id=edc_bpn or "",
         )
 
+    # The catalogue is only needed to resolve the referenced datasets: its
+    # connection goes back to the pool before policy checks and upstream calls
+    async with get_sessionmaker()() as catalogue_db:
+        datasets = await resolve_query_datasets(
+            catalogue_db=catalogue_db, raw_sql=body.sql
+        )
+
     return await execute_query(
-        catalogue_db=catalogue_db,
+        datasets=datasets,
         datasets_db=datasets_db,
         raw_sql=body.sql,
         limit=body.limit,
@@ -1,10 +1,9 @@
 # dataset/schemas/dataset_query.py
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, List, Optional
 
 from pydantic import BaseModel
-from typing import Any, List, Optional
 
 
 class DatasetQueryResult(BaseModel):
@@ -1,30 +1,215 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
+import re
+import time
+from dataclasses import dataclass, field
 from typing import Optional
 
+import httpx
+import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from jwt import PyJWK, PyJWKSet
 
+from celine.dataset.api.dataset_query.row_filters.cache import TTLCache
+from celine.dataset.api.dataset_query.row_filters.utils import token_ttl_seconds
 from celine.dataset.core.config import get_settings
 from celine.dataset.security.models import AuthenticatedUser
 
 # Use celine.sdk for JWT validation
 from celine.sdk.auth import JwtUser
 from celine.sdk.auth.jwt import extract_groups
+from celine.sdk.settings.models import OidcSettings
 
 logger = logging.getLogger(__name__)
 bearer_scheme = HTTPBearer(auto_error=False)
 
 
 # ---------------------------------------------------------------------
-# Core JWT validation using celine.sdk
+# JWKS background refresh
 # ---------------------------------------------------------------------
 
+_JWKS_MIN_REFRESH_SECONDS = 30
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+@dataclass
+class _JwksState:
+    """Signing keys and conditional-request state of the JWKS refresher."""
+
+    signing_keys: dict[str, PyJWK] = field(default_factory=dict)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    max_age: Optional[int] = None
+    last_success: Optional[float] = None
+    # Forced refreshes on unknown kids: one at a time, at most one per window
+    refresh_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    last_forced: Optional[float] = None
+
+    def is_stale(self) -> bool:
+        """True when the refresher has not succeeded for 10x the key max-age."""
+        if self.last_success is None or not self.max_age:
+            return False
+        return time.monotonic() - self.last_success > 10 * self.max_age
+
+
+_jwks_state = _JwksState()
+
+
+def _parse_max_age(cache_control: Optional[str]) -> Optional[int]:
+    if not cache_control:
+        return None
+    match = _MAX_AGE_RE.search(cache_control)
+    return int(match.group(1)) if match else None
+
+
+async def refresh_jwks(client: httpx.AsyncClient) -> int:
+    """
+    Fetch the JWKS once and replace the signing keys used for verification.
+
+    Sends If-None-Match / If-Modified-Since from the previous response; on
+    304 the current keys are kept. Returns the number of seconds to wait
+    before the next refresh, honoring Cache-Control max-age.
+    """
+    oidc = get_settings().oidc
+
+    headers: dict[str, str] = {}
+    if _jwks_state.etag:
+        headers["If-None-Match"] = _jwks_state.etag
+    if _jwks_state.last_modified:
+        headers["If-Modified-Since"] = _jwks_state.last_modified
+
+    resp = await client.get(oidc.jwks_uri, headers=headers)
+    if resp.status_code != 304:
+        resp.raise_for_status()
+        # Parse once per actual change; 304 responses reuse the parsed keys
+        key_set = PyJWKSet.from_dict(resp.json())
+        signing_keys = {k.key_id: k for k in key_set.keys if k.key_id}
+        if signing_keys.keys() != _jwks_state.signing_keys.keys():
+            logger.info("JWKS keys updated: %s", sorted(signing_keys))
+        _jwks_state.signing_keys = signing_keys
+        _jwks_state.etag = resp.headers.get("etag")
+        _jwks_state.last_modified = resp.headers.get("last-modified")
+        logger.debug("JWKS refreshed from %s", oidc.jwks_uri)
+
+    _jwks_state.max_age = _parse_max_age(resp.headers.get("cache-control"))
+    _jwks_state.last_success = time.monotonic()
+
+    delay = _jwks_state.max_age or get_settings().jwks_refresh_interval
+    return max(delay, _JWKS_MIN_REFRESH_SECONDS)
+
+
+async def jwks_refresher() -> None:
+    """Background task that keeps the JWKS warm until cancelled."""
+    interval = get_settings().jwks_refresh_interval
+    async with httpx.AsyncClient(timeout=get_settings().oidc.timeout) as client:
+        while True:
+            try:
+                delay = await refresh_jwks(client)
+            except Exception as exc:
+                logger.warning("JWKS refresh failed: %s", exc)
+                delay = min(interval, _JWKS_MIN_REFRESH_SECONDS)
+            await asyncio.sleep(delay)
+
+
+async def _force_refresh(kid: Optional[str]) -> None:
+    """
+    Refresh the JWKS out of band for a kid that is not known yet.
+
+    Concurrent callers share one refresh through the lock, and refreshes are
+    debounced to one per _JWKS_MIN_REFRESH_SECONDS, so forged or rotated
+    kids cannot make every request refetch the key set.
+    """
+    async with _jwks_state.refresh_lock:
+        if kid in _jwks_state.signing_keys:
+            return  # refreshed by another request while waiting
+        now = time.monotonic()
+        last = _jwks_state.last_forced
+        if last is not None and now - last < _JWKS_MIN_REFRESH_SECONDS:
+            return
+        _jwks_state.last_forced = now
+        try:
+            async with httpx.AsyncClient(
+                timeout=get_settings().oidc.timeout
+            ) as client:
+                await refresh_jwks(client)
+        except Exception as exc:
+            logger.warning("Forced JWKS refresh failed: %s", exc)
+
+
+async def _signing_key(token: str) -> PyJWK:
+    """
+    Return the signing key for `token` from the locally held key set.
+
+    Raises:
+        ValueError: if the token header is malformed or its kid is unknown
+        HTTPException: 503 if no key set could be loaded at all
+    """
+    try:
+        kid = jwt.get_unverified_header(token).get("kid")
+    except jwt.PyJWTError as exc:
+        raise ValueError(f"Malformed token header: {exc}") from exc
+
+    key = _jwks_state.signing_keys.get(kid)
+    if key is None:
+        await _force_refresh(kid)
+        key = _jwks_state.signing_keys.get(kid)
+    if key is None:
+        if not _jwks_state.signing_keys:
+            logger.error("No JWKS signing keys loaded")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Token verification keys unavailable",
+            )
+        raise ValueError(f"Unknown signing key: {kid}")
+    return key
+
+
+# ---------------------------------------------------------------------
+# Core JWT validation
+# ---------------------------------------------------------------------
+
+
+# Leeway applied to exp/nbf (as JwtUser.from_token does)
+_CLAIMS_LEEWAY_SECONDS = 30
+
+
+def _precheck_claims(token: str, oidc: OidcSettings) -> None:
+    """
+    Reject mis-targeted or expired tokens before signature verification.
+
+    Only the unverified payload is read, so this never accepts a token;
+    everything is verified again together with the signature.
+
+    Raises:
+        ValueError: if the token is malformed or iss/aud/exp cannot match
+    """
+    try:
+        claims = jwt.decode(token, options={"verify_signature": False})
+    except jwt.PyJWTError as exc:
+        raise ValueError(f"Malformed token: {exc}") from exc
+
+    if claims.get("iss") != oidc.base_url:
+        raise ValueError("Unexpected token issuer")
+
+    expected = oidc.audience
+    if expected is not None:
+        aud = claims.get("aud")
+        # Single-string aud compared directly; lists probed without copying
+        if aud != expected and (isinstance(aud, str) or expected not in (aud or ())):
+            raise ValueError("Unexpected token audience")
+
+    exp = claims.get("exp")
+    if isinstance(exp, (int, float)) and exp < time.time() - _CLAIMS_LEEWAY_SECONDS:
+        raise ValueError("Token has expired")
+
 
 async def _decode_and_validate_token(token: str) -> JwtUser:
     """
-    Decode and validate JWT token using celine.sdk.auth.
+    Decode and validate a JWT against the locally held JWKS.
 
     Args:
         token: JWT token string
@@ -33,18 +218,58 @@ async def _decode_and_validate_token(token: str) -> JwtUser:
         JwtUser with validated claims
 
     Raises:
-        HTTPException: 401 if token is invalid
+        HTTPException: 401 if token is invalid, 503 if the JWKS is stale
     """
+    if _jwks_state.is_stale():
+        logger.error("JWKS has not been refreshed in 10x its max-age")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Token verification keys unavailable",
+        )
+
+    oidc = get_settings().oidc
     try:
-        # Use celine.sdk.auth.JwtUser for validation
-        user = JwtUser.from_token(
+        # Cheap claim checks first; the RSA verify only runs for plausible tokens
+        _precheck_claims(token, oidc)
+
+        # Keys come from the locally held JWKS; no fetch on the request path
+        # except one debounced refresh for an unknown kid
+        key = await _signing_key(token)
+        payload = jwt.decode(
             token,
-            oidc=get_settings().oidc,
+            key.key,
+            algorithms=[key.algorithm_name],
+            audience=oidc.audience,
+            issuer=oidc.base_url,
+            leeway=_CLAIMS_LEEWAY_SECONDS,
+            options={
+                "verify_exp": True,
+                "verify_aud": oidc.audience is not None,
+                "verify_nbf": True,
+            },
+        )
+        if not payload.get("sub"):
+            raise ValueError("JWT missing required 'sub' claim")
+
+        return JwtUser(
+            sub=payload["sub"],
+            email=payload.get("email"),
+            email_verified=payload.get("email_verified"),
+            name=payload.get("name"),
+            given_name=payload.get("given_name"),
+            family_name=payload.get("family_name"),
+            preferred_username=payload.get("preferred_username"),
+            iss=payload.get("iss"),
+            aud=payload.get("aud"),
+            exp=payload.get("exp"),
+            iat=payload.get("iat"),
+            claims=payload,
+            token=token,
         )
-        return user
 
-    except ValueError as exc:
-        # JwtUser raises ValueError for validation errors
+    except HTTPException:
+        raise
+    except (ValueError, jwt.PyJWTError) as exc:
         logger.debug("JWT validation failed: %s", exc)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -106,6 +331,44 @@ def _normalize_user(jwt_user: JwtUser, token: Optional[str]) -> AuthenticatedUse
     )
 
 
+# ---------------------------------------------------------------------
+# Validated-token cache
+# ---------------------------------------------------------------------
+
+# Upper bound on how long a verified token skips re-verification
+_USER_CACHE_MAX_TTL_SECONDS = 300
+
+# AuthenticatedUser per token fingerprint (the raw token is never a key)
+_user_cache: TTLCache[AuthenticatedUser] = TTLCache(maxsize=10_000)
+
+
+def _token_fingerprint(token: str) -> str:
+    return hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
+
+async def _authenticate(token: str) -> AuthenticatedUser:
+    """
+    Validate `token` and normalize its user, reusing recent results.
+
+    A token seen again within its lifetime (capped at a few minutes) skips
+    signature verification and claim normalization.
+    """
+    key = _token_fingerprint(token)
+    # A stale JWKS must still fail, so only consult the cache while fresh
+    if not _jwks_state.is_stale():
+        cached = _user_cache.get(key)
+        if cached is not None:
+            return cached
+
+    jwt_user = await _decode_and_validate_token(token)
+    user = _normalize_user(jwt_user, token=jwt_user.token)
+
+    ttl = token_ttl_seconds(user)
+    if ttl is not None:
+        _user_cache.set(key, user, min(ttl, _USER_CACHE_MAX_TTL_SECONDS))
+    return user
+
+
 # ---------------------------------------------------------------------
 # FastAPI Dependencies
 # ---------------------------------------------------------------------
@@ -128,8 +391,7 @@ async def get_optional_user(
     if credentials is None:
         return None
 
-    jwt_user = await _decode_and_validate_token(credentials.credentials)
-    return _normalize_user(jwt_user, token=jwt_user.token)
+    return await _authenticate(credentials.credentials)
 
 
 async def get_current_user(
@@ -149,5 +411,4 @@ async def get_current_user(
     Raises:
         HTTPException: 401 if authentication fails
     """
-    jwt_user = await _decode_and_validate_token(credentials.credentials)
-    return _normalize_user(jwt_user, token=jwt_user.token)
+    return await _authenticate(credentials.credentials)
@@ -17,10 +17,10 @@ class AccessLevel(str, Enum):
     def from_value(cls, value: str | None) -> "AccessLevel":
         if not value:
             return cls.OPEN
-        try:
-            return cls(value.lower())
-        except ValueError as exc:
-            raise ValueError(f"Invalid disclosure level: {value}") from exc
+        level = _LEVELS.get(value.lower())
+        if level is None:
+            raise ValueError(f"Invalid disclosure level: {value}")
+        return level
 
 
 ACCESS_LEVEL_MATRIX: dict[AccessLevel, AccessLevelPolicy] = {
@@ -29,6 +29,12 @@ ACCESS_LEVEL_MATRIX: dict[AccessLevel, AccessLevelPolicy] = {
     AccessLevel.RESTRICTED: AccessLevelPolicy(True, True),
 }
 
+# Plain dict lookups instead of Enum construction on every request
+_LEVELS: dict[str, AccessLevel] = {level.value: level for level in AccessLevel}
+_AUTH_REQUIRED: frozenset[AccessLevel] = frozenset(
+    level for level, policy in ACCESS_LEVEL_MATRIX.items() if policy.requires_auth
+)
+
 
 def requires_auth(access_level: str | None) -> bool:
     """
@@ -37,5 +43,4 @@ def requires_auth(access_level: str | None) -> bool:
     Used by API-layer dependencies to decide whether anonymous access
     is acceptable.
     """
-    level = AccessLevel.from_value(access_level)
-    return ACCESS_LEVEL_MATRIX[level].requires_auth
+    return AccessLevel.from_value(access_level) in _AUTH_REQUIRED
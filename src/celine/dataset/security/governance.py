@@ -7,24 +7,33 @@ the celine-sdk in-process policy engine instead of HTTP client.
 """
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
 import time
-from typing import Optional
+from typing import Iterable, Optional
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from celine.dataset.security.disclosure import AccessLevel, ACCESS_LEVEL_MATRIX
+from celine.dataset.security.disclosure import (
+    AccessLevel,
+    AccessLevelPolicy,
+    ACCESS_LEVEL_MATRIX,
+)
 from celine.dataset.db.models.dataset_entry import DatasetEntry
 from celine.dataset.security.models import AuthenticatedUser
 from celine.dataset.core.config import get_settings
+from celine.dataset.api.dataset_query.row_filters.cache import TTLCache
 from celine.sdk.auth.jwt import extract_groups, is_service_account
 
 # Import from celine-sdk (in-process policies)
 from celine.sdk.policies import (
     Action,
     CachedPolicyEngine,
+    Decision,
     PolicyEngine,
     PolicyEngineError,
     PolicyInput,
@@ -39,6 +48,45 @@ logger = logging.getLogger(__name__)
 # Global policy engine instance
 _policy_engine: Optional[CachedPolicyEngine] = None
 
+# Short-lived decision cache in front of the policy engine
+_decision_cache: TTLCache[Decision] = TTLCache(maxsize=10_000)
+
+# Dataset queries are read actions from this service: the action and the
+# stable part of the environment are shared and serialized once.
+_SOURCE_SERVICE = "dataset-api"
+_READ_ACTION = Action(name="read", context={})
+
+
+def _canonical_json(doc: object) -> bytes:
+    return json.dumps(
+        doc, sort_keys=True, separators=(",", ":"), default=str
+    ).encode("utf-8")
+
+
+_CONSTANT_KEY_FRAGMENT = _canonical_json(
+    {
+        "action": _READ_ACTION.model_dump(mode="json"),
+        "source_service": _SOURCE_SERVICE,
+    }
+)
+
+
+_ANONYMOUS_KEY = _canonical_json(None)
+
+# Stored access_level value -> policy in one lookup ("" maps to OPEN, as in
+# AccessLevel.from_value)
+_POLICY_BY_LEVEL: dict[str, AccessLevelPolicy] = {
+    "": ACCESS_LEVEL_MATRIX[AccessLevel.OPEN],
+    **{level.value: policy for level, policy in ACCESS_LEVEL_MATRIX.items()},
+}
+
+# Stored access_level values that need no checks at all
+_OPEN_LEVELS: frozenset[str] = frozenset(
+    value
+    for value, policy in _POLICY_BY_LEVEL.items()
+    if not (policy.requires_auth or policy.requires_policy)
+)
+
 
 def _get_policy_engine() -> Optional[CachedPolicyEngine]:
     """
@@ -80,6 +128,24 @@ def _get_policy_engine() -> Optional[CachedPolicyEngine]:
     return _policy_engine
 
 
+async def init_policy_engine() -> None:
+    """
+    Load the policy engine at application startup.
+
+    Policy files are read in a worker thread so startup does not block the
+    event loop, and the first request no longer pays the load. Requests still
+    retry initialization lazily if the engine is reset.
+
+    Raises:
+        RuntimeError: if policies are enabled but the engine failed to load
+    """
+    if not get_settings().policies_check_enabled:
+        return
+
+    if await asyncio.to_thread(_get_policy_engine) is None:
+        raise RuntimeError("Policy engine failed to initialize at startup")
+
+
 def _build_subject_from_user(user: Optional[AuthenticatedUser]) -> Subject:
     """
     Build Subject from AuthenticatedUser.
@@ -115,6 +181,48 @@ def _build_subject_from_user(user: Optional[AuthenticatedUser]) -> Subject:
         claims=user.claims,
     )
 
+
+def _policy_subject(user: AuthenticatedUser) -> tuple[Subject, bytes]:
+    """
+    Return the policy Subject for a user and its serialized key fragment.
+
+    AuthenticatedUser is frozen and reused across requests with the same
+    token, so both are computed on first use and kept on the user.
+    """
+    subject = user._policy_subject
+    key = user._policy_key
+    if subject is None or key is None:
+        subject = _build_subject_from_user(user)
+        key = _canonical_json({"sub": user.sub, "claims": user.claims})
+        user._policy_subject = subject
+        user._policy_key = key
+    return subject, key
+
+
+def _decision_cache_key(
+    entry: DatasetEntry,
+    resource_attributes: dict,
+    user: Optional[AuthenticatedUser],
+) -> str:
+    """
+    Build the decision cache key for a dataset check.
+
+    The key is (dataset_id, access_level, subject id, digest of the policy
+    inputs). The subject is a pure function of the user's ``sub`` and claims,
+    so their serialized form (kept on the user) is hashed directly and a cache
+    hit never builds the Resource/PolicyInput models. The request timestamp is
+    excluded so repeated identical checks hit the cache.
+    """
+    h = hashlib.blake2b(_CONSTANT_KEY_FRAGMENT, digest_size=16)
+    h.update(
+        _canonical_json({"id": entry.dataset_id, "attributes": resource_attributes})
+    )
+    h.update(_policy_subject(user)[1] if user else _ANONYMOUS_KEY)
+    digest = h.hexdigest()
+    sub = user.sub if user else "anonymous"
+    return f"{entry.dataset_id}|{entry.access_level}|{sub}|{digest}"
+
+
 async def enforce_dataset_access(
     *,
     entry: DatasetEntry,
@@ -127,22 +235,22 @@ async def enforce_dataset_access(
     1. Check if authentication is required
     2. Evaluate authorization policy if required
 
+    Only attributes already loaded on ``entry`` are read, so callers should
+    release their catalogue session before awaiting this check.
+
     Raises:
         HTTPException: 401 if auth required but missing, 403 if policy denies,
                       503 if policy service unavailable
     """
 
-    # Parse access level
-    try:
-        level = AccessLevel.from_value(entry.access_level)
-    except ValueError as exc:
+    # Resolve the access level policy
+    policy = _POLICY_BY_LEVEL.get((entry.access_level or "").lower())
+    if policy is None:
         logger.warning(f"Failed to parse access_level={entry.access_level}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Invalid dataset access level configuration",
-        ) from exc
-
-    policy = ACCESS_LEVEL_MATRIX[level]
+        )
 
     # Step 1 — Authentication check
     if policy.requires_auth and user is None:
@@ -179,46 +287,48 @@ async def enforce_dataset_access(
             "backend_type": entry.backend_type,
         }
 
-        # Add namespace if available
-        if entry.lineage:
-            namespace = entry.lineage.get("namespace")
+        # Add namespace and public governance keys if available
+        lineage = entry.lineage
+        if lineage:
+            namespace = lineage.get("namespace")
             if namespace:
                 resource_attributes["namespace"] = namespace
 
-        if entry.lineage:
-            governance = entry.lineage.get("facets", {}).get("governance")
+            governance = lineage.get("facets", {}).get("governance")
             if governance:
                 resource_attributes["governance"] = {
                     k: v for k, v in governance.items() if not k.startswith("_")
                 }
 
-        # Build subject
-        subject = _build_subject_from_user(user)
-
-        # Build policy input
-        policy_input = PolicyInput(
-            subject=subject,
-            resource=Resource(
-                type=ResourceType.DATASET,
-                id=entry.dataset_id,
-                attributes=resource_attributes,
-            ),
-            action=Action(
-                name="read",  # Dataset query is a read action
-                context={},
-            ),
-            environment={
-                "timestamp": time.time(),
-                "source_service": "dataset-api",
-            },
-        )
-
-        # Evaluate policy
+        # Evaluate policy (short-TTL cache first, live evaluation on miss)
+        cache_key = _decision_cache_key(entry, resource_attributes, user)
         try:
-            decision = engine.evaluate_decision(
-                policy_package=get_settings().policies_package,
-                policy_input=policy_input,
-            )
+            decision = _decision_cache.get(cache_key)
+            if decision is not None:
+                decision = decision.model_copy(update={"cached": True})
+            else:
+                policy_input = PolicyInput(
+                    subject=(
+                        _policy_subject(user)[0] if user else Subject.anonymous()
+                    ),
+                    resource=Resource(
+                        type=ResourceType.DATASET,
+                        id=entry.dataset_id,
+                        attributes=resource_attributes,
+                    ),
+                    action=_READ_ACTION,
+                    environment={
+                        "timestamp": time.time(),
+                        "source_service": _SOURCE_SERVICE,
+                    },
+                )
+                decision = engine.evaluate_decision(
+                    policy_package=get_settings().policies_package,
+                    policy_input=policy_input,
+                )
+                _decision_cache.set(
+                    cache_key, decision, ttl_seconds=get_settings().opa_cache_ttl
+                )
 
             if not decision.allowed:
                 logger.info(
@@ -237,18 +347,20 @@ async def enforce_dataset_access(
                     detail=decision.reason or "Access denied by policy",
                 )
 
-            # Log based on cache status
+            # Log based on cache status; the extra dicts are only built when
+            # the level is enabled
             if decision.cached:
-                logger.debug(
-                    "Access allowed by policy (cached) for dataset %s",
-                    entry.dataset_id,
-                    extra={
-                        "user": user.sub if user else "anonymous",
-                        "dataset_id": entry.dataset_id,
-                        "cached": True,
-                    },
-                )
-            else:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Access allowed by policy (cached) for dataset %s",
+                        entry.dataset_id,
+                        extra={
+                            "user": user.sub if user else "anonymous",
+                            "dataset_id": entry.dataset_id,
+                            "cached": True,
+                        },
+                    )
+            elif logger.isEnabledFor(logging.INFO):
                 logger.info(
                     "Access allowed by policy for dataset %s: %s",
                     entry.dataset_id,
@@ -286,6 +398,44 @@ async def enforce_dataset_access(
             ) from e
 
 
+async def enforce_many(
+    entries: Iterable[DatasetEntry],
+    user: Optional[AuthenticatedUser],
+) -> None:
+    """
+    Enforce dataset access for several entries concurrently.
+
+    Entries are deduplicated by dataset_id, open datasets are skipped, and the
+    rest are checked with at most ``policies_concurrency`` evaluations in
+    flight.
+
+    Raises:
+        HTTPException: the first failure, as raised by enforce_dataset_access
+    """
+    # Open datasets need neither authentication nor a policy decision; they are
+    # dropped here so mixed queries only schedule checks that do work.
+    # Invalid levels are kept so enforce_dataset_access reports them.
+    unique = {
+        e.dataset_id: e
+        for e in entries
+        if (e.access_level or "").lower() not in _OPEN_LEVELS
+    }
+    if not unique:
+        return
+    if len(unique) == 1:
+        (entry,) = unique.values()
+        await enforce_dataset_access(entry=entry, user=user)
+        return
+
+    semaphore = asyncio.Semaphore(max(1, get_settings().policies_concurrency))
+
+    async def _check(entry: DatasetEntry) -> None:
+        async with semaphore:
+            await enforce_dataset_access(entry=entry, user=user)
+
+    await asyncio.gather(*(_check(e) for e in unique.values()))
+
+
 async def resolve_datasets_for_tables(
     *,
     db: AsyncSession,
@@ -312,23 +462,28 @@ async def resolve_datasets_for_tables(
     # 1. Exact match — fast path (covers postgres-exported 2-part IDs)
     stmt = select(DatasetEntry).where(DatasetEntry.dataset_id.in_(table_names))
     res = await db.execute(stmt)
-    entries = res.scalars().all()
-    by_id = {e.dataset_id: e for e in entries}
+    by_id = {e.dataset_id: e for e in res.scalars()}
 
     # 2. Suffix fallback for 2-part SQL refs vs 3-part OpenLineage catalogue IDs
     # e.g. SQL ref "ds_dev_gold.meters_data_15m" matches catalogue
-    # "datasets.ds_dev_gold.meters_data_15m"
-    missing = table_names - by_id.keys()
-    for ref in list(missing):
-        if ref.count(".") == 1:
-            stmt2 = select(DatasetEntry).where(
-                DatasetEntry.dataset_id.like(f"%.{ref}")
+    # "datasets.ds_dev_gold.meters_data_15m". All 2-part refs are resolved
+    # with a single query; an ID matches when its last two components do.
+    missing = table_names.difference(by_id)
+    two_part = {ref for ref in missing if ref.count(".") == 1}
+    if two_part:
+        stmt2 = (
+            select(DatasetEntry)
+            .where(
+                or_(*(DatasetEntry.dataset_id.like(f"%.{ref}") for ref in two_part))
             )
-            res2 = await db.execute(stmt2)
-            found = res2.scalars().first()
-            if found:
+            .order_by(DatasetEntry.id)
+        )
+        res2 = await db.execute(stmt2)
+        for found in res2.scalars():
+            ref = ".".join(found.dataset_id.rsplit(".", 2)[-2:])
+            if ref in two_part and ref not in by_id:
                 by_id[ref] = found
-                missing = missing - {ref}
+        missing.difference_update(by_id)
 
     if missing:
         logger.warning(
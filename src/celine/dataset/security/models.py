@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr
 
 
 class AuthenticatedUser(BaseModel):
@@ -30,6 +30,11 @@ class AuthenticatedUser(BaseModel):
 
     token: Optional[str] = Field(default=None, exclude=True)
 
+    # Policy subject and its cache-key fragment, derived once from the
+    # immutable fields above by the governance layer
+    _policy_subject: Any = PrivateAttr(default=None)
+    _policy_key: Optional[bytes] = PrivateAttr(default=None)
+
     model_config = ConfigDict(
         frozen=True,
         extra="ignore",
@@ -1,14 +1,40 @@
+import hashlib
 import logging
-from typing import Any, Dict, Optional, List
-from dataclasses import asdict, dataclass
+from typing import Any, Optional, List
+from dataclasses import dataclass
 import httpx
+import orjson
 
-from celine.dataset.api.catalogue.models import DatasetEntry
+from celine.dataset.db.models.dataset_entry import DatasetEntry
+from celine.dataset.api.dataset_query.row_filters.cache import TTLCache
+from celine.dataset.core.config import get_settings
 from celine.dataset.security.disclosure import AccessLevel
 from celine.dataset.security.models import AuthenticatedUser
 
 logger = logging.getLogger(__name__)
 
+# Short-lived allow/deny cache keyed by a digest of the OPA input document
+_opa_cache: TTLCache[bool] = TTLCache(maxsize=10_000)
+
+# Shared connection pool for OPA calls, reused across OPAClient instances
+_CLIENT: Optional[httpx.AsyncClient] = None
+_CLIENT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+
+def get_client() -> httpx.AsyncClient:
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(timeout=5.0, limits=_CLIENT_LIMITS)
+    return _CLIENT
+
+
+async def close_client() -> None:
+    """Close the shared client (called on application shutdown)."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
 
 @dataclass(frozen=True)
 class DatasetOPAInput:
@@ -32,8 +58,20 @@ class OPAInput:
     subject: SubjectOPAInput | None
 
 
-def _get_opa_payload(input_obj: OPAInput) -> Dict[str, Any]:
-    return {"input": asdict(input_obj)}
+def _serialize_payload(input_obj: OPAInput) -> bytes:
+    """
+    Canonical JSON body, used both as request content and cache key input.
+
+    orjson encodes the frozen dataclasses (and AccessLevel) natively, in field
+    declaration order, without an intermediate ``asdict`` copy.
+    """
+    return orjson.dumps({"input": input_obj})
+
+
+def _opa_cache_key(input_obj: OPAInput, body: bytes) -> str:
+    digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+    sub = input_obj.subject.sub if input_obj.subject else "anonymous"
+    return f"{input_obj.dataset.id}|{input_obj.dataset.access_level.value}|{sub}|{digest}"
 
 
 def _build_opa_input(*, dataset: DatasetEntry, user: AuthenticatedUser | None):
@@ -60,21 +98,30 @@ def _build_opa_input(*, dataset: DatasetEntry, user: AuthenticatedUser | None):
 class OPAClient:
     def __init__(self, base_url: str, policy_path: str):
         self._url = f"{base_url.rstrip('/')}/v1/data/{policy_path.lstrip('/')}"
-        logger.debug(f"OPA URL {self._url}")
+        logger.debug("OPA URL %s", self._url)
 
     async def evaluate(
         self, dataset: DatasetEntry, user: AuthenticatedUser | None
     ) -> bool | None:
-        payload = _get_opa_payload(_build_opa_input(dataset=dataset, user=user))
+        input_obj = _build_opa_input(dataset=dataset, user=user)
+        body = _serialize_payload(input_obj)
+
+        cache_key = _opa_cache_key(input_obj, body)
+        cached = _opa_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("OPA cached result is %s for %s", cached, body)
+            return cached
 
         resp = None
         data = {"result": False}
         try:
-
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                resp = await client.post(self._url, json=payload)
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await get_client().post(
+                self._url,
+                content=body,
+                headers={"content-type": "application/json"},
+            )
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
 
         except httpx.HTTPStatusError as e:
             logger.error(
@@ -107,5 +154,7 @@ class OPAClient:
             logger.warning(f"OPA response format error, 'allow' is not bool: {allow}")
             return None
 
-        logger.debug(f"OPA result is {allow} for {payload}")
+        _opa_cache.set(cache_key, allow, ttl_seconds=get_settings().opa_cache_ttl)
+
+        logger.debug("OPA result is %s for %s", allow, body)
         return allow
@@ -0,0 +1,162 @@
+import sqlglot
+from sqlglot import exp
+
+from celine.dataset.api.dataset_query.row_filters.apply import apply_row_filter_plans
+from celine.dataset.api.dataset_query.row_filters.handlers import TablePointerHandler
+from celine.dataset.api.dataset_query.row_filters.models import RowFilterPlan
+from celine.dataset.security.models import AuthenticatedUser
+
+
+def _in_plan(table: str, column: str, values: list[str]) -> RowFilterPlan:
+    return RowFilterPlan(
+        table=table,
+        kind="predicate",
+        predicate_template=exp.In(
+            this=exp.Column(this=exp.Identifier(this=column, quoted=False)),
+            expressions=[exp.Literal.string(v) for v in values],
+        ),
+    )
+
+
+def test_predicate_is_qualified_with_alias():
+    ast = sqlglot.parse_one("SELECT * FROM meters AS m WHERE m.value > 1")
+    out = apply_row_filter_plans(ast, [_in_plan("meters", "sensor_id", ["a", "b"])])
+    assert out.sql() == (
+        "SELECT * FROM meters AS m WHERE m.value > 1 AND m.sensor_id IN ('a', 'b')"
+    )
+
+
+def test_predicate_applied_per_select():
+    ast = sqlglot.parse_one(
+        "SELECT * FROM (SELECT * FROM meters) AS q JOIN meters AS m2 ON q.id = m2.id"
+    )
+    out = apply_row_filter_plans(ast, [_in_plan("meters", "sensor_id", ["a"])])
+    sql = out.sql()
+    assert "WHERE meters.sensor_id IN ('a')" in sql
+    assert "WHERE m2.sensor_id IN ('a')" in sql
+
+
+def test_repeated_application_does_not_share_nodes():
+    plan = _in_plan("meters", "sensor_id", ["a"])
+    first = apply_row_filter_plans(sqlglot.parse_one("SELECT * FROM meters"), [plan])
+    second = apply_row_filter_plans(sqlglot.parse_one("SELECT * FROM meters"), [plan])
+    assert first.sql() == second.sql()
+    assert first.find(exp.In) is not second.find(exp.In)
+
+
+def test_same_alias_in_nested_selects_gets_separate_predicates():
+    plan = _in_plan("meters", "sensor_id", ["a"])
+    ast = sqlglot.parse_one(
+        "SELECT * FROM meters WHERE id IN (SELECT id FROM meters)"
+    )
+    out = apply_row_filter_plans(ast, [plan])
+    preds = [e for e in out.find_all(exp.In) if e.this.name == "sensor_id"]
+    assert len(preds) == 2
+    assert preds[0] is not preds[1]
+    assert preds[0].sql() == preds[1].sql() == "meters.sensor_id IN ('a')"
+    assert plan.predicate_template.sql() == "sensor_id IN ('a')"
+
+
+def test_deny_plan_injects_false():
+    ast = sqlglot.parse_one("SELECT * FROM meters WHERE value > 1")
+    plans = [_in_plan("meters", "sensor_id", ["a"]), RowFilterPlan(table="meters", kind="deny")]
+    out = apply_row_filter_plans(ast, plans)
+    assert out.sql() == "SELECT * FROM meters WHERE value > 1 AND FALSE"
+
+
+def test_input_ast_is_not_modified():
+    ast = sqlglot.parse_one("SELECT * FROM meters")
+    apply_row_filter_plans(ast, [_in_plan("meters", "sensor_id", ["a"])])
+    assert ast.sql() == "SELECT * FROM meters"
+
+
+def test_cte_and_subquery_tables_belong_to_their_own_select():
+    ast = sqlglot.parse_one(
+        "WITH c AS (SELECT * FROM meters) "
+        "SELECT * FROM c WHERE c.id IN (SELECT id FROM meters AS inner_m)"
+    )
+    out = apply_row_filter_plans(ast, [_in_plan("meters", "sensor_id", ["a"])])
+    sql = out.sql()
+    assert "FROM meters WHERE meters.sensor_id IN ('a')" in sql
+    assert "FROM meters AS inner_m WHERE inner_m.sensor_id IN ('a')" in sql
+    assert sql.count("sensor_id") == 2
+
+
+def test_copy_false_rewrites_in_place():
+    ast = sqlglot.parse_one("SELECT * FROM meters")
+    out = apply_row_filter_plans(ast, [RowFilterPlan(table="meters", kind="deny")], copy=False)
+    assert out is ast
+    assert ast.sql() == "SELECT * FROM meters WHERE FALSE"
+
+
+async def test_table_pointer_subquery_keeps_pointer_columns():
+    plan = await TablePointerHandler().resolve(
+        table="meters",
+        user=AuthenticatedUser(sub="u1"),
+        args={
+            "column": "sensor_id",
+            "pointer_table": "acl.meter_owners",
+            "pointer_key_column": "sensor_id",
+        },
+    )
+
+    ast = sqlglot.parse_one("SELECT * FROM meters AS m")
+    out = apply_row_filter_plans(ast, [plan])
+    assert out.sql() == (
+        "SELECT * FROM meters AS m WHERE m.sensor_id IN "
+        "(SELECT acl.meter_owners.sensor_id FROM acl.meter_owners "
+        "WHERE acl.meter_owners.user_id = 'u1')"
+    )
+
+
+def test_in_lists_on_same_column_are_intersected():
+    ast = sqlglot.parse_one("SELECT * FROM meters AS m")
+    plans = [
+        _in_plan("meters", "sensor_id", ["a", "b", "c"]),
+        _in_plan("meters", "owner", ["x"]),
+        _in_plan("meters", "sensor_id", ["c", "b", "d"]),
+    ]
+
+    out = apply_row_filter_plans(ast, plans)
+    assert out.sql() == (
+        "SELECT * FROM meters AS m WHERE m.sensor_id IN ('b', 'c') AND m.owner IN ('x')"
+    )
+
+
+def test_disjoint_in_lists_match_nothing():
+    ast = sqlglot.parse_one("SELECT * FROM meters AS m")
+    plans = [
+        _in_plan("meters", "sensor_id", ["a"]),
+        _in_plan("meters", "sensor_id", ["b"]),
+    ]
+
+    out = apply_row_filter_plans(ast, plans)
+    assert out.sql() == "SELECT * FROM meters AS m WHERE FALSE"
+
+
+def test_in_lists_with_different_literal_kinds_are_not_merged():
+    ast = sqlglot.parse_one("SELECT * FROM meters AS m")
+    plans = [
+        _in_plan("meters", "uid", ["42"]),
+        RowFilterPlan(
+            table="meters",
+            kind="predicate",
+            predicate_template=exp.In(
+                this=exp.Column(this=exp.Identifier(this="uid", quoted=False)),
+                expressions=[exp.Literal.number(42)],
+            ),
+        ),
+    ]
+
+    out = apply_row_filter_plans(ast, plans)
+    assert out.sql() == (
+        "SELECT * FROM meters AS m WHERE m.uid IN ('42') AND m.uid IN (42)"
+    )
+
+
+def test_plans_are_slotted_and_picklable():
+    import pickle
+
+    plan = _in_plan("meters", "sensor_id", ["a"])
+    assert not hasattr(plan, "__dict__")
+    assert pickle.loads(pickle.dumps(plan)) == plan
@@ -0,0 +1,35 @@
+from celine.dataset.api.dataset_query.row_filters import cache as cache_mod
+from celine.dataset.api.dataset_query.row_filters.cache import TTLCache
+
+
+def test_full_cache_drops_expired_then_oldest(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_mod.time, "time", lambda: now[0])
+
+    c: TTLCache[int] = TTLCache(maxsize=3)
+    c.set("a", 1, ttl_seconds=10)
+    c.set("b", 2, ttl_seconds=10)
+    now[0] += 5
+    c.set("c", 3, ttl_seconds=10)
+
+    # "a" and "b" expired: both are dropped from the front
+    now[0] += 6
+    c.set("d", 4, ttl_seconds=10)
+    assert c._store.keys() == {"c", "d"}
+
+    # nothing expired: the oldest write is evicted
+    c.set("e", 5, ttl_seconds=10)
+    c.set("f", 6, ttl_seconds=10)
+    assert list(c._store) == ["d", "e", "f"]
+
+
+def test_rewrite_moves_key_to_the_back(monkeypatch):
+    c: TTLCache[int] = TTLCache(maxsize=2)
+    c.set("a", 1, ttl_seconds=10)
+    c.set("b", 2, ttl_seconds=10)
+    c.set("a", 3, ttl_seconds=10)
+    c.set("c", 4, ttl_seconds=10)
+
+    assert c.get("b") is None
+    assert c.get("a") == 3
+    assert c.get("c") == 4
@@ -0,0 +1,236 @@
+from typing import Any
+
+import httpx
+import pytest
+import sqlglot
+from sqlglot import exp
+
+from celine.dataset.api.dataset_query.row_filters.apply import apply_row_filter_plans
+from celine.dataset.api.dataset_query.row_filters.cache import TTLCache
+from celine.dataset.api.dataset_query.row_filters.handlers import http_in_list
+from celine.dataset.api.dataset_query.row_filters.models import RowFilterPlan
+from celine.dataset.api.dataset_query.row_filters.utils import column_node, literal_nodes
+from celine.dataset.security.models import AuthenticatedUser
+
+
+def test_extract_path():
+    payload = {"data": {"items": ["a", "b"], "empty": [], "none": None}}
+
+    assert http_in_list._extract_path(payload, "$") is payload
+    assert http_in_list._extract_path(payload, None) is payload
+    assert http_in_list._extract_path(payload, "data.items") == ["a", "b"]
+    assert http_in_list._extract_path(payload, "data.empty") == []
+    assert http_in_list._extract_path(payload, "data.none") is None
+    assert http_in_list._extract_path(payload, "data.items.x") is None
+    assert http_in_list._extract_path(payload, "missing.items") is None
+
+
+def test_path_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(http_in_list, "_PATH_CACHE", {})
+    monkeypatch.setattr(http_in_list, "_PATH_CACHE_MAX", 2)
+
+    for path in ("a.b", "c.d", "e.f"):
+        http_in_list._extract_path({}, path)
+
+    assert list(http_in_list._PATH_CACHE) == ["e.f"]
+
+
+def test_long_lists_use_values_subquery():
+    literals = literal_nodes(["a", "b"])
+    predicate = exp.In(
+        this=column_node("sensor_id"), query=http_in_list._in_values_query(literals)
+    )
+
+    expected = (
+        "sensor_id IN (SELECT _in_values.v FROM (VALUES ('a'), ('b')) "
+        "AS _in_values(v))"
+    )
+    assert predicate.sql(dialect="postgres") == expected
+    assert predicate.sql(dialect="duckdb") == expected
+
+    ast = sqlglot.parse_one("SELECT * FROM meters AS m")
+    plan = RowFilterPlan(table="meters", kind="predicate", predicate_template=predicate)
+    out = apply_row_filter_plans(ast, [plan])
+    assert out.sql() == f"SELECT * FROM meters AS m WHERE m.{expected}"
+
+
+class _Upstream:
+    def __init__(self) -> None:
+        self.json: Any = None
+        self.etag: str | None = None
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.etag is None:
+            return httpx.Response(200, json=self.json)
+        if request.headers.get("if-none-match") == self.etag:
+            return httpx.Response(304)
+        return httpx.Response(200, json=self.json, headers={"etag": self.etag})
+
+
+@pytest.fixture
+def upstream(monkeypatch) -> _Upstream:
+    """Route the shared client to an in-memory upstream."""
+    fake = _Upstream()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(fake))
+    monkeypatch.setattr(http_in_list, "_CLIENT", client)
+    monkeypatch.setattr(http_in_list, "_validators", TTLCache(maxsize=100))
+    return fake
+
+
+def _user() -> AuthenticatedUser:
+    return AuthenticatedUser(sub="user-123", username="alice", claims={"sub": "user-123"})
+
+
+@pytest.mark.asyncio
+async def test_resolve_reuses_shared_client(upstream):
+    upstream.json = {"data": ["a", "b"]}
+    handler = http_in_list.HttpInListHandler()
+    args = {
+        "column": "sensor_id",
+        "url": "http://upstream/items",
+        "params": {"owner": "{sub}"},
+        "response_path": "data",
+    }
+
+    plans = [
+        await handler.resolve(table="meters", user=_user(), args=args)
+        for _ in range(2)
+    ]
+
+    assert http_in_list.get_client() is http_in_list._CLIENT
+    assert [str(r.url) for r in upstream.requests] == [
+        "http://upstream/items?owner=user-123"
+    ] * 2
+    assert plans[0].predicate_template.sql() == "sensor_id IN ('a', 'b')"
+
+
+@pytest.mark.asyncio
+async def test_values_subquery_is_opt_in(upstream):
+    upstream.json = [f"id-{i}" for i in range(100)]
+    handler = http_in_list.HttpInListHandler()
+    args = {"column": "sensor_id", "url": "http://upstream/items"}
+
+    plan = await handler.resolve(table="meters", user=_user(), args=args)
+    assert plan.predicate_template.args.get("query") is None
+    assert len(plan.predicate_template.expressions) == 100
+
+    args = {**args, "url": "http://upstream/other", "values_threshold": 64}
+    plan = await handler.resolve(table="meters", user=_user(), args=args)
+    assert plan.predicate_template.args.get("query") is not None
+
+
+@pytest.mark.asyncio
+async def test_resolve_empty_list_denies(upstream):
+    upstream.json = []
+    handler = http_in_list.HttpInListHandler()
+
+    plan = await handler.resolve(
+        table="meters",
+        user=_user(),
+        args={"column": "sensor_id", "url": "http://upstream/items"},
+    )
+
+    assert plan.kind == "deny"
+
+
+@pytest.mark.asyncio
+async def test_resolve_revalidates_with_etag(upstream):
+    upstream.json = ["a"]
+    upstream.etag = '"v1"'
+    handler = http_in_list.HttpInListHandler()
+    args = {"column": "sensor_id", "url": "http://upstream/items"}
+
+    first = await handler.resolve(table="meters", user=_user(), args=args)
+    second = await handler.resolve(table="meters", user=_user(), args=args)
+
+    assert second is first
+    assert "if-none-match" not in upstream.requests[0].headers
+    assert upstream.requests[1].headers["if-none-match"] == '"v1"'
+
+    upstream.etag = '"v2"'
+    upstream.json = ["b"]
+    third = await handler.resolve(table="meters", user=_user(), args=args)
+    assert third.predicate_template.sql() == "sensor_id IN ('b')"
+
+
+def test_format_obj_matches_str_format():
+    user = AuthenticatedUser(sub="u-1", username="alice", claims={})
+    templates = [
+        "plain",
+        "{sub}",
+        "owner={sub}&name={username}&mail={email}",
+        "{{literal}} {sub}",
+        "{sub!r}",
+        "{username:>8}",
+    ]
+    values = {"sub": "u-1", "username": "alice", "email": "", "token": ""}
+
+    formatted = http_in_list._format_obj({"h": templates, "n": 1}, user)
+
+    assert formatted == {"h": [t.format(**values) for t in templates], "n": 1}
+
+
+def test_format_obj_keeps_format_errors():
+    user = AuthenticatedUser(sub="u-1", claims={})
+
+    with pytest.raises(KeyError):
+        http_in_list._format_obj("{unknown}", user)
+    with pytest.raises(ValueError):
+        http_in_list._format_obj("{sub", user)
+
+
+@pytest.mark.asyncio
+async def test_resolve_streams_large_responses(upstream):
+    upstream.json = {"meta": {"note": "x" * 20_000}, "data": {"ids": [*range(10), None]}}
+    handler = http_in_list.HttpInListHandler()
+    args = {
+        "column": "sensor_id",
+        "url": "http://upstream/items",
+        "response_path": "data.ids",
+        "max_items": 3,
+    }
+
+    plan = await handler.resolve(table="meters", user=_user(), args=args)
+
+    assert plan.predicate_template.sql() == "sensor_id IN (0, 1, 2)"
+    assert plan.meta["items"] == 3
+
+
+@pytest.mark.asyncio
+async def test_stream_items_skips_nulls_and_missing_paths():
+    body = b'{"a": {"b": [1.5, null, "x"]}}'
+
+    resp = httpx.Response(200, content=body)
+    assert await http_in_list._stream_items(resp, "a.b", 10) == [1.5, "x"]
+
+    resp = httpx.Response(200, content=body)
+    assert await http_in_list._stream_items(resp, "a.c", 10) == []
+
+    resp = httpx.Response(200, content=b"[1, 2]")
+    assert await http_in_list._stream_items(resp, "$", 10) == [1, 2]
+
+
+def test_items_at_path_stops_at_cap():
+    def items():
+        yield None
+        yield from range(5)
+        raise AssertionError("read past max_items")
+
+    class _Lazy(list):
+        def __iter__(self):
+            return items()
+
+    payload = {"data": _Lazy()}
+    assert http_in_list._items_at_path(payload, "data", 3) == [0, 1, 2]
+    assert http_in_list._items_at_path({"data": "a"}, "data", 3) == ["a"]
+    assert http_in_list._items_at_path({}, "data", 3) == []
+
+
+def test_decode_json_accepts_any_json_content_type():
+    resp = httpx.Response(200, json={"a": [1]})
+    assert http_in_list._decode_json(resp) == {"a": [1]}
+
+    resp = httpx.Response(200, content=b'{"a": [1]}', headers={"content-type": "text/plain"})
+    assert http_in_list._decode_json(resp) == {"a": [1]}
@@ -0,0 +1,89 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from celine.dataset.api.dataset_query.row_filters.cache import TTLCache
+from celine.dataset.api.dataset_query.row_filters.models import RowFilterPlan
+from celine.dataset.api.dataset_query.row_filters.registry import RowFilterRegistry
+from celine.dataset.security.models import AuthenticatedUser
+
+
+class _SlowHandler:
+    name = "slow"
+
+    def __init__(self, fail: bool = False):
+        self.calls = 0
+        self.fail = fail
+        self.release = asyncio.Event()
+
+    async def resolve(self, *, table: str, user: Any, args: dict, request_context=None):
+        self.calls += 1
+        await self.release.wait()
+        if self.fail:
+            raise RuntimeError("upstream down")
+        return RowFilterPlan(table=table, kind="predicate")
+
+
+def _registry(handler) -> RowFilterRegistry:
+    return RowFilterRegistry(handlers={handler.name: handler}, cache=TTLCache(maxsize=16))
+
+
+async def _resolve_many(reg: RowFilterRegistry, n: int):
+    user = AuthenticatedUser(sub="u1")
+    tasks = [
+        asyncio.create_task(
+            reg.resolve_with_cache(handler_name="slow", table="t", user=user, args={})
+        )
+        for _ in range(n)
+    ]
+    await asyncio.sleep(0)
+    return tasks
+
+
+async def test_concurrent_misses_share_one_resolution():
+    handler = _SlowHandler()
+    reg = _registry(handler)
+
+    tasks = await _resolve_many(reg, 5)
+    handler.release.set()
+    plans = await asyncio.gather(*tasks)
+
+    assert handler.calls == 1
+    assert all(p is plans[0] for p in plans)
+    assert reg._inflight == {}
+
+
+async def test_failure_propagates_to_followers_and_is_not_cached():
+    handler = _SlowHandler(fail=True)
+    reg = _registry(handler)
+
+    tasks = await _resolve_many(reg, 3)
+    handler.release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert handler.calls == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert reg._inflight == {}
+
+    handler.fail = False
+    user = AuthenticatedUser(sub="u1")
+    plan = await reg.resolve_with_cache(handler_name="slow", table="t", user=user, args={})
+    assert plan.kind == "predicate"
+    assert handler.calls == 2
+
+
+async def test_cancelled_leader_hands_over_to_follower():
+    handler = _SlowHandler()
+    reg = _registry(handler)
+
+    leader, follower = await _resolve_many(reg, 2)
+    leader.cancel()
+    await asyncio.sleep(0)
+    handler.release.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    plan = await follower
+    assert plan.kind == "predicate"
+    assert handler.calls == 2
@@ -0,0 +1,57 @@
+from types import SimpleNamespace
+
+import pytest
+
+from celine.dataset.api.dataset_query.row_filters.specs import (
+    args_hash,
+    get_row_filter_specs,
+)
+
+
+def _entry(governance: dict) -> SimpleNamespace:
+    return SimpleNamespace(
+        dataset_id="ds", lineage={"facets": {"governance": governance}}
+    )
+
+
+def test_args_hash_ignores_key_order():
+    a = {"column": "c", "params": {"x": 1, "y": [1, 2]}}
+    b = {"params": {"y": [1, 2], "x": 1}, "column": "c"}
+    assert args_hash(a) == args_hash(b)
+    assert args_hash(a) != args_hash({**a, "column": "d"})
+
+
+def test_specs_carry_args_hash_without_mutating_lineage():
+    rule = {"handler": "http_in_list", "args": {"column": "c", "url": "u"}}
+    entry = _entry({"rowFilters": [rule], "userFilterColumn": "owner"})
+
+    specs = get_row_filter_specs(entry)
+
+    assert [s["_args_hash"] for s in specs] == [
+        args_hash(rule["args"]),
+        args_hash({"column": "owner"}),
+    ]
+    assert "_args_hash" not in rule
+
+
+def test_specs_are_memoized_and_read_only():
+    gov = {"rowFilters": [{"handler": "direct_user_match", "args": {"column": "c"}}]}
+
+    first = get_row_filter_specs(_entry(gov))
+    second = get_row_filter_specs(_entry({**gov}))
+    changed = get_row_filter_specs(_entry({"userFilterColumn": "owner"}))
+
+    assert first[0] is second[0]
+    assert changed[0]["args"] == {"column": "owner"}
+    with pytest.raises(TypeError):
+        first[0]["handler"] = "other"
+
+
+def test_identical_specs_are_shared_across_datasets():
+    rule = {"handler": "http_in_list", "args": {"column": "c", "url": "u"}}
+    first = _entry({"rowFilters": [rule]})
+    second = SimpleNamespace(
+        dataset_id="other", lineage={"facets": {"governance": {"rowFilters": [dict(rule)]}}}
+    )
+
+    assert get_row_filter_specs(first)[0] is get_row_filter_specs(second)[0]
@@ -0,0 +1,33 @@
+from sqlglot import exp
+
+from celine.dataset.api.dataset_query.row_filters.utils import (
+    column_node,
+    is_admin_user,
+    literal_nodes,
+)
+from celine.dataset.security.models import AuthenticatedUser
+
+
+def test_literal_nodes_keep_json_scalar_types():
+    predicate = exp.In(
+        this=column_node("sensor_id"),
+        expressions=literal_nodes(["a", 1, 2.5, True, {"x": 1}]),
+    )
+    assert predicate.sql() == "sensor_id IN ('a', 1, 2.5, TRUE, '{''x'': 1}')"
+
+
+def test_column_node_returns_independent_copies():
+    first = column_node("sensor_id")
+    second = column_node("sensor_id")
+    first.set("table", exp.Identifier(this="m", quoted=False))
+    assert second.sql() == "sensor_id"
+
+
+def test_is_admin_user_checks_realm_and_org_groups():
+    def user(claims):
+        return AuthenticatedUser(sub="u1", claims=claims)
+
+    assert is_admin_user(user({"groups": ["/viewers", "/admins"]}))
+    assert is_admin_user(user({"organization": {"org": {"groups": ["admins"]}}}))
+    assert not is_admin_user(user({"groups": ["viewers"]}))
+    assert not is_admin_user(None)
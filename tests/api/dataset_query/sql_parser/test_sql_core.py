@@ -22,3 +22,12 @@ def test_cte_same_table():
     parsed = parse_sql_query(sql)
     assert "WITH latest_run AS" in parsed.sql
     assert parsed.tables == {"dwd_icon_d2_solar_energy"}
+
+def test_repeated_query_reuses_validated_parse():
+    sql = "SELECT * FROM solar WHERE lat > 45"
+    first = parse_sql_query(sql)
+    assert parse_sql_query(sql) is first
+
+    mapped = first.to_ast({"solar": "ds_solar"})
+    assert mapped.sql() == "SELECT * FROM ds_solar WHERE lat > 45"
+    assert first.sql == "SELECT * FROM solar WHERE lat > 45"
@@ -34,3 +34,55 @@ def test_invalid_backend_type():
                 )
             ]
         )
+
+
+def test_entries_rows_cover_every_import_column():
+    from celine.dataset.routes.catalogue_admin import _IMPORT_COLUMNS, _entries_rows
+    from celine.dataset.db.models.dataset_entry import DatasetEntry
+
+    ds = DatasetEntryModel(
+        dataset_id="ds",
+        title="Dataset",
+        backend_type="postgres",
+        backend_config=BackendConfig(table="x"),
+    )
+    (values,) = _entries_rows([ds])
+
+    assert set(values) == set(_IMPORT_COLUMNS)
+    assert set(_IMPORT_COLUMNS) <= set(DatasetEntry.__table__.columns.keys())
+    assert values["dataset_id"] == "ds"
+    assert values["backend_config"]["table"] == "x"
+    assert values["lineage"] is None
+
+
+class _FailingSession:
+    async def execute(self, *args, **kwargs):
+        raise RuntimeError("permission denied for pg_class")
+
+
+class _CatalogueSession:
+    def __init__(self, rows):
+        self.rows = rows
+        self.executed = []
+
+    async def stream(self, stmt):
+        async def _rows():
+            for row in self.rows:
+                yield row
+
+        return _rows()
+
+    async def execute(self, stmt, *args, **kwargs):
+        self.executed.append(stmt)
+
+
+@pytest.mark.asyncio
+async def test_failed_table_lookup_aborts_cleanup():
+    from celine.dataset.routes.catalogue_admin import _cleanup_entries
+
+    catalogue = _CatalogueSession([(1, "ds", {"table": "s.t"})])
+
+    with pytest.raises(RuntimeError):
+        await _cleanup_entries(catalogue, datasets_db=_FailingSession())
+
+    assert catalogue.executed == []
@@ -24,3 +24,48 @@ def test_catalogue_listing_basic():
     assert len(catalogue["dcat:dataset"]) == 2
     ids = {d["dct:identifier"] for d in catalogue["dcat:dataset"]}
     assert ids == {"test.ds", "test2.ds"}
+
+
+async def test_stream_catalog_matches_build_catalog():
+    import json
+
+    from celine.dataset.api.catalogue.dcat_formatter import stream_catalog
+
+    entries = [
+        DatasetEntry(
+            dataset_id=f"test.ds{i}",
+            title=f"Dataset {i}",
+            tags={},
+            lineage={"namespace": "test"},
+            access_level="secret" if i == 1 else "open",
+        )
+        for i in range(4)
+    ]
+
+    async def _aiter():
+        for e in entries:
+            yield e
+
+    chunks = [c async for c in stream_catalog(_aiter(), chunk_size=1)]
+    streamed = json.loads(b"".join(chunks))
+
+    assert streamed == build_catalog(entries)
+    assert len(streamed["dcat:dataset"]) == 3
+
+
+def test_built_documents_do_not_share_nested_nodes():
+    import copy
+
+    entry = DatasetEntry(
+        dataset_id="test.ds", title="T", tags={}, lineage={}, access_level="restricted"
+    )
+    first = build_catalog([entry])
+    expected = copy.deepcopy(build_catalog([entry]))
+
+    dist = first["dcat:dataset"][0]["dcat:distribution"][0]
+    permission = dist["odrl:hasPolicy"]["odrl:permission"][0]
+    permission["odrl:action"]["@id"] = "odrl:modify"
+    permission["odrl:constraint"][0]["odrl:rightOperand"] = "mutated"
+    dist["dct:accessRights"]["@id"] = "mutated"
+
+    assert build_catalog([entry]) == expected
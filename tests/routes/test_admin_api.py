@@ -18,4 +18,59 @@ async def test_admin_catalogue_import(client):
     resp = await client.post("/admin/catalogue", json=payload)
     assert resp.status_code == 200
     data = resp.json()
-    assert data["created"] == 1
\ No newline at end of file
+    assert data["created"] == 1
+
+@pytest.mark.asyncio
+async def test_admin_catalogue_bulk_import(client):
+    from celine.dataset.routes.catalogue_admin import _BULK_IMPORT_THRESHOLD
+
+    datasets = [
+        {
+            "dataset_id": f"bulk.ds{i}",
+            "title": f"Bulk {i}",
+            "backend_type": "fs",
+            "tags": {"keywords": ["bulk"]},
+        }
+        for i in range(_BULK_IMPORT_THRESHOLD + 1)
+    ]
+
+    resp = await client.post("/admin/catalogue", json={"datasets": datasets})
+    assert resp.status_code == 200
+    assert resp.json() == {"created": len(datasets), "updated": 0}
+
+    datasets[0]["title"] = "Renamed"
+    resp = await client.post("/admin/catalogue", json={"datasets": datasets})
+    assert resp.status_code == 200
+    assert resp.json() == {"created": 0, "updated": len(datasets)}
+
+
+@pytest.mark.asyncio
+async def test_admin_catalogue_bulk_import_counts_repeats_as_updates(client):
+    from celine.dataset.routes.catalogue_admin import _BULK_IMPORT_THRESHOLD
+
+    datasets = [
+        {"dataset_id": f"rep.ds{i}", "title": f"Rep {i}", "backend_type": "fs"}
+        for i in range(_BULK_IMPORT_THRESHOLD + 1)
+    ]
+    datasets.append({"dataset_id": "rep.ds0", "title": "Rep 0 b", "backend_type": "fs"})
+
+    resp = await client.post("/admin/catalogue", json={"datasets": datasets})
+    assert resp.status_code == 200
+    assert resp.json() == {"created": len(datasets) - 1, "updated": 1}
+
+
+@pytest.mark.asyncio
+async def test_admin_catalogue_import_updates_existing(client):
+    datasets = [
+        {"dataset_id": "upd.ds1", "title": "One", "backend_type": "fs"},
+        {"dataset_id": "upd.ds2", "title": "Two", "backend_type": "fs"},
+    ]
+
+    resp = await client.post("/admin/catalogue", json={"datasets": datasets[:1]})
+    assert resp.json() == {"created": 1, "updated": 0}
+
+    # One existing, one new, and a repeated id updating the new entry
+    datasets.append({"dataset_id": "upd.ds2", "title": "Two b", "backend_type": "fs"})
+    resp = await client.post("/admin/catalogue", json={"datasets": datasets})
+    assert resp.status_code == 200
+    assert resp.json() == {"created": 1, "updated": 2}
@@ -0,0 +1,52 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import Column, Integer, MetaData, Table
+
+from celine.dataset.routes import catalogue_dataset_schema as schema_route
+
+
+@pytest.fixture
+def reflect(monkeypatch):
+    calls: list[str] = []
+
+    async def fake_reflect(db, table_name: str) -> Table:
+        calls.append(table_name)
+        await asyncio.sleep(0.01)
+        if table_name == "s.missing":
+            raise RuntimeError("no such table")
+        return Table("t", MetaData(), Column("id", Integer))
+
+    monkeypatch.setattr(schema_route, "reflect_table_async", fake_reflect)
+    monkeypatch.setattr(schema_route, "_schema_cache", schema_route.TTLCache(16))
+    return calls
+
+
+async def test_concurrent_schema_requests_reflect_once(reflect):
+    results = await asyncio.gather(
+        *(schema_route._table_schema(None, "s.t") for _ in range(5))
+    )
+
+    assert reflect == ["s.t"]
+    assert all(r is results[0] for r in results)
+    assert results[0]["properties"]["id"]["type"] == "integer"
+
+    # Served from the TTL cache afterwards
+    await schema_route._table_schema(None, "s.t")
+    assert reflect == ["s.t"]
+
+
+async def test_reflection_failure_is_shared_and_not_cached(reflect):
+    results = await asyncio.gather(
+        *(schema_route._table_schema(None, "s.missing") for _ in range(3)),
+        return_exceptions=True,
+    )
+
+    assert reflect == ["s.missing"]
+    assert all(isinstance(r, HTTPException) and r.status_code == 500 for r in results)
+    assert not schema_route._schema_inflight
+
+    with pytest.raises(HTTPException):
+        await schema_route._table_schema(None, "s.missing")
+    assert reflect == ["s.missing", "s.missing"]
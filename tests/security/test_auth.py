@@ -0,0 +1,157 @@
+import asyncio
+import time
+
+import httpx
+import jwt as pyjwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import HTTPException
+from jwt import PyJWKSet
+from jwt.algorithms import RSAAlgorithm
+
+from celine.dataset.core.config import get_settings
+from celine.dataset.security import auth
+from celine.sdk.settings.models import OidcSettings
+
+
+@pytest.fixture(autouse=True)
+def reset_jwks_state():
+    auth._jwks_state = auth._JwksState()
+    auth._user_cache.clear()
+    yield
+    auth._jwks_state = auth._JwksState()
+    auth._user_cache.clear()
+
+
+def _jwks(kid: str = "k1", key=None) -> dict:
+    key = key or rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = RSAAlgorithm.to_jwk(key.public_key(), as_dict=True)
+    jwk.update({"kid": kid, "use": "sig", "alg": "RS256"})
+    return {"keys": [jwk]}
+
+
+@pytest.mark.asyncio
+async def test_refresh_jwks_uses_conditional_requests():
+    jwks = _jwks()
+    seen_headers = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(dict(request.headers))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"cache-control": "max-age=600"})
+        return httpx.Response(
+            200, json=jwks, headers={"etag": '"v1"', "cache-control": "max-age=600"}
+        )
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        assert await auth.refresh_jwks(client) == 600
+        assert await auth.refresh_jwks(client) == 600
+
+    assert "if-none-match" not in seen_headers[0]
+    assert seen_headers[1]["if-none-match"] == '"v1"'
+    assert list(auth._jwks_state.signing_keys) == ["k1"]
+
+
+def test_parse_max_age():
+    assert auth._parse_max_age("public, max-age=120") == 120
+    assert auth._parse_max_age("no-cache") is None
+    assert auth._parse_max_age(None) is None
+
+
+def _token(**claims) -> str:
+    return pyjwt.encode(claims, "secret-for-tests-only-0123456789abcdef", algorithm="HS256")
+
+
+def test_precheck_claims_rejects_wrong_issuer_audience_and_expiry():
+    oidc = OidcSettings(base_url="https://idp.example/realms/r", audience="svc")
+    valid = {"iss": oidc.base_url, "aud": ["svc", "other"], "exp": time.time() + 60}
+
+    auth._precheck_claims(_token(**valid), oidc)
+
+    for override in (
+        {"iss": "https://evil.example"},
+        {"aud": "other"},
+        {"exp": time.time() - 3600},
+    ):
+        with pytest.raises(ValueError):
+            auth._precheck_claims(_token(**{**valid, **override}), oidc)
+
+    with pytest.raises(ValueError):
+        auth._precheck_claims("not-a-jwt", oidc)
+
+
+@pytest.mark.asyncio
+async def test_mistargeted_token_rejected_before_key_lookup(monkeypatch):
+    def _no_verify(*args, **kwargs):
+        raise AssertionError("signature verification should not run")
+
+    monkeypatch.setattr(auth, "_signing_key", _no_verify)
+    oidc = get_settings().oidc
+    token = _token(iss="https://evil.example", aud=oidc.audience, sub="u")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await auth._decode_and_validate_token(token)
+
+    assert exc_info.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_validated_tokens_are_reused_until_expiry(monkeypatch):
+    verified: list[str] = []
+
+    async def _verify(token: str) -> auth.JwtUser:
+        verified.append(token)
+        claims = pyjwt.decode(token, options={"verify_signature": False})
+        return auth.JwtUser(sub=claims["sub"], claims=claims, token=token)
+
+    monkeypatch.setattr(auth, "_decode_and_validate_token", _verify)
+    token = _token(sub="u1", exp=int(time.time()) + 60)
+    other = _token(sub="u2", exp=int(time.time()) + 60)
+    no_exp = _token(sub="u3")
+
+    first = await auth._authenticate(token)
+    assert await auth._authenticate(token) is first
+    assert (await auth._authenticate(other)).sub == "u2"
+    await auth._authenticate(no_exp)
+    await auth._authenticate(no_exp)
+
+    assert verified == [token, other, no_exp, no_exp]
+
+
+@pytest.mark.asyncio
+async def test_unknown_kid_triggers_one_debounced_refresh(monkeypatch):
+    oidc = get_settings().oidc
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    fetches = []
+
+    async def _refresh(client):
+        fetches.append(1)
+        await asyncio.sleep(0.01)
+        auth._jwks_state.signing_keys = {
+            k.key_id: k for k in PyJWKSet.from_dict(_jwks("k2", key)).keys
+        }
+        return 600
+
+    monkeypatch.setattr(auth, "refresh_jwks", _refresh)
+    auth._jwks_state.signing_keys = {
+        k.key_id: k for k in PyJWKSet.from_dict(_jwks("k1")).keys
+    }
+
+    claims = {"iss": oidc.base_url, "sub": "u1", "exp": int(time.time()) + 60}
+    if oidc.audience is not None:
+        claims["aud"] = oidc.audience
+    token = pyjwt.encode(claims, key, algorithm="RS256", headers={"kid": "k2"})
+
+    users = await asyncio.gather(
+        *(auth._decode_and_validate_token(token) for _ in range(5))
+    )
+    assert [u.sub for u in users] == ["u1"] * 5
+    assert len(fetches) == 1
+
+    forged = pyjwt.encode(claims, key, algorithm="RS256", headers={"kid": "nope"})
+    for _ in range(3):
+        with pytest.raises(HTTPException) as exc_info:
+            await auth._decode_and_validate_token(forged)
+        assert exc_info.value.status_code == 401
+    # The refresh for k2 just ran: unknown kids inside the window do not refetch
+    assert len(fetches) == 1
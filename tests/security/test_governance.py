@@ -18,8 +18,10 @@ def enable_opa_for_governance_tests():
 @pytest.fixture(autouse=True)
 def reset_policy_engine():
     gov._policy_engine = None
+    gov._decision_cache.clear()
     yield
     gov._policy_engine = None
+    gov._decision_cache.clear()
 
 
 class DummyPolicyEngine:
@@ -60,6 +62,19 @@ def test_disclosure_matrix_is_exhaustive():
         assert level in ACCESS_LEVEL_MATRIX
 
 
+@pytest.mark.asyncio
+async def test_invalid_access_level_is_server_error(user):
+    from tests.security.conftest import make_entry
+
+    entry = make_entry(disclosure=AccessLevel.OPEN)
+    entry.access_level = "secret"
+
+    with pytest.raises(HTTPException) as exc:
+        await gov.enforce_dataset_access(entry=entry, user=user)
+
+    assert exc.value.status_code == 500
+
+
 # ----------------------------------------------------------------------
 # OPEN
 # ----------------------------------------------------------------------
@@ -182,3 +197,170 @@ async def test_restricted_denies_anonymous(anon_user):
         await gov.enforce_dataset_access(entry=entry, user=anon_user)
 
     assert exc.value.status_code == 401
+
+
+# ----------------------------------------------------------------------
+# Decision cache
+# ----------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_decision_cached_for_repeated_checks(monkeypatch, user):
+    from tests.security.conftest import make_entry
+
+    entry = make_entry(disclosure=AccessLevel.INTERNAL)
+    calls = []
+
+    class CountingEngine(DummyPolicyEngine):
+        def evaluate_decision(self, policy_package, policy_input, **kw):
+            calls.append(policy_input)
+            return super().evaluate_decision(policy_package, policy_input, **kw)
+
+    engine = CountingEngine(allowed=True)
+    monkeypatch.setattr(gov, "_get_policy_engine", lambda: engine)
+
+    await gov.enforce_dataset_access(entry=entry, user=user)
+    await gov.enforce_dataset_access(entry=entry, user=user)
+
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_decision_cache_hit_skips_policy_input(monkeypatch, user):
+    from tests.security.conftest import make_entry
+
+    entry = make_entry(disclosure=AccessLevel.INTERNAL)
+    built = []
+    build_subject = gov._build_subject_from_user
+
+    def counting_build(u):
+        built.append(u)
+        return build_subject(u)
+
+    monkeypatch.setattr(gov, "_build_subject_from_user", counting_build)
+    monkeypatch.setattr(
+        gov, "_get_policy_engine", lambda: DummyPolicyEngine(allowed=True)
+    )
+
+    await gov.enforce_dataset_access(entry=entry, user=user)
+    await gov.enforce_dataset_access(entry=entry, user=user)
+
+    assert len(built) == 1
+
+
+@pytest.mark.asyncio
+async def test_subject_built_once_per_user(monkeypatch, user):
+    from tests.security.conftest import make_entry
+
+    subjects = []
+
+    class RecordingEngine(DummyPolicyEngine):
+        def evaluate_decision(self, policy_package, policy_input, **kw):
+            subjects.append(policy_input.subject)
+            return super().evaluate_decision(policy_package, policy_input, **kw)
+
+    monkeypatch.setattr(
+        gov, "_get_policy_engine", lambda: RecordingEngine(allowed=True)
+    )
+
+    for name in ("a", "b"):
+        entry = make_entry(disclosure=AccessLevel.INTERNAL)
+        entry.dataset_id = name
+        await gov.enforce_dataset_access(entry=entry, user=user)
+
+    assert len(subjects) == 2
+    assert subjects[0] is subjects[1]
+    assert subjects[0].id == "user-123"
+    assert subjects[0].scopes == ["openid"]
+
+
+@pytest.mark.asyncio
+async def test_decision_cache_disabled_with_zero_ttl(monkeypatch, user):
+    from tests.security.conftest import make_entry
+
+    entry = make_entry(disclosure=AccessLevel.INTERNAL)
+    calls = []
+
+    class CountingEngine(DummyPolicyEngine):
+        def evaluate_decision(self, policy_package, policy_input, **kw):
+            calls.append(policy_input)
+            return super().evaluate_decision(policy_package, policy_input, **kw)
+
+    engine = CountingEngine(allowed=False)
+    monkeypatch.setattr(gov, "_get_policy_engine", lambda: engine)
+    monkeypatch.setattr(get_settings(), "opa_cache_ttl", 0)
+
+    for _ in range(2):
+        with pytest.raises(HTTPException):
+            await gov.enforce_dataset_access(entry=entry, user=user)
+
+    assert len(calls) == 2
+
+
+# ----------------------------------------------------------------------
+# Batch enforcement
+# ----------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_enforce_many_checks_each_dataset_once(monkeypatch, user):
+    from tests.security.conftest import make_entry
+
+    entries = []
+    for name in ("a", "b", "a"):
+        entry = make_entry(disclosure=AccessLevel.INTERNAL)
+        entry.dataset_id = name
+        entries.append(entry)
+    calls = []
+
+    class CountingEngine(DummyPolicyEngine):
+        def evaluate_decision(self, policy_package, policy_input, **kw):
+            calls.append(policy_input.resource.id)
+            return super().evaluate_decision(policy_package, policy_input, **kw)
+
+    engine = CountingEngine(allowed=True)
+    monkeypatch.setattr(gov, "_get_policy_engine", lambda: engine)
+
+    await gov.enforce_many(entries, user)
+
+    assert sorted(calls) == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_enforce_many_propagates_denial(monkeypatch, user):
+    from tests.security.conftest import make_entry
+
+    open_entry = make_entry(disclosure=AccessLevel.OPEN)
+    open_entry.dataset_id = "open"
+    internal = make_entry(disclosure=AccessLevel.INTERNAL)
+
+    monkeypatch.setattr(
+        gov,
+        "_get_policy_engine",
+        lambda: DummyPolicyEngine(allowed=False),
+    )
+
+    with pytest.raises(HTTPException) as exc:
+        await gov.enforce_many([open_entry, internal], user)
+
+    assert exc.value.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_enforce_many_skips_open_datasets(monkeypatch, anon_user):
+    from tests.security.conftest import make_entry
+
+    checked = []
+
+    async def recording_enforce(*, entry, user):
+        checked.append(entry.dataset_id)
+
+    monkeypatch.setattr(gov, "enforce_dataset_access", recording_enforce)
+
+    open_entry = make_entry(disclosure=AccessLevel.OPEN)
+    open_entry.dataset_id = "open"
+    internal = make_entry(disclosure=AccessLevel.INTERNAL)
+
+    await gov.enforce_many([open_entry, internal], anon_user)
+
+    assert checked == ["test_dataset"]
@@ -348,6 +348,46 @@ class TestRowFilterRegistry:
         with pytest.raises(ValueError, match="Duplicate"):
             reg.register(Handler())
 
+    def test_configured_modules_load_on_first_lookup(self, tmp_path, monkeypatch):
+        import sys
+
+        import celine.dataset.api.dataset_query.row_filters.registry as reg_mod
+
+        (tmp_path / "lazy_rf_plugin.py").write_text(
+            textwrap.dedent(
+                """
+                from celine.dataset.api.dataset_query.row_filters.registry import (
+                    get_row_filter_registry,
+                )
+
+                class LazyHandler:
+                    name = "lazy"
+
+                    async def resolve(self, **kw):
+                        pass
+
+                get_row_filter_registry().register(LazyHandler())
+                """
+            )
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(sys.modules, "lazy_rf_plugin", raising=False)
+        configure(Settings(row_filters_modules=["lazy_rf_plugin"]))
+        reg_mod._registry = None
+
+        try:
+            reg = reg_mod.get_row_filter_registry()
+            assert "lazy_rf_plugin" not in sys.modules
+            assert reg.get("direct_user_match") is not None
+            assert "lazy_rf_plugin" not in sys.modules
+
+            assert reg.get("lazy") is not None
+            assert "lazy_rf_plugin" in sys.modules
+            assert reg.get("missing") is None
+        finally:
+            reg_mod._registry = None
+            sys.modules.pop("lazy_rf_plugin", None)
+
 
 # ===================================================================
 # A5 — Lazy DB engine URL resolution